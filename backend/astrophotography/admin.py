@@ -569,7 +569,7 @@ class MainPageLocationForm(TranslatableModelForm):
                 # Fallback for country-wide tours: find the ISO code and show all images
                 # from that country.
 
-                maps: CountryMaps = AstroImage.objects.get_country_maps()
+                maps: CountryMaps = AstroImage.objects.all().get_country_maps()
                 iso_code = maps["code_map"].get(self.instance.country_slug) or maps[
                     "country_map"
                 ].get(self.instance.country_slug)
@@ -9,6 +9,11 @@ CELESTIAL_OBJECT_CHOICES = [
     ("Northern Lights", _("Northern Lights")),
 ]
 
+# Postgres text search configuration per site language; languages without a
+# stemming dictionary (Polish ships none) match on unstemmed words
+SEARCH_CONFIGS = {"en": "english"}
+DEFAULT_SEARCH_CONFIG = "simple"
+
 
 class MeteorDefaults:
     """
@@ -0,0 +1,134 @@
+"""
+Explicit serialization for the public gallery and travel feeds.
+
+The list, ``latest`` and travel endpoints render dozens of images per request,
+and building each item through nested DRF serializers (field binding, the tag
+and place serializers, ``translate_fields`` running twice) costs more than the
+data itself. ``GalleryFeedBuilder`` produces the same dicts directly from the
+prefetched rows. The ``many=True`` path of ``AstroImageSerializerList`` and
+``AstroImageThumbnailSerializer`` uses it, while single objects still go
+through the declarative serializers, which remain the reference output
+(``astrophotography/tests/test_feed_serializers.py`` compares both).
+"""
+
+from typing import Any
+
+from rest_framework import serializers
+
+from django.conf import settings
+from django.db.models.manager import BaseManager
+
+from translation.services import TranslationService
+
+from .models import AstroImage, Place, Tag
+from .utils import get_country_name
+
+EMPTY_PARAGRAPH = "<p>&nbsp;</p>"
+
+# Reused for their formatting rules only (DATETIME_FORMAT, timezone handling).
+_date_field = serializers.DateField()
+_datetime_field = serializers.DateTimeField()
+
+
+class GalleryFeedBuilder:
+    """Builds feed items as plain dicts, mirroring the DRF serializers' output."""
+
+    def __init__(self, context: dict[str, Any]) -> None:
+        request = context.get("request")
+        self.lang: str | None = request.query_params.get("lang") if request else None
+
+    def _translated(self, instance: Any, field_name: str) -> tuple[bool, Any]:
+        """
+        Return ``(present, value)`` for a translated field, like ``translate_fields``.
+
+        The declarative serializers read the field through parler first and skip
+        it when no translation can be resolved, so ``present`` is False then.
+        """
+        try:
+            value = getattr(instance, field_name)
+        except AttributeError:
+            return False, None
+
+        if self.lang:
+            value = TranslationService.get_translation(instance, field_name, self.lang)
+            if isinstance(value, str) and value.strip() == EMPTY_PARAGRAPH:
+                return True, ""
+            return True, value
+
+        if isinstance(value, str) and (
+            value.startswith(TranslationService.TRANSLATION_FAILED_PREFIX)
+            or value.strip() == EMPTY_PARAGRAPH
+        ):
+            return True, ""
+        return True, value
+
+    def tag(self, tag: Tag) -> dict[str, Any]:
+        lang = str(self.lang or "")
+        return {
+            "name": TranslationService.get_translation(tag, "name", lang),
+            "slug": TranslationService.get_translation(tag, "slug", lang),
+        }
+
+    def place(self, place: Place | None) -> dict[str, Any] | None:
+        if place is None:
+            return None
+
+        data: dict[str, Any] = {"id": place.pk}
+        present, name = self._translated(place, "name")
+        if present:
+            data["name"] = name
+
+        if self.lang and self.lang != settings.DEFAULT_APP_LANGUAGE:
+            data["country"] = get_country_name(place.country, self.lang)
+        else:
+            data["country"] = get_country_name(place.country)
+        return data
+
+    def image(self, image: AstroImage) -> dict[str, Any]:
+        """Item of the gallery, ``latest`` and travel highlight detail feeds."""
+        data: dict[str, Any] = {"pk": str(image.pk), "slug": image.slug}
+        present, name = self._translated(image, "name")
+        if present:
+            data["name"] = name
+        data["tags"] = [self.tag(tag) for tag in image.tags.all()]
+        data["place"] = self.place(image.place)
+        data["capture_date"] = _date_field.to_representation(image.capture_date)
+        data["process"] = bool(image.zoom)
+        data["celestial_object"] = image.celestial_object
+        data["created_at"] = _datetime_field.to_representation(image.created_at)
+        data["thumbnail_url"] = image.get_available_variant_url("thumbnail", preferred_width=560)
+        present, description = self._translated(image, "description")
+        if present:
+            data["description"] = description
+        return data
+
+    def thumbnail(self, image: AstroImage) -> dict[str, Any]:
+        """Item of the ``images`` list nested in travel highlights."""
+        data: dict[str, Any] = {
+            "pk": str(image.pk),
+            "slug": image.slug,
+            "thumbnail_url": image.get_available_variant_url("thumbnail", preferred_width=560),
+        }
+        present, description = self._translated(image, "description")
+        if present:
+            data["description"] = description
+        return data
+
+
+class GalleryFeedListSerializer(serializers.ListSerializer):
+    """``many=True`` serializer rendering gallery feed items with ``GalleryFeedBuilder``."""
+
+    def _rows(self, data: Any) -> Any:
+        return data.all() if isinstance(data, BaseManager) else data
+
+    def to_representation(self, data: Any) -> list[dict[str, Any]]:
+        builder = GalleryFeedBuilder(self.context)
+        return [builder.image(image) for image in self._rows(data)]
+
+
+class ThumbnailFeedListSerializer(GalleryFeedListSerializer):
+    """``many=True`` serializer for the thumbnails nested in travel highlights."""
+
+    def to_representation(self, data: Any) -> list[dict[str, Any]]:
+        builder = GalleryFeedBuilder(self.context)
+        return [builder.thumbnail(image) for image in self._rows(data)]
@@ -0,0 +1,115 @@
+"""Cached image counts for the gallery's cursor pagination.
+
+Page-number pagination runs ``COUNT(*)`` over the filtered, joined gallery
+queryset on every page. The cursor mode reports its total from here instead:
+
+- the whole gallery and each category (``?filter=`` with an exact
+  ``CELESTIAL_OBJECT_CHOICES`` value) have a counter in the cache, seeded with
+  one ``COUNT`` and then moved with ``INCR``/``DECR`` by the AstroImage signals
+  after each committed create, delete or category change;
+- other filters (tag, travel, country, place) cannot be maintained per write,
+  so their count is computed once per ASTRO cache generation;
+- an unknown category matches no image the signals count, so it is counted
+  directly.
+
+Counters expire after ``GALLERY_COUNT_TIMEOUT`` seconds, which bounds the drift
+from writes that bypass signals (``QuerySet.update``, raw SQL).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Mapping
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+
+from common.cache_versioning import get_generation
+from common.types import CacheNamespace
+
+from .constants import CELESTIAL_OBJECT_CHOICES
+
+logger = logging.getLogger("core.cache")
+
+COUNT_KEY_PREFIX = "gallery_count"
+# Gallery filters without a write-maintained counter
+UNCOUNTED_FILTERS = ("tag", "travel", "country", "place")
+COUNTED_CATEGORIES = frozenset(choice for choice, _ in CELESTIAL_OBJECT_CHOICES)
+
+
+def get_counter_key(category: str | None = None) -> str:
+    """Return the key of the total counter, or of one category's counter."""
+    if category:
+        # The gallery filters on the exact value, so the key must not fold variants together
+        return f"{COUNT_KEY_PREFIX}:category:{quote(category, safe='')}"
+    return f"{COUNT_KEY_PREFIX}:all"
+
+
+def _get_filtered_key(params: Mapping[str, object]) -> str:
+    filters = sorted(
+        (name, str(params.get(name))) for name in ("filter", *UNCOUNTED_FILTERS) if params.get(name)
+    )
+    digest = hashlib.md5(repr(filters).encode("utf-8")).hexdigest()
+    return f"{COUNT_KEY_PREFIX}:{get_generation(CacheNamespace.ASTRO)}:{digest}"
+
+
+def get_gallery_count(queryset: QuerySet, params: Mapping[str, object]) -> int:
+    """Return the number of images in a ``for_gallery`` queryset, from the cache when possible."""
+    category = params.get("filter")
+    if category and category not in COUNTED_CATEGORIES:
+        return queryset.count()
+
+    if any(params.get(name) for name in UNCOUNTED_FILTERS):
+        key = _get_filtered_key(params)
+    else:
+        key = get_counter_key(category if isinstance(category, str) else None)
+
+    try:
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            # add() keeps a counter that a concurrent write has just moved
+            cache.add(key, count, settings.GALLERY_COUNT_TIMEOUT)
+        return int(count)
+    except Exception as exc:
+        logger.warning(f"Gallery count cache failed for {key}: {exc}")
+        return queryset.count()
+
+
+def _apply_deltas(deltas: Mapping[str, int]) -> None:
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            # Not seeded yet (or expired): the next read counts from the database
+            pass
+        except Exception as exc:
+            logger.warning(f"Gallery count update failed for {key}, dropping it: {exc}")
+            cache.delete(key)
+
+
+def record_gallery_change(old_category: str | None, new_category: str | None) -> None:
+    """
+    Move the gallery counters after an image is created, deleted or re-categorized.
+
+    ``old_category`` is None for a new image and ``new_category`` is None for a
+    deleted one. The counters change once the surrounding transaction commits.
+    """
+    deltas: dict[str, int] = {}
+    if old_category is None:
+        deltas[get_counter_key()] = 1
+    if new_category is None:
+        deltas[get_counter_key()] = deltas.get(get_counter_key(), 0) - 1
+    if old_category:
+        deltas[get_counter_key(old_category)] = -1
+    if new_category:
+        key = get_counter_key(new_category)
+        deltas[key] = deltas.get(key, 0) + 1
+
+    transaction.on_commit(lambda: _apply_deltas(deltas))
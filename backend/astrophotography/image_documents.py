@@ -0,0 +1,202 @@
+"""Precomputed per-image documents: search vectors and rendered API payloads.
+
+Every public image payload is assembled from the image, its translations, place,
+tags and five equipment relations. ``AstroImageDocument`` stores the rendered
+list and detail payloads per site language, so ``AstroImageViewSet`` reads one
+row per image instead; ``AstroImageSearchDocument`` holds the search vectors.
+
+One admin save fires signals for the image, each translation and every m2m
+change, and a tag or place rename touches every image that embeds it. The
+receivers queue the affected image ids here; after the transaction commits,
+``rebuild_image_documents_task`` rebuilds both documents of those images once.
+
+The receivers still bump ``astro`` on commit, so a failed or lost rebuild
+never leaves the gallery cache behind the database; the task bumps it again
+once the documents it rebuilt are stored.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from rest_framework.request import Request
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.http import HttpRequest, QueryDict
+from django.utils import translation
+
+from common.types import CacheNamespace
+from common.utils.transactions import is_pending_on_commit
+
+from .models import (
+    AstroImage,
+    AstroImageDocument,
+    AstroImageQuerySet,
+    AstroImageSearchDocument,
+)
+from .serializers import AstroImageSerializer, AstroImageSerializerList
+from .tasks import rebuild_image_documents_task
+
+logger = logging.getLogger(__name__)
+
+# Invalidated again by the rebuild task once the documents are stored
+DOCUMENT_NAMESPACES = (CacheNamespace.ASTRO,)
+DOCUMENT_SSR_TAGS = ("latest-astro-images",)
+
+LIST_SHAPE = "list"
+DETAIL_SHAPE = "detail"
+SHAPE_SERIALIZERS: dict[str, type[AstroImageSerializerList] | type[AstroImageSerializer]] = {
+    LIST_SHAPE: AstroImageSerializerList,
+    DETAIL_SHAPE: AstroImageSerializer,
+}
+
+
+def _language_context(language: str) -> dict[str, Any]:
+    """
+    Serializer context of the public request served by the ``language`` document.
+
+    Requests without ``?lang=`` read the default-language document, and the
+    serializers render the raw fields for them, so ``lang`` is left out there.
+    """
+    http_request = HttpRequest()
+    if language != settings.DEFAULT_APP_LANGUAGE:
+        http_request.GET = QueryDict(f"lang={language}")
+    return {"request": Request(http_request)}
+
+
+def rebuild_read_documents(image_ids: Iterable[object] | None = None) -> int:
+    """
+    Re-render the list and detail payloads of the given images, or of all images.
+
+    Every image gets one document per site language, rendered by the same
+    serializers as the live API. The images are locked first, so concurrent
+    rebuilds of one image run one after another. Returns the number of
+    documents written.
+    """
+    images = AstroImage.objects.for_gallery({})
+    if image_ids is not None:
+        image_ids = set(image_ids)
+        if not image_ids:
+            return 0
+        images = images.filter(pk__in=image_ids)
+
+    with transaction.atomic():
+        list(
+            AstroImage.objects.filter(pk__in=images.values("pk"))
+            .select_for_update()
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        stale = AstroImageDocument.objects.all()
+        if image_ids is not None:
+            stale = stale.filter(image_id__in=image_ids)
+        stale.delete()
+
+        rows: list[AstroImage] = list(images)
+        documents: list[AstroImageDocument] = []
+        for language, _name in settings.LANGUAGES:
+            context = _language_context(language)
+            with translation.override(language):
+                list_payloads = AstroImageSerializerList(rows, many=True, context=context).data
+                for image, list_payload in zip(rows, list_payloads, strict=True):
+                    documents.append(
+                        AstroImageDocument(
+                            image=image,
+                            language_code=language,
+                            list_payload=list_payload,
+                            detail_payload=AstroImageSerializer(image, context=context).data,
+                        )
+                    )
+        created = AstroImageDocument.objects.bulk_create(documents)
+    return len(created)
+
+
+def rebuild_image_documents(image_ids: Iterable[object] | None = None) -> int:
+    """Rebuild the search and read documents of the given images, or of all images."""
+    if image_ids is not None:
+        image_ids = set(image_ids)
+    return AstroImageSearchDocument.objects.rebuild(image_ids) + rebuild_read_documents(image_ids)
+
+
+def get_image_payloads(
+    images: Sequence[AstroImage], language: str, shape: str, context: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    Return the ``shape`` payloads of ``images`` in ``language``, in order.
+
+    Payloads come from one ``AstroImageDocument`` query. Images whose document
+    is not built yet (the rebuild task is queued on commit) are rendered live
+    with ``context`` instead; their relations are prefetched onto the given
+    instances, so the images themselves are not fetched again.
+    """
+    field_name = f"{shape}_payload"
+    payloads: dict[str, dict[str, Any]] = {
+        str(image_id): payload
+        for image_id, payload in AstroImageDocument.objects.filter(
+            image_id__in=[image.pk for image in images], language_code=language
+        ).values_list("image_id", field_name)
+    }
+
+    missing = [image for image in images if str(image.pk) not in payloads]
+    if missing:
+        prefetch_related_objects(missing, "place", *AstroImageQuerySet.GALLERY_PREFETCHES)
+        serializer_class = SHAPE_SERIALIZERS[shape]
+        payloads.update(
+            (str(image.pk), serializer_class(image, context=context).data) for image in missing
+        )
+
+    return [payloads[str(image.pk)] for image in images]
+
+
+class ImageDocumentBatch:
+    """Image ids queued by one transaction."""
+
+    def __init__(self) -> None:
+        self.image_ids: set[str] = set()
+
+    def flush(self) -> None:
+        """Sends every queued image to the rebuild task and empties the batch."""
+        image_ids = sorted(self.image_ids)
+        self.image_ids.clear()
+        if image_ids:
+            rebuild_image_documents_task.delay(image_ids)
+
+
+class ImageDocumentCollector:
+    """
+    Gathers image ids touched inside a transaction and queues one document
+    rebuild for them, deduplicated, when the transaction commits.
+
+    Works like ``core.cache_service.InvalidationCollector``: one batch per
+    transaction, joined while its commit hook is pending and dropped with it on
+    rollback.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def add(self, image_ids: Iterable[object]) -> None:
+        """Queues images for a document rebuild after the current commit."""
+        queued = {str(image_id) for image_id in image_ids}
+        if not queued:
+            return
+        batch: ImageDocumentBatch | None = getattr(self._local, "batch", None)
+        joined = batch is not None and is_pending_on_commit(batch.flush)
+        if batch is None or not joined:
+            batch = self._local.batch = ImageDocumentBatch()
+        batch.image_ids.update(queued)
+        if not joined:
+            transaction.on_commit(batch.flush)
+
+
+image_document_collector = ImageDocumentCollector()
+
+
+def refresh_image_documents(image_ids: Iterable[object]) -> None:
+    """Rebuild the documents of ``image_ids`` once the current transaction commits."""
+    image_document_collector.add(image_ids)
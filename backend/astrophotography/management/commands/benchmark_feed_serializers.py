@@ -0,0 +1,66 @@
+"""Compare the per-item cost of the DRF and the explicit gallery feed serializers."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django.core.management.base import BaseCommand
+
+from astrophotography.feed_serializers import GalleryFeedBuilder
+from astrophotography.models import AstroImage
+from astrophotography.serializers import AstroImageSerializerList
+
+
+class Command(BaseCommand):
+    help = (
+        "Serialize existing gallery images through the declarative DRF serializer and the "
+        "explicit feed builder, and report the per-item cost of each. Read-only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=100, help="Images to serialize.")
+        parser.add_argument("--repeat", type=int, default=5, help="Rounds per serializer.")
+        parser.add_argument("--lang", default="", help="Value of the ?lang= parameter.")
+
+    def handle(self, *args, **options):
+        del args
+        query = f"?lang={options['lang']}" if options["lang"] else ""
+        request = Request(APIRequestFactory().get(f"/v1/astroimages/{query}"))
+        context = {"request": request}
+
+        # Evaluate the queryset (and its prefetches) once, so only serialization is timed.
+        images = list(AstroImage.objects.for_gallery(request.query_params)[: options["limit"]])
+        if not images:
+            self.stdout.write(self.style.WARNING("No images to serialize."))
+            return
+
+        def drf_path() -> Any:
+            return [AstroImageSerializerList(image, context=context).data for image in images]
+
+        def feed_path() -> Any:
+            builder = GalleryFeedBuilder(context)
+            return [builder.image(image) for image in images]
+
+        if drf_path() != feed_path():
+            self.stdout.write(self.style.ERROR("Outputs differ; fix the feed builder first."))
+            return
+
+        drf = self._per_item(drf_path, len(images), options["repeat"])
+        feed = self._per_item(feed_path, len(images), options["repeat"])
+        self.stdout.write(f"Images: {len(images)}, rounds: {options['repeat']}")
+        self.stdout.write(f"DRF serializer: {drf * 1e6:.1f} us/item")
+        self.stdout.write(f"Feed builder:   {feed * 1e6:.1f} us/item")
+        self.stdout.write(self.style.SUCCESS(f"Speed-up: {drf / feed:.1f}x"))
+
+    @staticmethod
+    def _per_item(render: Callable[[], Any], items: int, repeat: int) -> float:
+        """Best round's seconds per item, which is the least disturbed by other load."""
+        best = float("inf")
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            render()
+            best = min(best, time.perf_counter() - started)
+        return best / items
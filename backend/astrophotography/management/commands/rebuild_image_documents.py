@@ -0,0 +1,29 @@
+"""Rebuild the search and read-model documents of astrophotography images."""
+
+from django.core.management.base import BaseCommand
+
+from astrophotography.image_documents import rebuild_image_documents
+from core.cache_service import CacheService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite AstroImageSearchDocument and AstroImageDocument rows from images, "
+        "translations, tags, places, equipment and variants. The signals keep them current; "
+        "run this after migrating, bulk imports, raw SQL, QuerySet.update() on images or the "
+        "variant file sweep."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--image",
+            action="append",
+            dest="image_ids",
+            help="Only rebuild this image id (repeatable). Defaults to all images.",
+        )
+
+    def handle(self, *args, **options):
+        del args
+        rows = rebuild_image_documents(options["image_ids"])
+        CacheService.invalidate_astrophotography_cache()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} image document(s)."))
@@ -0,0 +1,28 @@
+"""Rebuild the denormalized (tag, celestial object) image counts."""
+
+from django.core.management.base import BaseCommand
+
+from astrophotography.models import TagImageCount
+from core.cache_service import CacheService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount TagImageCount rows from the image/tag links. The signals keep the table "
+        "current; run this after bulk imports, raw SQL or QuerySet.update() on images."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tag",
+            type=int,
+            action="append",
+            dest="tag_ids",
+            help="Only recount this tag id (repeatable). Defaults to all tags.",
+        )
+
+    def handle(self, *args, **options):
+        del args
+        rows = TagImageCount.objects.rebuild(options["tag_ids"])
+        CacheService.invalidate_astrophotography_cache()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} tag statistics row(s)."))
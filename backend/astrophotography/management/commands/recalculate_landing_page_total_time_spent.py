@@ -1,9 +1,8 @@
 """Recalculate the persisted landing page astrophotography total time spent."""
 
 from django.core.management.base import BaseCommand
-from django.db.models import Sum
 
-from astrophotography.models import AstroImage
+from astrophotography.models import AstroImage, ExposureHoursTotal
 from astrophotography.tasks import calculate_astroimage_exposure_hours_task
 from common.tasks import invalidate_frontend_ssr_cache_task
 from core.cache_service import CacheService
@@ -30,6 +29,8 @@ class Command(BaseCommand):
         queryset = AstroImage.objects.all().order_by("pk")
         if recalculate:
             AstroImage.objects.update(calculated_exposure_hours=0)
+            # update() skips the signals; zero the running totals to match
+            ExposureHoursTotal.objects.rebuild()
         else:
             queryset = queryset.filter(calculated_exposure_hours=0)
 
@@ -37,10 +38,9 @@ class Command(BaseCommand):
             calculate_astroimage_exposure_hours_task(str(image.pk))
             processed_images += 1
 
+        total_hours = sum(ExposureHoursTotal.objects.rebuild().values())
         CacheService.invalidate_landing_page_cache()
         invalidate_frontend_ssr_cache_task.delay(["settings"])
-        aggregate = AstroImage.objects.aggregate(total=Sum("calculated_exposure_hours"))
-        total_hours = float(aggregate["total"] or 0)
         action = "Rebuilt" if recalculate else "Calculated"
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,46 @@
+"""Reconcile the running exposure-hour totals with the per-image values."""
+
+from django.core.management.base import BaseCommand
+
+from astrophotography.models import ExposureHoursTotal
+from common.tasks import invalidate_frontend_ssr_cache_task
+from core.cache_service import CacheService
+
+# Float deltas accumulate rounding noise far below this
+DRIFT_TOLERANCE_HOURS = 1e-6
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute ExposureHoursTotal rows from AstroImage.calculated_exposure_hours and "
+        "report any drift. The signals keep the totals current; run this after bulk "
+        "imports, raw SQL or QuerySet.update() on images."
+    )
+
+    def handle(self, *args, **options):
+        del args, options
+        stored = ExposureHoursTotal.objects.breakdown()
+        rebuilt = ExposureHoursTotal.objects.rebuild()
+
+        drifted = sorted(
+            category
+            for category in stored.keys() | rebuilt.keys()
+            if abs(stored.get(category, 0.0) - rebuilt.get(category, 0.0)) > DRIFT_TOLERANCE_HOURS
+        )
+        for category in drifted:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{category}: stored {stored.get(category, 0.0)}h, "
+                    f"actual {rebuilt.get(category, 0.0)}h"
+                )
+            )
+
+        if drifted:
+            CacheService.invalidate_landing_page_cache()
+            invalidate_frontend_ssr_cache_task.delay(["settings"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled exposure hours: {sum(rebuilt.values())}h total, "
+                f"{len(drifted)} categor{'y' if len(drifted) == 1 else 'ies'} corrected."
+            )
+        )
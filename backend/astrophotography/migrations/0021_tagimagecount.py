@@ -0,0 +1,77 @@
+# Generated by Django 6.0.5 on 2026-10-17 10:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_tag_image_counts(apps, schema_editor):
+    AstroImage = apps.get_model("astrophotography", "AstroImage")
+    TagImageCount = apps.get_model("astrophotography", "TagImageCount")
+    rows = (
+        AstroImage.tags.through.objects.values("tag_id", "astroimage__celestial_object")
+        .annotate(count=Count("astroimage_id"))
+        .order_by()
+    )
+    TagImageCount.objects.bulk_create(
+        TagImageCount(
+            tag_id=row["tag_id"],
+            celestial_object=row["astroimage__celestial_object"],
+            count=row["count"],
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0020_remove_astroimage_original_webp_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagImageCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "celestial_object",
+                    models.CharField(
+                        choices=[
+                            ("Landscape", "Landscape"),
+                            ("Deep Sky", "Deep Sky"),
+                            ("Startrails", "Startrails"),
+                            ("Solar System", "Solar System"),
+                            ("Milky Way", "Milky Way"),
+                            ("Northern Lights", "Northern Lights"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="image_counts",
+                        to="astrophotography.tag",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tag Image Count",
+                "verbose_name_plural": "Tag Image Counts",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("tag", "celestial_object"), name="unique_tag_image_count"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_tag_image_counts, reverse_code=migrations.RunPython.noop),
+    ]
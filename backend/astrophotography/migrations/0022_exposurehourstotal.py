@@ -0,0 +1,62 @@
+# Generated by Django 6.0.5 on 2026-10-17 12:02
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def populate_exposure_hours_totals(apps, schema_editor):
+    AstroImage = apps.get_model("astrophotography", "AstroImage")
+    ExposureHoursTotal = apps.get_model("astrophotography", "ExposureHoursTotal")
+    rows = (
+        AstroImage.objects.values("celestial_object")
+        .annotate(hours=Sum("calculated_exposure_hours"))
+        .order_by()
+    )
+    ExposureHoursTotal.objects.bulk_create(
+        ExposureHoursTotal(celestial_object=row["celestial_object"], hours=row["hours"] or 0)
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0021_tagimagecount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExposureHoursTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "celestial_object",
+                    models.CharField(
+                        choices=[
+                            ("Landscape", "Landscape"),
+                            ("Deep Sky", "Deep Sky"),
+                            ("Startrails", "Startrails"),
+                            ("Solar System", "Solar System"),
+                            ("Milky Way", "Milky Way"),
+                            ("Northern Lights", "Northern Lights"),
+                        ],
+                        max_length=50,
+                        unique=True,
+                    ),
+                ),
+                ("hours", models.FloatField(default=0)),
+            ],
+            options={
+                "verbose_name": "Exposure Hours Total",
+                "verbose_name_plural": "Exposure Hours Totals",
+            },
+        ),
+        migrations.RunPython(
+            populate_exposure_hours_totals, reverse_code=migrations.RunPython.noop
+        ),
+    ]
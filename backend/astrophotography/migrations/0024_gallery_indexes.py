@@ -0,0 +1,28 @@
+# Generated by Django 6.0.5 on 2026-10-17 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0023_place_name_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="place",
+            index=models.Index(fields=["country"], name="place_country_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="astroimage",
+            index=models.Index(fields=["-created_at", "-id"], name="astroimage_gallery_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="astroimage",
+            index=models.Index(
+                fields=["celestial_object", "-created_at", "-id"],
+                name="astroimage_category_gallery_idx",
+            ),
+        ),
+    ]
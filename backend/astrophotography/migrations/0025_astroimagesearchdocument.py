@@ -0,0 +1,57 @@
+# Generated by Django 6.0.5 on 2026-10-17 13:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0024_gallery_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AstroImageSearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        choices=[("en", "English"), ("pl", "Polish")], max_length=15
+                    ),
+                ),
+                ("vector", django.contrib.postgres.search.SearchVectorField()),
+                (
+                    "image",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_documents",
+                        to="astrophotography.astroimage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Astro Image Search Document",
+                "verbose_name_plural": "Astro Image Search Documents",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["vector"], name="astroimage_search_vector_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("image", "language_code"),
+                        name="unique_astroimage_search_document",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.5 on 2026-10-17 14:10
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0025_astroimagesearchdocument"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mainpagelocation",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["country_slug", "place_slug", "adventure_date"],
+                name="mainpagelocation_slug_gist_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.5 on 2026-10-17 16:20
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("astrophotography", "0026_mainpagelocation_slug_gist_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AstroImageDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "language_code",
+                    models.CharField(
+                        choices=[("en", "English"), ("pl", "Polish")], max_length=15
+                    ),
+                ),
+                (
+                    "list_payload",
+                    models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                (
+                    "detail_payload",
+                    models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "image",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="documents",
+                        to="astrophotography.astroimage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Astro Image Document",
+                "verbose_name_plural": "Astro Image Documents",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("image", "language_code"), name="unique_astroimage_document"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,9 +1,11 @@
 import calendar
+import html
 import logging
+import operator
 import uuid
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import date as dt_date
-from functools import lru_cache
+from functools import lru_cache, reduce
 from typing import Any, Self, cast
 
 import sentry_sdk
@@ -18,10 +20,22 @@ from psycopg2.extras import DateRange as PG_DateRange
 from django.conf import settings
 from django.contrib.postgres.constraints import ExclusionConstraint
 from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex, OpClass
+from django.contrib.postgres.search import (
+    CombinedSearchVector,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramSimilarity,
+)
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import Count, Q, QuerySet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Upper
 from django.utils import translation
+from django.utils.html import strip_tags
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
@@ -34,12 +48,47 @@ from translation.services import TranslationService
 from .constants import CELESTIAL_OBJECT_CHOICES, MeteorDefaults
 from .tasks import calculate_astroimage_exposure_hours_task
 from .types import CountryMaps
+from .utils import get_country_name, get_country_names, get_search_config
 
 logger = logging.getLogger(__name__)
 
+# 3-letter month abbreviations used in travel date slugs ('jan', 'feb', etc.)
+DATE_SLUG_MONTHS: dict[str, int] = {
+    abbr.lower(): number for number, abbr in enumerate(calendar.month_abbr) if abbr
+}
+
+
+class PlaceQuerySet(TranslatableQuerySet):
+    def name_contains(self, search_term: str) -> QuerySet:
+        """
+        Places whose name contains ``search_term`` in any language.
+
+        Runs as a subquery on the translations table, which the trigram index
+        on ``UPPER(name)`` serves for ``icontains`` (terms of 3+ characters).
+        """
+        translations = self.model._parler_meta.root_model.objects.filter(
+            name__icontains=search_term
+        )
+        return cast(QuerySet, self.filter(pk__in=translations.values("master_id")))
+
+    def search(self, search_term: str) -> QuerySet:
+        """Places with images whose name contains ``search_term``, most similar first."""
+        translations = self.model._parler_meta.root_model.objects.filter(master=OuterRef("pk"))
+        similarity = translations.annotate(
+            similarity=TrigramSimilarity("name", search_term)
+        ).order_by("-similarity")
+        return cast(
+            QuerySet,
+            self.name_contains(search_term)
+            .filter(Exists(AstroImage.objects.filter(place=OuterRef("pk"))))
+            .annotate(similarity=Subquery(similarity.values("similarity")[:1]))
+            .prefetch_related("translations")
+            .order_by("-similarity", "pk"),
+        )
+
 
 class Place(AutomatedTranslationModelMixin, TranslatableModel):
-    objects: TranslatableManager = TranslatableManager()
+    objects = TranslatableManager.from_queryset(PlaceQuerySet)()
 
     # Translation trigger fields
     translation_service_method = "translate_place"
@@ -51,6 +100,15 @@ class Place(AutomatedTranslationModelMixin, TranslatableModel):
             max_length=100,
             blank=True,
         ),
+        meta={
+            "indexes": [
+                # Serves icontains (UPPER(name) LIKE UPPER('%...%')) in travel filters and search
+                GinIndex(
+                    OpClass(Upper("name"), name="gin_trgm_ops"),
+                    name="place_name_trgm_idx",
+                ),
+            ]
+        },
     )
     country = CountryField(
         verbose_name=_("Country"),
@@ -87,6 +145,7 @@ class Place(AutomatedTranslationModelMixin, TranslatableModel):
         verbose_name = _("Place")
         verbose_name_plural = _("Places")
         ordering = ["pk"]
+        indexes = [models.Index(fields=["country"], name="place_country_idx")]
 
     def clean(self):
         """Custom uniqueness validation for Place names."""
@@ -139,18 +198,17 @@ class TagQuerySet(TranslatableQuerySet):
         """
         queryset: QuerySet = self.latest_tags() if latest else self.all()
 
-        annotation_filter: Q = Q(images__isnull=False)
+        # Counts come from the denormalized TagImageCount table, not from images
+        annotation_filter: Q = Q(image_counts__count__gt=0)
         if category_filter:
-            annotation_filter &= Q(images__celestial_object=category_filter)
+            annotation_filter &= Q(image_counts__celestial_object=category_filter)
 
         return cast(
             QuerySet,
             queryset.prefetch_related("translations")
-            .filter(images__isnull=False)
-            .annotate(num_times=Count("images", filter=annotation_filter, distinct=True))
+            .annotate(num_times=Sum("image_counts__count", filter=annotation_filter))
             .filter(num_times__gt=0)
-            .order_by("-num_times", "id")
-            .distinct(),
+            .order_by("-num_times", "id"),
         )
 
 
@@ -252,6 +310,20 @@ class Tripod(AbstractEquipmentModel):
 class AstroImageQuerySet(TranslatableQuerySet):
     """Custom queryset for AstroImage model."""
 
+    # Relations read by the public image serializers
+    GALLERY_PREFETCHES = (
+        "translations",
+        "place__translations",
+        "tags",
+        "tags__translations",
+        "camera",
+        "lens",
+        "telescope",
+        "tracker",
+        "tripod",
+        "variants",
+    )
+
     def latest(self) -> QuerySet:
         """Returns the 9 most recent images."""
         return cast(QuerySet, self.order_by("-created_at", "-capture_date")[:9])
@@ -259,9 +331,20 @@ class AstroImageQuerySet(TranslatableQuerySet):
     @staticmethod
     @lru_cache(maxsize=1)
     def get_country_maps() -> CountryMaps:
-        """Return cached country/code maps used by travel filters."""
+        """
+        Return cached country/code maps used by travel filters.
+
+        Names come from the shared per-language table, so a country matches in
+        every site language; default-language names are listed first and win.
+        """
+        names = get_country_names()
+        default_language = settings.DEFAULT_APP_LANGUAGE
+        country_map: dict[str, str] = {}
+        for language in sorted(names, key=lambda language: language != default_language):
+            for code, name in names[language].items():
+                country_map.setdefault(name.lower(), code)
         return {
-            "country_map": {name.lower(): code for code, name in dict(countries).items()},
+            "country_map": country_map,
             "code_map": {code.lower(): code for code in dict(countries).keys()},
         }
 
@@ -277,34 +360,26 @@ class AstroImageQuerySet(TranslatableQuerySet):
         """
         Apply gallery filters with the same optimization profile used by public views.
         """
-        queryset: QuerySet = (
-            self.select_related("place")
-            .prefetch_related(
-                "translations",
-                "place__translations",
-                "tags",
-                "tags__translations",
-                "camera",
-                "lens",
-                "telescope",
-                "tracker",
-                "tripod",
-            )
-            .all()
-            .order_by("-created_at")
+        return (
+            self.filter_gallery(params)
+            .select_related("place")
+            .prefetch_related(*self.GALLERY_PREFETCHES)
         )
 
+    def filter_gallery(self, params: Mapping[str, object]) -> QuerySet:
+        """
+        Apply gallery filters and order without loading relations, for callers
+        that read precomputed image documents.
+        """
+        queryset: QuerySet = self.all().order_by("-created_at", "-pk")
+
         category: str | None = self._get_string_param(params, "filter")
         if category:
             queryset = queryset.filter(celestial_object=category)
 
         tag_slug: str | None = self._get_string_param(params, "tag")
         if tag_slug:
-            tag_ids = Tag.objects.filter(translations__slug=tag_slug).values_list("id", flat=True)
-            if tag_ids:
-                queryset = queryset.filter(tags__in=tag_ids)
-            else:
-                queryset = queryset.none()
+            queryset = queryset.filter(self._tagged_with(tag_slug))
 
         travel: str | None = self._get_string_param(params, "travel")
         if travel:
@@ -316,7 +391,12 @@ class AstroImageQuerySet(TranslatableQuerySet):
             queryset = queryset.filter(place__country=country)
             if place:
                 queryset = queryset.filter(
-                    Q(place__translations__name__iexact=place) | Q(place__isnull=True)
+                    Exists(
+                        Place._parler_meta.root_model.objects.filter(
+                            master=OuterRef("place_id"), name__iexact=place
+                        )
+                    )
+                    | Q(place__isnull=True)
                 )
 
         return queryset.order_by("-created_at", "-pk")
@@ -333,32 +413,30 @@ class AstroImageQuerySet(TranslatableQuerySet):
             "telescope",
             "tracker",
             "tripod",
+            "variants",
         )
 
-        explicit_image_ids: list[int] = list(slider.images.values_list("id", flat=True))
+        # Explicit picks and region membership stay subqueries, so the images are
+        # fetched in one query however many sub-places or picks the slider has
+        explicit_images: Q = Q(
+            pk__in=MainPageLocation.images.through.objects.filter(
+                mainpagelocation_id=slider.pk
+            ).values("astroimage_id")
+        )
+        in_date_range: Q = Q()
+        if slider.adventure_date:
+            in_date_range = Q(
+                capture_date__range=(slider.adventure_date.lower, slider.adventure_date.upper)
+            )
 
         if slider.place:
             if slider.place.is_region:
-                sub_place_ids: list[int] = list(
-                    slider.place.sub_places.values_list("id", flat=True)
-                )
-                if slider.adventure_date:
-                    queryset = queryset.filter(
-                        Q(
-                            place_id__in=sub_place_ids,
-                            capture_date__range=(
-                                slider.adventure_date.lower,
-                                slider.adventure_date.upper,
-                            ),
-                        )
-                        | Q(id__in=explicit_image_ids)
-                    )
-                else:
-                    queryset = queryset.filter(
-                        Q(place_id__in=sub_place_ids) | Q(id__in=explicit_image_ids)
-                    )
+                sub_places = Place.sub_places.through.objects.filter(
+                    from_place_id=slider.place_id
+                ).values("to_place_id")
+                matches: Q = Q(place_id__in=sub_places) & in_date_range
             else:
-                queryset = queryset.filter(Q(place=slider.place) | Q(id__in=explicit_image_ids))
+                matches = Q(place=slider.place)
         else:
             maps: CountryMaps = self.get_country_maps()
             code_map: dict[str, str] = maps["code_map"]
@@ -368,51 +446,81 @@ class AstroImageQuerySet(TranslatableQuerySet):
             )
 
             if iso_code:
-                queryset = queryset.filter(
-                    Q(place__country=iso_code) | Q(id__in=explicit_image_ids)
-                )
+                matches = Q(place__country=iso_code) & in_date_range
             else:
-                queryset = queryset.filter(
-                    Q(place__country__icontains=slider.country_slug) | Q(id__in=explicit_image_ids)
-                )
-
-            if slider.adventure_date:
-                queryset = queryset.filter(
-                    Q(
-                        capture_date__range=(
-                            slider.adventure_date.lower,
-                            slider.adventure_date.upper,
-                        )
-                    )
-                    | Q(id__in=explicit_image_ids)
-                )
+                matches = Q(place__country__icontains=slider.country_slug) & in_date_range
 
+        queryset = queryset.filter(matches | explicit_images)
         return queryset.order_by("-created_at")
 
-    def _apply_travel_filter(self, queryset: QuerySet, search_term: str) -> QuerySet:
-        """Apply fuzzy country/place matching for gallery travel filters."""
-        search_term_lower: str = search_term.lower()
-        maps: CountryMaps = self.get_country_maps()
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_travel_country_codes(search_term: str) -> tuple[str, ...]:
+        """
+        Return the country codes a gallery ``travel`` term refers to.
+
+        An exact code or country name (in any site language) wins, then the first
+        name containing the term, then every code containing it.
+        """
+        term: str = search_term.lower()
+        maps: CountryMaps = AstroImageQuerySet.get_country_maps()
         country_map: dict[str, str] = maps["country_map"]
         code_map: dict[str, str] = maps["code_map"]
 
-        found_code: str | None = code_map.get(search_term_lower) or country_map.get(
-            search_term_lower
-        )
-
+        found_code: str | None = code_map.get(term) or country_map.get(term)
         if not found_code:
-            for name_lower, code in country_map.items():
-                if search_term_lower in name_lower:
-                    found_code = code
-                    break
-
-        filter_q: Q = Q(place__translations__name__icontains=search_term)
+            found_code = next(
+                (code for name_lower, code in country_map.items() if term in name_lower),
+                None,
+            )
         if found_code:
-            filter_q |= Q(place__country=found_code)
+            return (found_code,)
+        return tuple(code for code_lower, code in code_map.items() if term in code_lower)
 
-        if not found_code:
-            filter_q |= Q(place__country__icontains=search_term)
+    def search(self, query: str, language: str) -> QuerySet:
+        """
+        Images whose search document in ``language`` matches ``query``, best match first.
+
+        ``query`` uses web search syntax (quoted phrases, ``or``, ``-word``).
+        """
+        search_query = SearchQuery(
+            query, config=get_search_config(language), search_type="websearch"
+        )
+        return cast(
+            QuerySet,
+            self.filter(
+                search_documents__language_code=language,
+                search_documents__vector=search_query,
+            )
+            .annotate(search_rank=SearchRank(F("search_documents__vector"), search_query))
+            .order_by("-search_rank", "-created_at", "-pk"),
+        )
+
+    @staticmethod
+    def _tagged_with(tag_slug: str) -> Exists:
+        """
+        Correlated ``EXISTS`` over the tag links, so a tag filter neither adds rows
+        to the gallery join nor needs a separate query for the tag ids.
+        """
+        return Exists(
+            AstroImage.tags.through.objects.filter(
+                astroimage_id=OuterRef("pk"),
+                tag_id__in=Tag._parler_meta.root_model.objects.filter(slug=tag_slug).values(
+                    "master_id"
+                ),
+            )
+        )
 
+    def _apply_travel_filter(self, queryset: QuerySet, search_term: str) -> QuerySet:
+        """Apply fuzzy country/place matching for gallery travel filters."""
+        filter_q: Q | Exists = Exists(
+            Place._parler_meta.root_model.objects.filter(
+                master=OuterRef("place_id"), name__icontains=search_term
+            )
+        )
+        country_codes: tuple[str, ...] = self.get_travel_country_codes(search_term)
+        if country_codes:
+            filter_q |= Q(place__country__in=country_codes)
         return queryset.filter(filter_q)
 
 
@@ -565,6 +673,14 @@ class AstroImage(AutomatedTranslationModelMixin, BaseImage):
         verbose_name = _("Astrophotography Image")
         verbose_name_plural = _("Astrophotography Images")
         ordering = ["-created_at"]
+        indexes = [
+            # Gallery order, optionally narrowed to one category (?filter=)
+            models.Index(fields=["-created_at", "-id"], name="astroimage_gallery_idx"),
+            models.Index(
+                fields=["celestial_object", "-created_at", "-id"],
+                name="astroimage_category_gallery_idx",
+            ),
+        ]
 
     objects = AstroImageQuerySet.as_manager()
 
@@ -637,6 +753,299 @@ class AstroImage(AutomatedTranslationModelMixin, BaseImage):
             calculate_astroimage_exposure_hours_task.delay_on_commit(str(self.pk))
 
 
+class TagImageCountQuerySet(models.QuerySet):
+    def rebuild(self, tag_ids: Iterable[int] | None = None) -> int:
+        """
+        Recount the ``(tag, celestial_object)`` rows of the given tags, or of all tags.
+
+        The affected tags are locked first, so concurrent rebuilds of one tag run
+        one after another. Returns the number of rows written.
+        """
+        through = AstroImage.tags.through
+        links = through.objects.all()
+        tag_queryset: QuerySet = Tag.objects.all()
+        if tag_ids is not None:
+            tag_ids = set(tag_ids)
+            if not tag_ids:
+                return 0
+            links = links.filter(tag_id__in=tag_ids)
+            tag_queryset = tag_queryset.filter(pk__in=tag_ids)
+
+        with transaction.atomic():
+            list(tag_queryset.select_for_update().order_by("pk").values_list("pk", flat=True))
+            stale = self.model.objects.all()
+            if tag_ids is not None:
+                stale = stale.filter(tag_id__in=tag_ids)
+            stale.delete()
+
+            rows = (
+                links.values("tag_id", "astroimage__celestial_object")
+                .annotate(count=Count("astroimage_id"))
+                .order_by()
+            )
+            created = self.model.objects.bulk_create(
+                self.model(
+                    tag_id=row["tag_id"],
+                    celestial_object=row["astroimage__celestial_object"],
+                    count=row["count"],
+                )
+                for row in rows
+            )
+        return len(created)
+
+
+class TagImageCount(models.Model):
+    """
+    Denormalized number of images per ``(tag, celestial_object)``.
+
+    Kept in step with tag and category changes by the astrophotography signals
+    (in the same transaction) and rebuilt with ``rebuild_tag_stats``. Tag
+    statistics read this small table instead of joining tags to images.
+    """
+
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="image_counts")
+    celestial_object = models.CharField(max_length=50, choices=CELESTIAL_OBJECT_CHOICES)
+    count = models.PositiveIntegerField(default=0)
+
+    objects = TagImageCountQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Tag Image Count")
+        verbose_name_plural = _("Tag Image Counts")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "celestial_object"], name="unique_tag_image_count"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.tag_id} / {self.celestial_object}: {self.count}"
+
+
+class ExposureHoursTotalQuerySet(models.QuerySet):
+    def record_change(self, old: tuple[str, float] | None, new: tuple[str, float] | None) -> None:
+        """
+        Move one image's exposure hours between the per-category totals.
+
+        ``old`` and ``new`` are ``(celestial_object, hours)`` before and after the
+        write; ``old`` is None for a new image and ``new`` is None for a deleted one.
+        The rows are updated in place, so the change commits or rolls back with
+        the surrounding transaction.
+        """
+        deltas: dict[str, float] = {}
+        if old is not None:
+            deltas[old[0]] = deltas.get(old[0], 0.0) - float(old[1] or 0)
+        if new is not None:
+            deltas[new[0]] = deltas.get(new[0], 0.0) + float(new[1] or 0)
+
+        for celestial_object, delta in deltas.items():
+            if not delta:
+                continue
+            row, _created = self.model.objects.get_or_create(celestial_object=celestial_object)
+            self.model.objects.filter(pk=row.pk).update(hours=F("hours") + delta)
+
+    def breakdown(self) -> dict[str, float]:
+        """Return the stored hours per celestial object."""
+        return dict(self.model.objects.values_list("celestial_object", "hours"))
+
+    def rebuild(self) -> dict[str, float]:
+        """
+        Recompute every per-category total from ``AstroImage.calculated_exposure_hours``.
+
+        The rows are overwritten in place rather than recreated: the existing rows
+        are locked before the sums are read, a concurrent ``record_change`` blocks
+        on its row until the rebuild commits and then adds its delta to the new
+        sum. Categories without images are set to zero. Returns the new breakdown.
+        """
+        with transaction.atomic():
+            list(self.model.objects.select_for_update().values_list("pk", flat=True))
+            totals: dict[str, float] = {
+                row["celestial_object"]: row["hours"] or 0
+                for row in AstroImage.objects.values("celestial_object")
+                .annotate(hours=Sum("calculated_exposure_hours"))
+                .order_by()
+            }
+            self.model.objects.exclude(celestial_object__in=totals).update(hours=0)
+            self.model.objects.bulk_create(
+                [
+                    self.model(celestial_object=celestial_object, hours=hours)
+                    for celestial_object, hours in totals.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["celestial_object"],
+                update_fields=["hours"],
+            )
+        return self.breakdown()
+
+
+class ExposureHoursTotal(models.Model):
+    """
+    Running sum of ``AstroImage.calculated_exposure_hours`` per celestial object.
+
+    Moved by delta in the astrophotography signals (in the same transaction as
+    the image write) and reconciled with ``reconcile_exposure_hours``. The
+    landing-page total is the sum of these few rows.
+    """
+
+    celestial_object = models.CharField(
+        max_length=50, choices=CELESTIAL_OBJECT_CHOICES, unique=True
+    )
+    hours = models.FloatField(default=0)
+
+    objects = ExposureHoursTotalQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Exposure Hours Total")
+        verbose_name_plural = _("Exposure Hours Totals")
+
+    def __str__(self) -> str:
+        return f"{self.celestial_object}: {self.hours}h"
+
+
+class AstroImageSearchDocumentQuerySet(models.QuerySet):
+    EQUIPMENT_FIELDS = ("camera", "lens", "telescope", "tracker", "tripod")
+
+    @staticmethod
+    def _document_sections(image: "AstroImage", language: str) -> list[tuple[str, list[str]]]:
+        """Return the weighted text sections indexed for one image in ``language``."""
+        get_translation = TranslationService.get_translation
+        with translation.override(language):
+            labels: list[str] = [str(image.get_celestial_object_display())]
+        labels += [get_translation(tag, "name", language) for tag in image.tags.all()]
+        if image.place:
+            labels += [
+                get_translation(image.place, "name", language),
+                get_country_name(image.place.country, language),
+            ]
+        return [
+            ("A", [get_translation(image, "name", language)]),
+            ("B", labels),
+            ("C", [html.unescape(strip_tags(get_translation(image, "description", language)))]),
+            (
+                "D",
+                [
+                    str(item)
+                    for field in AstroImageSearchDocumentQuerySet.EQUIPMENT_FIELDS
+                    for item in getattr(image, field).all()
+                ],
+            ),
+        ]
+
+    def _build_vector(self, image: "AstroImage", language: str) -> CombinedSearchVector:
+        config: str = get_search_config(language)
+        vectors = [
+            SearchVector(
+                Value(" ".join(text for text in texts if text)), weight=weight, config=config
+            )
+            for weight, texts in self._document_sections(image, language)
+        ]
+        return cast(CombinedSearchVector, reduce(operator.add, vectors))
+
+    def rebuild(self, image_ids: Iterable[object] | None = None) -> int:
+        """
+        Rewrite the search documents of the given images, or of all images.
+
+        Every image gets one document per site language; untranslated fields
+        fall back like the API does. The images are locked first, so concurrent
+        rebuilds of one image run one after another. Returns the number of
+        documents written.
+        """
+        images: QuerySet = AstroImage.objects.select_related("place").prefetch_related(
+            "translations",
+            "tags__translations",
+            "place__translations",
+            *self.EQUIPMENT_FIELDS,
+        )
+        if image_ids is not None:
+            image_ids = set(image_ids)
+            if not image_ids:
+                return 0
+            images = images.filter(pk__in=image_ids)
+
+        languages: list[str] = [code for code, _name in settings.LANGUAGES]
+        with transaction.atomic():
+            list(
+                AstroImage.objects.filter(pk__in=images.values("pk"))
+                .select_for_update()
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            stale = self.model.objects.all()
+            if image_ids is not None:
+                stale = stale.filter(image_id__in=image_ids)
+            stale.delete()
+
+            created = self.model.objects.bulk_create(
+                self.model(
+                    image=image,
+                    language_code=language,
+                    vector=self._build_vector(image, language),
+                )
+                for image in images
+                for language in languages
+            )
+        return len(created)
+
+
+class AstroImageSearchDocument(models.Model):
+    """
+    Weighted full-text vector of one image in one site language.
+
+    Covers the name (A), tags, place, country and category (B), description (C)
+    and equipment (D). Rebuilt with the read documents by
+    ``rebuild_image_documents_task`` after the astrophotography signals fire, or
+    by ``rebuild_image_documents``; ``AstroImage.objects.search`` matches and
+    ranks against the GIN index in a single query.
+    """
+
+    image = models.ForeignKey(AstroImage, on_delete=models.CASCADE, related_name="search_documents")
+    language_code = models.CharField(max_length=15, choices=settings.LANGUAGES)
+    vector = SearchVectorField()
+
+    objects = AstroImageSearchDocumentQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Astro Image Search Document")
+        verbose_name_plural = _("Astro Image Search Documents")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "language_code"], name="unique_astroimage_search_document"
+            )
+        ]
+        indexes = [GinIndex(fields=["vector"], name="astroimage_search_vector_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.image_id} / {self.language_code}"
+
+
+class AstroImageDocument(models.Model):
+    """
+    Rendered list and detail API payloads of one image in one site language.
+
+    Built by ``astrophotography.image_documents`` with the public serializers,
+    so ``AstroImageViewSet`` assembles a page from one row per image instead
+    of the image's translations, place, tags and equipment.
+    """
+
+    image = models.ForeignKey(AstroImage, on_delete=models.CASCADE, related_name="documents")
+    language_code = models.CharField(max_length=15, choices=settings.LANGUAGES)
+    list_payload = models.JSONField(encoder=DjangoJSONEncoder)
+    detail_payload = models.JSONField(encoder=DjangoJSONEncoder)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Astro Image Document")
+        verbose_name_plural = _("Astro Image Documents")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "language_code"], name="unique_astroimage_document"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.image_id} / {self.language_code}"
+
+
 class MainPageBackgroundImage(AutomatedTranslationModelMixin, BaseImage):
     """Images used as full-page backgrounds on the main portal."""
 
@@ -736,7 +1145,7 @@ class MainPageLocationQuerySet(TranslatableQuerySet):
                 "place__translations",
                 "background_image__translations",
             )
-            .prefetch_related("images__translations")
+            .prefetch_related("images__translations", "images__variants")
             .order_by("-adventure_date"),
         )
 
@@ -872,6 +1281,13 @@ class MainPageLocation(AutomatedTranslationModelMixin, TranslatableModel):
         verbose_name = _("Main Page Location")
         verbose_name_plural = _("Main Page Locations")
         ordering = ["-adventure_date"]
+        indexes = [
+            # Cold path of the slug-based travel page (slug equality + date overlap)
+            GistIndex(
+                fields=["country_slug", "place_slug", "adventure_date"],
+                name="mainpagelocation_slug_gist_idx",
+            ),
+        ]
         constraints = [
             ExclusionConstraint(
                 name="exclude_overlapping_adventure_dates",
@@ -988,9 +1404,7 @@ class MainPageLocation(AutomatedTranslationModelMixin, TranslatableModel):
             month_str = date_slug[:3].lower()
             year_str = date_slug[3:]
 
-            # Use month_abbr for 3-letter abbreviations ('jan', 'feb', etc.)
-            months = {m.lower(): i for i, m in enumerate(calendar.month_abbr) if m}
-            month = months.get(month_str)
+            month = DATE_SLUG_MONTHS.get(month_str)
             year = int(year_str)
 
             if not month:
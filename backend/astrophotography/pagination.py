@@ -1,15 +1,142 @@
-from rest_framework.pagination import PageNumberPagination
+from datetime import datetime
+from typing import Any
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.request import Request
 from rest_framework.response import Response
 
+from django.db.models import Q, QuerySet
+
+from .gallery_counts import get_gallery_count
+
+PAGINATION_MODE_PARAM = "pagination"
+CURSOR_MODE = "cursor"
+
+
+class AstroImageCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the gallery's ``(-created_at, -pk)`` order.
+
+    Each page is an indexed range scan from the cursor position, so deep pages
+    in infinite scroll cost the same as the first one. The total comes from the
+    cached gallery counters instead of a ``COUNT(*)`` per page.
+
+    DRF's cursor only stores the first ordering field plus an offset into its
+    ties, which skips or repeats images once rows sharing a ``created_at`` are
+    added or removed between requests. The cursor here stores the full
+    ``(created_at, pk)`` key of the edge row instead, and never an offset.
+    """
+
+    page_size = 24
+    page_size_query_param = "limit"
+    max_page_size = 48
+    ordering = ("-created_at", "-pk")
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None  # noqa: ARG002
+    ) -> list[Any] | None:
+        self.count = get_gallery_count(queryset, request.query_params)
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.page_size = page_size
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        if self.cursor is not None and self.cursor.position is not None:
+            created_at, pk = self.decode_position(str(self.cursor.position))
+            if reverse:
+                after = Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+            else:
+                after = Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            queryset = queryset.filter(after)
+
+        queryset = queryset.order_by(
+            *(field.lstrip("-") if reverse else field for field in self.ordering)
+        )
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        has_position = self.cursor is not None and self.cursor.position is not None
+        self.has_next = has_position if reverse else has_more
+        self.has_previous = has_more if reverse else has_position
+        return self.page
+
+    def encode_position(self, instance: Any) -> str:
+        return f"{instance.created_at.isoformat()}|{instance.pk}"
+
+    def decode_position(self, position: str) -> tuple[datetime, int]:
+        try:
+            created_at, pk = position.rsplit("|", 1)
+            return datetime.fromisoformat(created_at), int(pk)
+        except ValueError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def edge_position(self, index: int) -> str | None:
+        """Return the key of the first or last row, or the cursor's for an empty page."""
+        if self.page:
+            return self.encode_position(self.page[index])
+        if self.cursor is None or self.cursor.position is None:
+            return None
+        return str(self.cursor.position)
+
+    # The stubs type cursor positions as ints; DRF itself encodes strings
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        position = self.edge_position(-1)
+        return self.encode_cursor(Cursor(0, False, position))  # type: ignore[arg-type]
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        position = self.edge_position(0)
+        return self.encode_cursor(Cursor(0, True, position))  # type: ignore[arg-type]
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
 
 class AstroImagePagination(PageNumberPagination):
-    """Gallery-specific pagination for the public astrophotography feed."""
+    """
+    Gallery-specific pagination for the public astrophotography feed.
+
+    ``?pagination=cursor`` switches to ``AstroImageCursorPagination``; its
+    ``next``/``previous`` links keep the parameter.
+    """
 
     page_size = 24
     page_size_query_param = "limit"
     max_page_size = 48
 
+    cursor_pagination: AstroImageCursorPagination | None = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list[Any] | None:
+        if request.query_params.get(PAGINATION_MODE_PARAM) == CURSOR_MODE:
+            self.cursor_pagination = AstroImageCursorPagination()
+            return self.cursor_pagination.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
     def get_paginated_response(self, data):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+
         assert self.page is not None
 
         return Response(
@@ -20,3 +147,16 @@ class AstroImagePagination(PageNumberPagination):
                 "results": data,
             }
         )
+
+
+class AstroImageSearchPagination(PageNumberPagination):
+    """
+    Page numbers for ranked search results.
+
+    Keyset pagination needs a stable column order; the search rank is computed
+    per query, so search always pages by number.
+    """
+
+    page_size = AstroImagePagination.page_size
+    page_size_query_param = "limit"
+    max_page_size = AstroImagePagination.max_page_size
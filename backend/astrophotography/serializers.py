@@ -6,12 +6,12 @@ from rest_framework import serializers
 
 from django.conf import settings
 from django.urls import reverse
-from django.utils import translation
 
 from common.serializers import TranslatedSerializerMixin
 from common.utils.signing import generate_signed_url_params
 from translation.services import TranslationService
 
+from .feed_serializers import GalleryFeedListSerializer, ThumbnailFeedListSerializer
 from .models import (
     AstroImage,
     MainPageBackgroundImage,
@@ -20,6 +20,7 @@ from .models import (
     Place,
     Tag,
 )
+from .utils import get_country_name
 
 
 class TagSerializer(TranslatedSerializerMixin, TranslatableModelSerializer):
@@ -39,24 +40,21 @@ class TagSerializer(TranslatedSerializerMixin, TranslatableModelSerializer):
 
 
 class PlaceSerializer(TranslatedSerializerMixin, TranslatableModelSerializer):
-    country = serializers.CharField(source="country.name", read_only=True)
-
-    def to_representation(self, instance: Place) -> dict[str, Any]:
-        data = super().to_representation(instance)
-
-        # Helper from mixin
-        data = self.translate_fields(data=data, instance=instance, fields=["name"])
+    country = serializers.SerializerMethodField()
 
+    def get_country(self, instance: Place) -> str:
+        # Country names come from a per-process (code, language) table, not gettext
         request = self.context.get("request")
         lang = request.query_params.get("lang") if request else None
-
         if lang and lang != settings.DEFAULT_APP_LANGUAGE:
-            # Translate country name using django-countries (native Django translation)
-            with translation.override(lang):
-                if instance.country:
-                    data["country"] = instance.country.name
+            return get_country_name(instance.country, lang)
+        return get_country_name(instance.country)
 
-        return data
+    def to_representation(self, instance: Place) -> dict[str, Any]:
+        data = super().to_representation(instance)
+
+        # Helper from mixin
+        return self.translate_fields(data=data, instance=instance, fields=["name"])
 
     class Meta:
         model = Place
@@ -123,6 +121,7 @@ class AstroImageSerializerList(AstroImageBaseSerializer):
 
     class Meta(AstroImageBaseSerializer.Meta):
         fields = AstroImageBaseSerializer.Meta.fields + ["thumbnail_url", "description"]
+        list_serializer_class = GalleryFeedListSerializer
 
 
 class AstroImageSerializer(AstroImageBaseSerializer):
@@ -178,6 +177,7 @@ class AstroImageThumbnailSerializer(AstroImageBaseSerializer):
 
     class Meta(AstroImageBaseSerializer.Meta):
         fields = ["pk", "slug", "thumbnail_url", "description"]
+        list_serializer_class = ThumbnailFeedListSerializer
 
 
 class MainPageLocationSerializer(TranslatedSerializerMixin, TranslatableModelSerializer):
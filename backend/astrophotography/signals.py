@@ -2,7 +2,7 @@
 
 This module keeps two cache layers in sync after astrophotography content changes:
 
-- backend API cache, cleared via ``CacheService``
+- backend API cache namespaces, bumped via ``CacheService``
 - frontend SSR shell cache, cleared via ``invalidate_frontend_ssr_cache_task``
 
 Why the frontend cache must also be cleared:
@@ -11,17 +11,44 @@ Why the frontend cache must also be cleared:
 - clearing only the backend cache would still leave stale SSR HTML until the
   frontend cache expires naturally
 
-Each receiver therefore invalidates the backend cache keys and, when the
+Each receiver therefore invalidates the backend cache namespace and, when the
 frontend shell depends on the changed data, also clears the matching SSR tag.
+
+Receivers queue their work through ``CacheService.invalidate_on_commit``. One
+admin save fires signals for the image, each translation and every m2m change;
+the collector merges them and flushes each namespace and SSR tag once on commit.
+Search and read-model documents are queued the same way through
+``refresh_image_documents``.
 """
 
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
-from common.tasks import invalidate_frontend_ssr_cache_task
+from common.types import CacheNamespace
 from core.cache_service import CacheService
-
-from .models import AstroImage, MainPageBackgroundImage, MainPageLocation, Tag
+from core.models import ImageVariant, variant_files_changed
+
+from .gallery_counts import record_gallery_change
+from .image_documents import refresh_image_documents
+from .models import (
+    AstroImage,
+    Camera,
+    ExposureHoursTotal,
+    Lens,
+    MainPageBackgroundImage,
+    MainPageLocation,
+    Place,
+    Tag,
+    TagImageCount,
+    Telescope,
+    Tracker,
+    Tripod,
+)
+from .travel_slugs import resolve_highlight_pk
+
+EQUIPMENT_MODELS = (Camera, Lens, Telescope, Tracker, Tripod)
 
 
 @receiver([post_save, post_delete], sender=AstroImage)
@@ -30,28 +57,118 @@ def invalidate_astroimage_cache(sender, instance, **kwargs):
     """Clear gallery/travel caches after astro image content changes.
 
     Clears:
-    - backend astrophotography API cache
+    - backend astrophotography and travel API cache
     - frontend SSR tags: ``latest-astro-images`` and ``travel-highlights``
 
     We clear the frontend tags because homepage/latest-image shells and travel
-    highlight shells embed astrophotography data.
+    highlight shells embed astrophotography data. The travel namespace holds the
+    cached travel pages, whose image sets follow image places and capture dates.
     """
-    CacheService.invalidate_astrophotography_cache()
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["latest-astro-images", "travel-highlights"])
+    CacheService.invalidate_on_commit(
+        CacheNamespace.ASTRO,
+        CacheNamespace.TRAVEL,
+        ssr_tags=["latest-astro-images", "travel-highlights"],
+    )
 
 
 @receiver(pre_save, sender=AstroImage)
 def store_previous_calculated_exposure_hours(sender, instance, **kwargs):
-    """Capture the persisted exposure-hour value for post-save change detection."""
+    """Capture the persisted exposure hours and category for post-save change detection."""
+    instance._previous_calculated_exposure_hours = None
+    instance._previous_celestial_object = None
     if not instance.pk:
-        instance._previous_calculated_exposure_hours = None
         return
 
-    instance._previous_calculated_exposure_hours = (
+    previous = (
         sender.objects.filter(pk=instance.pk)
-        .values_list("calculated_exposure_hours", flat=True)
+        .values_list("calculated_exposure_hours", "celestial_object")
         .first()
     )
+    if previous is not None:
+        (
+            instance._previous_calculated_exposure_hours,
+            instance._previous_celestial_object,
+        ) = previous
+
+
+@receiver(post_save, sender=AstroImage)
+def update_gallery_counts_after_save(sender, instance, created, **kwargs):
+    """Keep the cached gallery counters used by cursor pagination in step with writes."""
+    previous_category = getattr(instance, "_previous_celestial_object", None)
+    if created or previous_category is None:
+        record_gallery_change(None, instance.celestial_object)
+    elif previous_category != instance.celestial_object:
+        record_gallery_change(previous_category, instance.celestial_object)
+
+
+@receiver(post_delete, sender=AstroImage)
+def update_gallery_counts_after_delete(sender, instance, **kwargs):
+    """Remove a deleted image from the cached gallery counters."""
+    record_gallery_change(instance.celestial_object, None)
+
+
+@receiver(m2m_changed, sender=AstroImage.tags.through)
+def update_tag_counts_after_tag_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recount the tags whose image links changed, in the same transaction."""
+    if action == "pre_clear":
+        # The cleared links are gone by post_clear, so remember which tags they touched
+        instance._cleared_tag_ids = (
+            {instance.pk} if reverse else set(instance.tags.values_list("pk", flat=True))
+        )
+    elif action == "post_clear":
+        TagImageCount.objects.rebuild(getattr(instance, "_cleared_tag_ids", set()))
+    elif action in ("post_add", "post_remove"):
+        TagImageCount.objects.rebuild({instance.pk} if reverse else pk_set or set())
+
+
+@receiver(post_save, sender=AstroImage)
+def update_tag_counts_after_category_change(sender, instance, created, **kwargs):
+    """Move the image's tags to its new category in the tag statistics."""
+    previous_category = getattr(instance, "_previous_celestial_object", None)
+    if created or previous_category is None or previous_category == instance.celestial_object:
+        return
+    TagImageCount.objects.rebuild(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=AstroImage)
+def store_tag_ids_before_delete(sender, instance, **kwargs):
+    """Remember the tags of an image whose links are deleted by cascade (no m2m signal)."""
+    instance._deleted_tag_ids = set(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=AstroImage)
+def update_tag_counts_after_delete(sender, instance, **kwargs):
+    """Remove a deleted image from the tag statistics."""
+    TagImageCount.objects.rebuild(getattr(instance, "_deleted_tag_ids", set()))
+
+
+@receiver(post_save, sender=AstroImage)
+def update_exposure_totals_after_save(sender, instance, created, update_fields=None, **kwargs):
+    """Move the image's hours into its current category's running total."""
+    previous_category = getattr(instance, "_previous_celestial_object", None)
+    if created or previous_category is None:
+        ExposureHoursTotal.objects.record_change(
+            None, (instance.celestial_object, instance.calculated_exposure_hours)
+        )
+        return
+
+    previous_hours = getattr(instance, "_previous_calculated_exposure_hours", None) or 0
+    category, hours = instance.celestial_object, instance.calculated_exposure_hours
+    # Fields left out of update_fields keep their persisted values
+    if update_fields is not None:
+        if "celestial_object" not in update_fields:
+            category = previous_category
+        if "calculated_exposure_hours" not in update_fields:
+            hours = previous_hours
+    ExposureHoursTotal.objects.record_change((previous_category, previous_hours), (category, hours))
+
+
+@receiver(post_delete, sender=AstroImage)
+def update_exposure_totals_after_delete(sender, instance, **kwargs):
+    """Remove a deleted image's hours from the running totals."""
+    ExposureHoursTotal.objects.record_change(
+        (instance.celestial_object, instance.calculated_exposure_hours), None
+    )
 
 
 @receiver(post_save, sender=AstroImage)
@@ -64,8 +181,8 @@ def invalidate_settings_cache_when_calculated_exposure_hours_changes(
     - backend landing-page/settings cache
     - frontend SSR tag: ``settings``
 
-    We clear ``settings`` because the public landing-page total is derived from
-    ``AstroImage.calculated_exposure_hours`` and exposed through the settings API.
+    We clear ``settings`` because the public landing-page total is read from the
+    ``ExposureHoursTotal`` rows moved above and exposed through the settings API.
     """
     if update_fields is not None and "calculated_exposure_hours" not in update_fields:
         return
@@ -76,8 +193,7 @@ def invalidate_settings_cache_when_calculated_exposure_hours_changes(
     if previous_value == current_value:
         return
 
-    CacheService.invalidate_landing_page_cache()
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["settings"])
+    CacheService.invalidate_on_commit(CacheNamespace.LANDING, ssr_tags=["settings"])
 
 
 @receiver(post_delete, sender=AstroImage)
@@ -91,8 +207,7 @@ def recalculate_total_time_spent_after_astroimage_delete(sender, instance, **kwa
     Deleting an image changes the derived landing-page total, so the settings
     payload and SSR shell must both be refreshed.
     """
-    CacheService.invalidate_landing_page_cache()
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["settings"])
+    CacheService.invalidate_on_commit(CacheNamespace.LANDING, ssr_tags=["settings"])
 
 
 @receiver([post_save, post_delete], sender=Tag)
@@ -101,12 +216,120 @@ def invalidate_tag_cache(sender, instance, **kwargs):
     """Clear backend astrophotography cache when tags or tag translations change.
 
     Clears:
-    - backend astrophotography API cache
+    - backend astrophotography and travel API cache
+
+    Travel pages list their images with tags. No frontend tag is cleared here
+    because tag changes do not map directly to a dedicated SSR shell resource in
+    the same way as latest images or settings.
+    """
+    CacheService.invalidate_on_commit(CacheNamespace.ASTRO, CacheNamespace.TRAVEL)
 
-    No frontend tag is cleared here because tag changes do not map directly to a
-    dedicated SSR shell resource in the same way as latest images or settings.
+
+@receiver([post_save, post_delete], sender=Place)
+@receiver([post_save, post_delete], sender="astrophotography.PlaceTranslation")
+def invalidate_place_cache(sender, instance, **kwargs):
+    """Clear gallery, place search and travel caches when places are renamed or edited.
+
+    Clears:
+    - backend astrophotography and travel API cache
+    - frontend SSR tags: ``latest-astro-images`` and ``travel-highlights``
+
+    Gallery items, the place search and travel highlights all embed place names
+    and countries.
     """
-    CacheService.invalidate_astrophotography_cache()
+    CacheService.invalidate_on_commit(
+        CacheNamespace.ASTRO,
+        CacheNamespace.TRAVEL,
+        ssr_tags=["latest-astro-images", "travel-highlights"],
+    )
+
+
+@receiver(post_save, sender=AstroImage)
+@receiver([post_save, post_delete], sender="astrophotography.AstroImageTranslation")
+def refresh_image_documents_after_image_change(sender, instance, **kwargs):
+    """Rebuild an image's documents after its fields or one of its translations change."""
+    refresh_image_documents([getattr(instance, "master_id", instance.pk)])
+
+
+def _linked_image_ids(through: type[models.Model], related: models.Model) -> list[object]:
+    """Return the images linked to a tag or equipment row through an m2m table."""
+    field_name = f"{related._meta.model_name}_id"
+    return list(
+        through._default_manager.filter(**{field_name: related.pk}).values_list(
+            "astroimage_id", flat=True
+        )
+    )
+
+
+@receiver(m2m_changed, sender=AstroImage.tags.through)
+@receiver(m2m_changed, sender=AstroImage.camera.through)
+@receiver(m2m_changed, sender=AstroImage.lens.through)
+@receiver(m2m_changed, sender=AstroImage.telescope.through)
+@receiver(m2m_changed, sender=AstroImage.tracker.through)
+@receiver(m2m_changed, sender=AstroImage.tripod.through)
+def refresh_image_documents_after_link_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Rebuild the documents of images whose tags or equipment changed."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_image_documents([instance.pk])
+    elif action == "pre_clear":
+        refresh_image_documents(_linked_image_ids(sender, instance))
+    elif action in ("post_add", "post_remove"):
+        refresh_image_documents(pk_set or ())
+
+
+@receiver([post_save, pre_delete], sender=Tag)
+@receiver([post_save, post_delete], sender="astrophotography.TagTranslation")
+def refresh_image_documents_after_tag_change(sender, instance, **kwargs):
+    """Rebuild the documents of the images of a renamed or deleted tag."""
+    tag_id = getattr(instance, "master_id", instance.pk)
+    refresh_image_documents(
+        AstroImage.tags.through.objects.filter(tag_id=tag_id).values_list(
+            "astroimage_id", flat=True
+        )
+    )
+
+
+@receiver([post_save, pre_delete], sender=Place)
+@receiver([post_save, post_delete], sender="astrophotography.PlaceTranslation")
+def refresh_image_documents_after_place_change(sender, instance, **kwargs):
+    """Rebuild the documents of the images of a renamed, moved or deleted place."""
+    place_id = getattr(instance, "master_id", instance.pk)
+    refresh_image_documents(
+        AstroImage.objects.filter(place_id=place_id).values_list("pk", flat=True)
+    )
+
+
+def refresh_image_documents_after_equipment_change(sender, instance, **kwargs):
+    """Rebuild the documents of images listing a renamed or deleted piece of equipment."""
+    field_name = sender._meta.model_name
+    through = getattr(AstroImage, field_name).through
+    refresh_image_documents(_linked_image_ids(through, instance))
+
+
+for equipment_model in EQUIPMENT_MODELS:
+    post_save.connect(refresh_image_documents_after_equipment_change, sender=equipment_model)
+    pre_delete.connect(refresh_image_documents_after_equipment_change, sender=equipment_model)
+
+
+@receiver([post_save, post_delete], sender=ImageVariant)
+def refresh_image_documents_after_variant_change(sender, instance, **kwargs):
+    """Re-render an image's documents after its variant files change (thumbnail URLs)."""
+    if instance.content_type_id == ContentType.objects.get_for_model(AstroImage).pk:
+        refresh_image_documents([instance.object_id])
+
+
+@receiver(variant_files_changed, sender=ImageVariant)
+def refresh_image_documents_after_variant_files_change(sender, variants, **kwargs):
+    """Re-render the documents of images whose variant files appeared or went missing."""
+    astro_image_type = ContentType.objects.get_for_model(AstroImage)
+    refresh_image_documents(
+        [
+            variant.object_id
+            for variant in variants
+            if variant.content_type_id == astro_image_type.pk
+        ]
+    )
 
 
 @receiver([post_save, post_delete], sender=MainPageLocation)
@@ -121,8 +344,21 @@ def invalidate_travel_cache(sender, instance, **kwargs):
     The frontend tag is required because the SSR shell caches the travel
     highlights section separately from the backend API response cache.
     """
-    CacheService.invalidate_travel_cache()
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["travel-highlights"])
+    CacheService.invalidate_on_commit(CacheNamespace.TRAVEL, ssr_tags=["travel-highlights"])
+
+
+@receiver(post_save, sender=MainPageLocation)
+def remember_highlight_slugs(sender, instance, **kwargs):
+    """Resolve a saved highlight's own URL into the travel slug cache after commit.
+
+    Connected after ``invalidate_travel_cache``, so the entry is written under
+    the travel generation that the save has just bumped.
+    """
+    if not instance.is_active or not instance.adventure_date or not instance.adventure_date.lower:
+        return
+
+    triple = (instance.safe_country_slug, instance.safe_place_slug, instance.date_slug)
+    transaction.on_commit(lambda: resolve_highlight_pk(sender.objects.active(), *triple))
 
 
 @receiver([post_save, post_delete], sender=MainPageBackgroundImage)
@@ -137,5 +373,4 @@ def invalidate_background_cache(sender, instance, **kwargs):
     The background shell is SSR-cached independently, so backend invalidation
     alone would not refresh the rendered page background.
     """
-    CacheService.invalidate_astrophotography_cache()
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["background"])
+    CacheService.invalidate_on_commit(CacheNamespace.ASTRO, ssr_tags=["background"])
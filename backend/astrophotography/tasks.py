@@ -6,6 +6,7 @@ from celery import shared_task
 
 from django.apps import apps
 from django.conf import settings
+from django.db import transaction
 
 from common.celery import CommitAwareTask
 from common.tasks import invalidate_frontend_ssr_cache_task
@@ -19,6 +20,29 @@ if TYPE_CHECKING:
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _store_exposure_hours(astro_image_id: str, hours: float) -> None:
+    """
+    Save one image's hours and move the running totals by the same delta.
+
+    ``QuerySet.update()`` skips the model signals (and ``AstroImage.save()``,
+    which would queue this task again), so the totals are adjusted here. The
+    row is locked so a concurrent save cannot apply its delta in between.
+    """
+    astro_image_model = apps.get_model("astrophotography", "AstroImage")
+    exposure_totals = apps.get_model("astrophotography", "ExposureHoursTotal")
+    with transaction.atomic():
+        previous = (
+            astro_image_model.objects.select_for_update()
+            .filter(pk=astro_image_id)
+            .values_list("celestial_object", "calculated_exposure_hours")
+            .first()
+        )
+        if previous is None:
+            return
+        astro_image_model.objects.filter(pk=astro_image_id).update(calculated_exposure_hours=hours)
+        exposure_totals.objects.record_change(previous, (previous[0], hours))
+
+
 @shared_task(  # type: ignore[untyped-decorator]
     bind=True,
     name="astrophotography.calculate_astroimage_exposure_hours",
@@ -38,9 +62,7 @@ def calculate_astroimage_exposure_hours_task(
         exposure_details: str = service.get_exposure_details(astro_image)
         parsed_hours: float = service.parse_total_hours(exposure_details)
 
-        astro_image_model.objects.filter(pk=astro_image.pk).update(
-            calculated_exposure_hours=parsed_hours
-        )
+        _store_exposure_hours(astro_image_id, parsed_hours)
         CacheService.invalidate_landing_page_cache()
         invalidate_frontend_ssr_cache_task.delay(["settings"])
 
@@ -60,3 +82,29 @@ def calculate_astroimage_exposure_hours_task(
         if settings.ENABLE_SENTRY:
             sentry_sdk.capture_exception(exc)
         raise self.retry(exc=exc) from exc
+
+
+@shared_task(  # type: ignore[untyped-decorator]
+    name="astrophotography.rebuild_image_documents",
+    base=CommitAwareTask,
+    ignore_result=True,
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=True,
+)
+def rebuild_image_documents_task(image_ids: list[str]) -> int:
+    """
+    Rebuild the search and read documents of the given images, then clear the gallery cache.
+
+    The gallery cache is cleared even when the rebuild raises, so pages rendered
+    from the live fallback in the meantime do not outlive the retry.
+    """
+    from .image_documents import DOCUMENT_NAMESPACES, DOCUMENT_SSR_TAGS, rebuild_image_documents
+
+    try:
+        rows: int = rebuild_image_documents(image_ids)
+    finally:
+        CacheService.invalidate_namespaces(*DOCUMENT_NAMESPACES)
+        invalidate_frontend_ssr_cache_task.delay(list(DOCUMENT_SSR_TAGS))
+    logger.info("Rebuilt %s document(s) for %s image(s)", rows, len(image_ids))
+    return rows
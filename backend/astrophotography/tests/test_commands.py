@@ -6,8 +6,16 @@ from pytest_mock import MockerFixture
 
 from django.core.management import call_command
 
-from astrophotography.models import AstroImage, MainPageLocation, Place
-from astrophotography.tests.factories import AstroImageFactory, PlaceFactory
+from astrophotography.models import (
+    AstroImage,
+    AstroImageDocument,
+    AstroImageSearchDocument,
+    MainPageLocation,
+    Place,
+    Tag,
+    TagImageCount,
+)
+from astrophotography.tests.factories import AstroImageFactory, PlaceFactory, TagFactory
 
 
 @pytest.mark.django_db
@@ -83,3 +91,50 @@ class TestFixParlerLanguageCodesCommand:
             language_code="en", name="Legacy Astro"
         ).exists()
         assert location_translation_model.objects.filter(language_code="en", story="Story").exists()
+
+
+@pytest.mark.django_db
+class TestRebuildImageDocumentsCommand:
+    def test_rebuild_image_documents_writes_documents_per_language(self) -> None:
+        image = AstroImageFactory(name="Orion Nebula")
+        AstroImageSearchDocument.objects.all().delete()
+        AstroImageDocument.objects.all().delete()
+        output = StringIO()
+
+        call_command("rebuild_image_documents", stdout=output)
+
+        # One search and one read document per site language
+        assert "Rebuilt 4 image document(s)." in output.getvalue()
+        assert set(image.search_documents.values_list("language_code", flat=True)) == {"en", "pl"}
+        assert list(AstroImage.objects.search("nebula", "en")) == [image]
+        document = image.documents.get(language_code="en")
+        assert document.list_payload["name"] == "Orion Nebula"
+        assert document.detail_payload["slug"] == image.slug
+
+
+@pytest.mark.django_db
+class TestRebuildTagStatsCommand:
+    def test_rebuild_tag_stats_recounts_all_tags(self) -> None:
+        nebula, comet = TagFactory(name="nebula"), TagFactory(name="comet")
+        image = AstroImageFactory(celestial_object="Deep Sky")
+        image.tags.add(nebula, comet)
+        TagImageCount.objects.all().delete()
+        output = StringIO()
+
+        call_command("rebuild_tag_stats", stdout=output)
+
+        assert "Rebuilt 2 tag statistics row(s)." in output.getvalue()
+        assert {tag.slug: tag.num_times for tag in Tag.objects.with_stats("Deep Sky")} == {
+            "nebula": 1,
+            "comet": 1,
+        }
+
+    def test_rebuild_tag_stats_limited_to_tags(self) -> None:
+        nebula, comet = TagFactory(name="nebula"), TagFactory(name="comet")
+        AstroImageFactory().tags.add(nebula, comet)
+        TagImageCount.objects.update(count=9)
+
+        call_command("rebuild_tag_stats", tag_ids=[nebula.pk], stdout=StringIO())
+
+        counts = dict(TagImageCount.objects.values_list("tag_id", "count"))
+        assert counts == {nebula.pk: 1, comet.pk: 9}
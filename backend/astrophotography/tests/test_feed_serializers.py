@@ -0,0 +1,127 @@
+from io import StringIO
+from typing import Any
+
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django.core.management import call_command
+
+from astrophotography.models import AstroImage, MainPageLocation, Tag
+from astrophotography.serializers import (
+    AstroImageSerializerList,
+    AstroImageThumbnailSerializer,
+    MainPageLocationSerializer,
+    TravelHighlightDetailSerializer,
+)
+from astrophotography.tests.factories import (
+    AstroImageFactory,
+    MainPageLocationFactory,
+    PlaceFactory,
+    TagFactory,
+)
+from translation.services import TranslationService
+
+
+def make_context(query: str = "") -> dict[str, Any]:
+    return {"request": Request(APIRequestFactory().get(f"/v1/astroimages/{query}"))}
+
+
+@pytest.fixture
+def feed_images(db) -> list[AstroImage]:  # noqa: ARG001
+    """Images covering the translation edge cases handled by ``translate_fields``."""
+    nebula: Tag = TagFactory(name="nebula")
+    translated: AstroImage = AstroImageFactory(zoom=True)
+    translated.tags.add(nebula, TagFactory(name="winter"))
+    translated.set_current_language("pl")
+    translated.name = "Mgławica"
+    translated.description = "<p>&nbsp;</p>"
+    translated.save()
+
+    failed: AstroImage = AstroImageFactory(
+        name=f"{TranslationService.TRANSLATION_FAILED_PREFIX} Orion",
+        description="<p>&nbsp;</p>",
+        place=PlaceFactory(country="DE"),
+    )
+    failed.tags.add(nebula)
+
+    no_place: AstroImage = AstroImageFactory(place=None)
+    return [translated, failed, no_place]
+
+
+@pytest.mark.django_db
+class TestGalleryFeedSerializers:
+    """The ``many=True`` fast path must render exactly what the declarative serializer does."""
+
+    @pytest.mark.parametrize("query", ["", "?lang=pl", "?lang=en"])
+    def test_gallery_items_match_drf_output(
+        self, feed_images: list[AstroImage], query: str
+    ) -> None:
+        context = make_context(query)
+        queryset = AstroImage.objects.for_gallery({}).order_by("created_at")
+
+        fast = AstroImageSerializerList(queryset, many=True, context=context).data
+        reference = [AstroImageSerializerList(image, context=context).data for image in queryset]
+
+        assert len(fast) == len(feed_images)
+        assert fast == reference
+
+    def test_gallery_items_without_request_match_drf_output(
+        self, feed_images: list[AstroImage]
+    ) -> None:
+        queryset = AstroImage.objects.for_gallery({}).order_by("created_at")
+
+        fast = AstroImageSerializerList(queryset, many=True).data
+
+        assert fast == [AstroImageSerializerList(image).data for image in queryset]
+
+    def test_failure_markers_and_empty_paragraphs_are_blanked(
+        self, feed_images: list[AstroImage]
+    ) -> None:
+        queryset = AstroImage.objects.for_gallery({}).filter(pk=feed_images[1].pk)
+
+        (item,) = AstroImageSerializerList(queryset, many=True, context=make_context()).data
+
+        assert item["name"] == ""
+        assert item["description"] == ""
+        assert item["place"]["country"] == "Germany"
+
+    @pytest.mark.parametrize("query", ["", "?lang=pl"])
+    def test_travel_highlight_images_match_drf_output(
+        self, feed_images: list[AstroImage], query: str
+    ) -> None:
+        context = make_context(query)
+        highlight: MainPageLocation = MainPageLocationFactory(images=feed_images)
+        highlight = MainPageLocation.objects.ready_for_main_page().get(pk=highlight.pk)
+
+        thumbnails = MainPageLocationSerializer(highlight, context=context).data["images"]
+        detail_images = TravelHighlightDetailSerializer(highlight, context=context).data["images"]
+
+        assert thumbnails == [
+            AstroImageThumbnailSerializer(image, context=context).data
+            for image in highlight.images.all()
+        ]
+        assert detail_images == [
+            AstroImageSerializerList(image, context=context).data
+            for image in AstroImage.objects.for_travel_highlight(highlight)
+        ]
+
+
+@pytest.mark.django_db
+class TestBenchmarkFeedSerializersCommand:
+    def test_reports_per_item_cost_for_both_paths(self, feed_images: list[AstroImage]) -> None:
+        output = StringIO()
+
+        call_command("benchmark_feed_serializers", repeat=1, lang="pl", stdout=output)
+
+        report = output.getvalue()
+        assert f"Images: {len(feed_images)}" in report
+        assert "DRF serializer:" in report
+        assert "Feed builder:" in report
+
+    def test_reports_empty_gallery(self, db) -> None:  # noqa: ARG002
+        output = StringIO()
+
+        call_command("benchmark_feed_serializers", stdout=output)
+
+        assert "No images to serialize." in output.getvalue()
@@ -10,8 +10,9 @@ from pytest_mock import MockerFixture
 
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import IntegrityError
+from django.db import IntegrityError, connection, transaction
 from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
 from django.utils.text import slugify
 
 from astrophotography.forms import AstroImageForm
@@ -23,6 +24,7 @@ from astrophotography.models import (
     MainPageLocation,
     Place,
     Tag,
+    TagImageCount,
 )
 from astrophotography.tests.factories import (
     AstroImageFactory,
@@ -32,7 +34,7 @@ from astrophotography.tests.factories import (
     TagFactory,
 )
 from core.models import LandingPageSettings
-from core.tasks import process_image_task
+from core.tasks import process_image_task, verify_image_variant_files
 from translation.services import TranslationService
 
 
@@ -112,7 +114,7 @@ class TestAstroImageModel:
         assert url == variant.file.url
 
     def test_get_image_url_falls_back_when_thumbnail_variant_file_missing(self) -> None:
-        """Missing thumbnail variant files should not leak dead media URLs to the API."""
+        """Variant files flagged missing by the sweep should not leak dead URLs to the API."""
         image: AstroImage = AstroImageFactory(original__width=1200, original__height=800)
         process_image_task("astrophotography", "AstroImage", image.pk)
         image.refresh_from_db()
@@ -120,6 +122,7 @@ class TestAstroImageModel:
 
         missing_name = str(variant.file.name)
         variant.file.storage.delete(missing_name)
+        verify_image_variant_files()
 
         assert image.get_image_url("thumbnail", 560) == image.original.url
 
@@ -566,3 +569,143 @@ class TestTagQuerySet:
 
         latest = Tag.objects.latest_tags()
         assert latest.count() == 0
+
+
+@pytest.mark.django_db
+class TestAstroImageGalleryFilters:
+    """Gallery filters run as correlated EXISTS subqueries backed by indexes."""
+
+    @pytest.fixture
+    def index_only_plans(self) -> None:
+        # Near-empty test tables make a sequential scan the cheapest plan
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_tag_filter_builds_without_queries_and_without_duplicates(self) -> None:
+        tag: Tag = TagFactory(name="Nebula")
+        tag.create_translation("pl", name="Mgławica", slug="mglawica")
+        image: AstroImage = AstroImageFactory()
+        image.tags.add(tag)
+        AstroImageFactory()
+
+        with CaptureQueriesContext(connection) as context:
+            queryset: QuerySet = AstroImage.objects.for_gallery({"tag": "nebula"})
+
+        assert len(context.captured_queries) == 0
+        assert list(queryset) == [image]
+        assert list(AstroImage.objects.for_gallery({"tag": "mglawica"})) == [image]
+        assert not AstroImage.objects.for_gallery({"tag": "missing"}).exists()
+
+    def test_place_filter_matches_name_in_any_language(self) -> None:
+        place: Place = PlaceFactory(country="PL", name="High Tatras")
+        place.create_translation("pl", name="Tatry Wysokie")
+        image: AstroImage = AstroImageFactory(place=place)
+        AstroImageFactory(place=PlaceFactory(country="PL", name="Bieszczady"))
+
+        for name in ("high tatras", "TATRY WYSOKIE"):
+            params: dict[str, str] = {"country": "PL", "place": name}
+            assert list(AstroImage.objects.for_gallery(params)) == [image]
+
+    @pytest.mark.usefixtures("index_only_plans")
+    def test_category_filter_uses_category_gallery_index(self) -> None:
+        plan: str = AstroImage.objects.for_gallery({"filter": "Deep Sky"}).explain()
+
+        assert "astroimage_category_gallery_idx" in plan
+
+    @pytest.mark.usefixtures("index_only_plans")
+    def test_country_filter_uses_place_country_index(self) -> None:
+        plan: str = AstroImage.objects.for_gallery({"country": "PL"}).explain()
+
+        assert "place_country_idx" in plan
+
+    @pytest.mark.usefixtures("index_only_plans")
+    def test_tag_filter_uses_tag_slug_index(self) -> None:
+        plan: str = AstroImage.objects.for_gallery({"tag": "nebula"}).explain()
+
+        assert "_slug_" in plan
+
+
+@pytest.mark.django_db
+class TestTagImageCount:
+    """The denormalized tag statistics follow tag links, categories and deletions."""
+
+    @staticmethod
+    def stats(category: str | None = None) -> dict[str, int]:
+        return {tag.slug: tag.num_times for tag in Tag.objects.with_stats(category)}
+
+    @staticmethod
+    def expected(category: str | None = None) -> dict[str, int]:
+        """The same statistics computed by joining tags to images."""
+        images = AstroImage.objects.all()
+        if category:
+            images = images.filter(celestial_object=category)
+        counts: dict[str, int] = {}
+        for image in images.prefetch_related("tags"):
+            for tag in image.tags.all():
+                counts[tag.slug] = counts.get(tag.slug, 0) + 1
+        return counts
+
+    def assert_in_sync(self) -> None:
+        for category in (None, "Deep Sky", "Landscape"):
+            assert self.stats(category) == self.expected(category)
+
+    def test_counts_follow_writes(self) -> None:
+        nebula, comet = TagFactory(name="nebula"), TagFactory(name="comet")
+        first = AstroImageFactory(celestial_object="Deep Sky")
+        second = AstroImageFactory(celestial_object="Landscape")
+
+        first.tags.add(nebula, comet)
+        second.tags.add(nebula)
+        self.assert_in_sync()
+        assert self.stats() == {"nebula": 2, "comet": 1}
+
+        second.celestial_object = "Deep Sky"
+        second.save()
+        assert self.stats("Deep Sky") == {"nebula": 2, "comet": 1}
+        assert self.stats("Landscape") == {}
+
+        comet.images.add(second)
+        first.tags.remove(nebula)
+        self.assert_in_sync()
+
+        second.tags.clear()
+        self.assert_in_sync()
+
+        first.delete()
+        self.assert_in_sync()
+        assert TagImageCount.objects.count() == 0
+
+    def test_rolled_back_changes_leave_counts_untouched(self) -> None:
+        nebula = TagFactory(name="nebula")
+        image = AstroImageFactory(celestial_object="Deep Sky")
+        image.tags.add(nebula)
+
+        def remove_and_fail() -> None:
+            with transaction.atomic():
+                image.tags.remove(nebula)
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            remove_and_fail()
+
+        assert self.stats() == {"nebula": 1}
+
+    def test_stats_order_by_count_then_id(self) -> None:
+        tags = [TagFactory(name=name) for name in ("a", "b", "c")]
+        for count, tag in zip((1, 3, 1), tags, strict=True):
+            for image in AstroImageFactory.create_batch(count):
+                image.tags.add(tag)
+
+        assert [tag.slug for tag in Tag.objects.with_stats()] == ["b", "a", "c"]
+
+    def test_rebuild_repairs_drift(self) -> None:
+        nebula = TagFactory(name="nebula")
+        for image in AstroImageFactory.create_batch(2, celestial_object="Deep Sky"):
+            image.tags.add(nebula)
+        TagImageCount.objects.update(count=40)
+        AstroImage.objects.update(celestial_object="Landscape")
+
+        TagImageCount.objects.rebuild()
+
+        self.assert_in_sync()
+        assert self.stats("Landscape") == {"nebula": 2}
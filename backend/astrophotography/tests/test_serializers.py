@@ -2,10 +2,13 @@ from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django_countries.fields import Country
 from psycopg2.extras import DateRange
 from pytest_mock import MockerFixture
 
-from astrophotography.models import Tag
+from django.utils import translation
+
+from astrophotography.models import AstroImage, Tag
 from astrophotography.serializers import (
     AstroImageSerializer,
     AstroImageSerializerList,
@@ -21,8 +24,9 @@ from astrophotography.tests.factories import (
     MainPageLocationFactory,
     PlaceFactory,
 )
+from astrophotography.utils import get_country_names
 from common.tests.image_helpers import jpeg_field
-from core.tasks import process_image_task
+from core.tasks import process_image_task, verify_image_variant_files
 
 
 @pytest.mark.django_db
@@ -134,7 +138,7 @@ class TestAstroImageSerializers:
         assert "camera" in detail_data
 
     def test_list_serializers_omit_dead_thumbnail_urls(self) -> None:
-        """Serializers should omit dead thumbnail paths instead of exposing them."""
+        """Serializers should omit thumbnails the integrity sweep flagged as missing."""
         place = PlaceFactory()
         image = AstroImageFactory(place=place)
         process_image_task("astrophotography", "AstroImage", image.pk)
@@ -142,6 +146,7 @@ class TestAstroImageSerializers:
 
         variant = image.variants.get(role="thumbnail")
         variant.file.storage.delete(str(variant.file.name))
+        verify_image_variant_files()
 
         list_data = AstroImageSerializerList(image).data
         thumb_data = AstroImageThumbnailSerializer(image).data
@@ -301,3 +306,38 @@ class TestTagTranslationSerializers:
         # The serializer calls TranslationService.get_translation(tag, "name", "pl")
         # which should fall back to the default English translation.
         assert serializer.data["tags"][0]["name"] == "No Translation"
+
+
+@pytest.mark.django_db
+class TestCountryNameTable:
+    def test_place_country_is_named_in_requested_language(self, mocker: MockerFixture) -> None:
+        request = mocker.MagicMock()
+        place = PlaceFactory(country="PL")
+
+        request.query_params.get.return_value = "pl"
+        assert PlaceSerializer(place, context={"request": request}).data["country"] == "Polska"
+
+        request.query_params.get.return_value = None
+        assert PlaceSerializer(place, context={"request": request}).data["country"] == "Poland"
+
+    def test_serializers_do_not_resolve_names_through_gettext(self, mocker: MockerFixture) -> None:
+        request = mocker.MagicMock()
+        request.query_params.get.return_value = "pl"
+        image = AstroImageFactory(place=PlaceFactory(country="DE"))
+        get_country_names()
+        country_name = mocker.patch.object(Country, "name", new_callable=mocker.PropertyMock)
+        override = mocker.spy(translation, "override")
+
+        data = AstroImageSerializerList([image], many=True, context={"request": request}).data
+        detail = AstroImageSerializer(image, context={"request": request}).data
+
+        assert data[0]["place"]["country"] == detail["place"]["country"] == "Niemcy"
+        country_name.assert_not_called()
+        override.assert_not_called()
+
+    def test_country_maps_match_names_in_every_language(self) -> None:
+        maps = AstroImage.objects.all().get_country_maps()
+
+        assert maps["country_map"]["poland"] == "PL"
+        assert maps["country_map"]["polska"] == "PL"
+        assert maps["code_map"]["pl"] == "PL"
@@ -4,14 +4,19 @@ from typing import Any
 from unittest.mock import patch
 
 import pytest
+from celery.exceptions import Retry
 from psycopg2.extras import DateRange
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from astrophotography.image_documents import refresh_image_documents
 from astrophotography.models import (
     AstroImage,
     MainPageBackgroundImage,
@@ -19,16 +24,21 @@ from astrophotography.models import (
     Place,
     Tag,
 )
+from astrophotography.tasks import rebuild_image_documents_task
 from astrophotography.tests.factories import (
     AstroImageFactory,
+    CameraFactory,
     MainPageBackgroundImageFactory,
     MainPageLocationFactory,
     PlaceFactory,
     TagFactory,
 )
+from astrophotography.travel_slugs import NO_HIGHLIGHT, get_slug_key
 from astrophotography.utils import get_celestial_categories
+from common.cache_versioning import get_generation
 from common.constants import FALLBACK_URL_SLUG
 from common.tests.image_helpers import jpeg_field
+from common.types import CacheNamespace
 from common.utils.signing import generate_signed_url_params
 from core.models import LandingPageSettings
 from core.tasks import process_image_task
@@ -472,6 +482,81 @@ class TestTravelHighlightsBySlugView:
         assert data["images"][0]["name"] == "Tatras 1"
         assert data["images"][0]["thumbnail_url"] == thumbnail.file.url
 
+    @staticmethod
+    def add_sub_place_images(region: Place, count: int, capture_date: date) -> list[AstroImage]:
+        images: list[AstroImage] = []
+        with patch("core.models.process_image_task.delay_on_commit"):
+            for _ in range(count):
+                sub_place: Place = PlaceFactory(country="US")
+                region.sub_places.add(sub_place)
+                images.append(AstroImageFactory(place=sub_place, capture_date=capture_date))
+        return images
+
+    def test_region_page_resolves_images_in_constant_queries(self, api_client: APIClient) -> None:
+        region: Place = PlaceFactory(country="US", name="Hawaii", is_region=True)
+        slider: MainPageLocation = MainPageLocationFactory(
+            place=region,
+            is_active=True,
+            adventure_date=DateRange(date(2024, 1, 1), date(2024, 1, 31)),
+        )
+        url: str = reverse(
+            TRAVEL_BY_COUNTRY_PLACE_DATE_URL_NAME,
+            kwargs={
+                "country_slug": slider.country_slug,
+                "place_slug": slider.place_slug,
+                "date_slug": slider.date_slug,
+            },
+        )
+
+        def get_images() -> tuple[set[str], int]:
+            cache.clear()
+            with CaptureQueriesContext(connection) as context:
+                response: Response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            return {image["slug"] for image in response.json()["images"]}, len(
+                context.captured_queries
+            )
+
+        in_range: list[AstroImage] = self.add_sub_place_images(region, 1, date(2024, 1, 10))
+        slugs, baseline = get_images()
+        assert slugs == {image.slug for image in in_range}
+
+        in_range += self.add_sub_place_images(region, 3, date(2024, 1, 20))
+        self.add_sub_place_images(region, 2, date(2023, 6, 1))
+        with patch("core.models.process_image_task.delay_on_commit"):
+            picked: AstroImage = AstroImageFactory(capture_date=date(2020, 1, 1))
+        slider.images.add(picked)
+
+        slugs, queries = get_images()
+        assert slugs == {image.slug for image in [*in_range, picked]}
+        assert queries == baseline
+
+    def test_page_is_cached_per_language_until_images_change(self, api_client: APIClient) -> None:
+        place: Place = PlaceFactory(name="Lofoten", country="NO")
+        slider: MainPageLocation = MainPageLocationFactory(
+            place=place, adventure_date=DateRange(date(2024, 2, 1), date(2024, 2, 29))
+        )
+        url: str = reverse(
+            TRAVEL_BY_COUNTRY_PLACE_DATE_URL_NAME,
+            kwargs={
+                "country_slug": slider.country_slug,
+                "place_slug": slider.place_slug,
+                "date_slug": slider.date_slug,
+            },
+        )
+        assert api_client.get(url).json()["images"] == []
+
+        with CaptureQueriesContext(connection) as context:
+            response: Response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(context.captured_queries) == 0
+        assert api_client.get(url, {"lang": "pl"}).json()["place"]["country"] == "Norwegia"
+
+        with patch("core.models.process_image_task.delay_on_commit"):
+            image: AstroImage = AstroImageFactory(place=place, capture_date=date(2024, 2, 10))
+
+        assert [item["slug"] for item in api_client.get(url).json()["images"]] == [image.slug]
+
     def test_get_highlights_with_story(self, api_client: APIClient) -> None:
         """Test retrieving highlights with a story"""
 
@@ -516,6 +601,35 @@ class TestTravelHighlightsBySlugView:
         response: Response = api_client.get(url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_saved_highlight_url_is_resolved_into_slug_cache(self) -> None:
+        place: Place = PlaceFactory(name="Madeira", country="PT")
+        slider: MainPageLocation = MainPageLocationFactory(
+            place=place, adventure_date=DateRange(date(2024, 3, 1), date(2024, 3, 31))
+        )
+
+        key: str = get_slug_key(slider.country_slug, slider.place_slug, slider.date_slug)
+        assert cache.get(key) == slider.pk
+
+    def test_unknown_triple_is_cached_until_a_highlight_matches(
+        self, api_client: APIClient
+    ) -> None:
+        place: Place = PlaceFactory(name="Azores", country="PT")
+        kwargs: dict[str, str] = {
+            "country_slug": "portugal",
+            "place_slug": "azores",
+            "date_slug": "apr2024",
+        }
+        url: str = reverse(TRAVEL_BY_COUNTRY_PLACE_DATE_URL_NAME, kwargs=kwargs)
+
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+        assert cache.get(get_slug_key(**kwargs)) == NO_HIGHLIGHT
+
+        slider: MainPageLocation = MainPageLocationFactory(
+            place=place, adventure_date=DateRange(date(2024, 4, 1), date(2024, 4, 30))
+        )
+        assert (slider.country_slug, slider.place_slug, slider.date_slug) == tuple(kwargs.values())
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
     def test_inactive_slider_returns_404(self, api_client: APIClient) -> None:
         place: Place = PlaceFactory(name="Valid", country="PL")
         slider: MainPageLocation = MainPageLocationFactory(place=place, is_active=False)
@@ -800,6 +914,296 @@ class TestAstroImageViewSetCountryPlaceFiltering:
         assert len(data) >= 1
         assert any("Poland" in img["place"]["country"] for img in data)
 
+    def test_travel_param_matches_place_name_in_any_language(self, api_client: APIClient) -> None:
+        place: Place = PlaceFactory(country="PL", name="High Tatras")
+        place.set_current_language("pl")
+        place.name = "Tatry Wysokie"
+        place.save()
+        image: AstroImage = AstroImageFactory(place=place)
+        AstroImageFactory(place=PlaceFactory(country="US", name="Hawaii"))
+
+        url: str = reverse(ASTROIMAGE_LIST_URL_NAME)
+        for term in ("tatras", "TATRY", "Wysok"):
+            response: Response = api_client.get(url, {"travel": term})
+
+            assert response.status_code == status.HTTP_200_OK
+            assert [item["slug"] for item in response.json()["results"]] == [image.slug]
+
+    def test_travel_param_matches_country_codes(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(place=PlaceFactory(country="NO", name="Lofoten"))
+        AstroImageFactory(place=PlaceFactory(country="PL", name="Bieszczady"))
+
+        url: str = reverse(ASTROIMAGE_LIST_URL_NAME)
+        for term in ("no", "Norwegia", "norw"):
+            response: Response = api_client.get(url, {"travel": term})
+
+            assert [item["slug"] for item in response.json()["results"]] == [image.slug]
+
+    def test_travel_filter_uses_place_name_trigram_index(self) -> None:
+        # On near-empty test tables the planner prefers a full scan; rule plain scans
+        # out so only an index that can evaluate the LIKE condition remains.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_indexscan = off")
+
+        plan: str = AstroImage.objects.for_gallery({"travel": "tatras"}).explain()
+
+        assert "place_name_trgm_idx" in plan
+
+
+@pytest.mark.django_db
+class TestPlaceSearchView:
+    URL: str = "/v1/places/search/"
+
+    @pytest.fixture
+    def places(self) -> dict[str, Place]:
+        tatras: Place = PlaceFactory(country="PL", name="High Tatras")
+        tatras.set_current_language("pl")
+        tatras.name = "Tatry Wysokie"
+        tatras.save()
+        lesser: Place = PlaceFactory(country="PL", name="Western Tatras Valley")
+        empty: Place = PlaceFactory(country="SK", name="Tatras Lodge")
+        for place in (tatras, lesser):
+            AstroImageFactory(place=place)
+        return {"tatras": tatras, "lesser": lesser, "empty": empty}
+
+    def test_returns_places_with_images_most_similar_first(
+        self, api_client: APIClient, places: dict[str, Place]
+    ) -> None:
+        response: Response = api_client.get(self.URL, {"q": "high tatras"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"id": places["tatras"].pk, "name": "High Tatras", "country": "Poland"}
+        ]
+
+        response = api_client.get(self.URL, {"q": "tatr"})
+
+        ids: list[int] = [item["id"] for item in response.json()]
+        assert set(ids) == {places["tatras"].pk, places["lesser"].pk}
+
+    def test_names_follow_requested_language(
+        self, api_client: APIClient, places: dict[str, Place]
+    ) -> None:
+        response: Response = api_client.get(self.URL, {"q": "wysokie", "lang": "pl"})
+
+        assert response.json() == [
+            {"id": places["tatras"].pk, "name": "Tatry Wysokie", "country": "Polska"}
+        ]
+
+    @pytest.mark.parametrize("query", ["", "ta", "  t  ", "nothing-like-it"])
+    def test_short_or_unmatched_queries_return_nothing(
+        self, api_client: APIClient, places: dict[str, Place], query: str
+    ) -> None:
+        response: Response = api_client.get(self.URL, {"q": query})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_renamed_place_invalidates_cached_results(
+        self, api_client: APIClient, places: dict[str, Place]
+    ) -> None:
+        assert len(api_client.get(self.URL, {"q": "valley"}).json()) == 1
+
+        place: Place = places["lesser"]
+        place.set_current_language("en")
+        place.name = "Western Tatras"
+        place.save()
+
+        assert api_client.get(self.URL, {"q": "valley"}).json() == []
+
+
+@pytest.mark.django_db
+class TestAstroImageSearchView:
+    URL: str = "/v1/astroimages/search/"
+
+    @staticmethod
+    def slugs(response: Response) -> list[str]:
+        return [item["slug"] for item in response.json()["results"]]
+
+    def test_ranks_name_matches_above_description_matches(self, api_client: APIClient) -> None:
+        mentioned: AstroImage = AstroImageFactory(
+            name="Winter sky", description="<p>Taken next to the Orion belt.</p>"
+        )
+        named: AstroImage = AstroImageFactory(
+            name="Orion Nebula", description="<p>Two hours of data.</p>"
+        )
+        AstroImageFactory(name="Andromeda", description="<p>Neighbour galaxy.</p>")
+
+        response: Response = api_client.get(self.URL, {"q": "orion"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] == 2
+        assert self.slugs(response) == [named.slug, mentioned.slug]
+
+    def test_matches_tags_place_country_and_equipment(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(
+            name="Night",
+            description="<p>Clear skies.</p>",
+            place=PlaceFactory(country="NO", name="Lofoten"),
+            tags=[TagFactory(name="Aurora")],
+            camera=[CameraFactory(model="Sony A7S III")],
+        )
+        AstroImageFactory(name="Day", description="<p>Clouds.</p>")
+
+        for query in ("lofoten", "norway", "aurora", "a7s"):
+            response: Response = api_client.get(self.URL, {"q": query})
+
+            assert self.slugs(response) == [image.slug], query
+
+    def test_searches_requested_language_with_default_fallback(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(name="Milky Way core", description="<p>Summer.</p>")
+        image.set_current_language("pl")
+        image.name = "Jądro Drogi Mlecznej"
+        image.save()
+
+        assert self.slugs(api_client.get(self.URL, {"q": "mlecznej", "lang": "pl"})) == [image.slug]
+        assert self.slugs(api_client.get(self.URL, {"q": "mlecznej"})) == []
+        # The untranslated Polish description falls back to English
+        assert self.slugs(api_client.get(self.URL, {"q": "summer", "lang": "pl"})) == [image.slug]
+
+    def test_gallery_filters_narrow_results(self, api_client: APIClient) -> None:
+        deep_sky: AstroImage = AstroImageFactory(name="Orion", celestial_object="Deep Sky")
+        AstroImageFactory(name="Orion over the lake", celestial_object="Landscape")
+
+        response: Response = api_client.get(self.URL, {"q": "orion", "filter": "Deep Sky"})
+
+        assert self.slugs(response) == [deep_sky.slug]
+
+    def test_blank_query_returns_empty_page(self, api_client: APIClient) -> None:
+        AstroImageFactory(name="Orion")
+
+        response: Response = api_client.get(self.URL, {"q": "  "})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] == 0
+
+    def test_renamed_tag_is_reindexed(self, api_client: APIClient) -> None:
+        tag: Tag = TagFactory(name="Comet")
+        image: AstroImage = AstroImageFactory(name="Night", tags=[tag])
+        assert self.slugs(api_client.get(self.URL, {"q": "neowise"})) == []
+
+        tag.set_current_language("en")
+        tag.name = "Neowise"
+        tag.save()
+
+        assert self.slugs(api_client.get(self.URL, {"q": "neowise"})) == [image.slug]
+
+    def test_search_uses_vector_index(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan: str = AstroImage.objects.search("orion", "en").explain()
+
+        assert "astroimage_search_vector_idx" in plan
+
+
+@pytest.mark.django_db
+class TestAstroImageDocuments:
+    URL: str = "/v1/astroimages/"
+
+    def get_list(self, api_client: APIClient, **params: str) -> tuple[list[dict[str, Any]], int]:
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response: Response = api_client.get(self.URL, params)
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()["results"], len(context.captured_queries)
+
+    def test_list_page_reads_documents_in_constant_queries(self, api_client: APIClient) -> None:
+        AstroImageFactory(tags=[TagFactory()], camera=[CameraFactory()])
+        _, baseline = self.get_list(api_client)
+
+        AstroImageFactory.create_batch(4, tags=[TagFactory()], camera=[CameraFactory()])
+        results, queries = self.get_list(api_client)
+
+        assert len(results) == 5
+        assert queries == baseline
+
+    def test_documents_follow_requested_language(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(name="Milky Way core")
+        image.set_current_language("pl")
+        image.name = "Jądro Drogi Mlecznej"
+        image.save()
+
+        assert image.documents.count() == 2
+        assert self.get_list(api_client)[0][0]["name"] == "Milky Way core"
+        assert self.get_list(api_client, lang="pl")[0][0]["name"] == "Jądro Drogi Mlecznej"
+
+    @pytest.mark.parametrize("params", [{}, {"lang": "pl"}])
+    def test_documents_match_live_serializer_output(
+        self, api_client: APIClient, params: dict[str, str]
+    ) -> None:
+        image: AstroImage = AstroImageFactory(
+            name="Orion", description="<p>&nbsp;</p>", tags=[TagFactory()]
+        )
+        image.set_current_language("pl")
+        image.name = "Orion po polsku"
+        image.save()
+
+        stored, _ = self.get_list(api_client, **params)
+        stored_detail = api_client.get(f"{self.URL}{image.slug}/", params).json()
+        image.documents.all().delete()
+        cache.clear()
+        live, _ = self.get_list(api_client, **params)
+        live_detail = api_client.get(f"{self.URL}{image.slug}/", params).json()
+
+        assert stored == live
+        assert stored_detail == live_detail
+
+    def test_detail_is_served_from_document(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(name="Orion")
+        image.documents.update(detail_payload={"slug": image.slug, "name": "Stored"})
+
+        response: Response = api_client.get(f"{self.URL}{image.slug}/")
+
+        assert response.json() == {"slug": image.slug, "name": "Stored"}
+
+    def test_failed_rebuild_still_clears_the_gallery_cache(self) -> None:
+        astro: int = get_generation(CacheNamespace.ASTRO)
+
+        with (
+            patch(
+                "astrophotography.image_documents.rebuild_image_documents",
+                side_effect=DatabaseError("rebuild failed"),
+            ),
+            patch("astrophotography.tasks.invalidate_frontend_ssr_cache_task.delay") as mock_ssr,
+            pytest.raises(Retry),
+        ):
+            rebuild_image_documents_task.delay(["1"])
+
+        assert get_generation(CacheNamespace.ASTRO) == astro + 1
+        mock_ssr.assert_called_once_with(["latest-astro-images"])
+
+    @pytest.mark.django_db(transaction=True)
+    def test_rolled_back_changes_are_not_rebuilt_by_the_next_commit(self) -> None:
+        def queue_and_roll_back() -> None:
+            with transaction.atomic():
+                refresh_image_documents(["rolled-back"])
+                raise RuntimeError("rolled back")
+
+        with (
+            patch(
+                "django.db.transaction.on_commit",
+                side_effect=lambda func: transaction.get_connection().on_commit(func),
+            ),
+            patch("astrophotography.image_documents.rebuild_image_documents_task.delay") as mock,
+        ):
+            with pytest.raises(RuntimeError):
+                queue_and_roll_back()
+            with transaction.atomic():
+                refresh_image_documents(["committed"])
+
+        mock.assert_called_once_with(["committed"])
+
+    def test_images_without_documents_are_rendered_live(self, api_client: APIClient) -> None:
+        image: AstroImage = AstroImageFactory(name="Orion")
+        image.documents.all().delete()
+
+        results, _ = self.get_list(api_client)
+
+        assert [item["slug"] for item in results] == [image.slug]
+        assert results[0]["name"] == "Orion"
+
 
 @pytest.mark.django_db
 class TestAstroImageSecureView:
@@ -842,14 +1246,13 @@ class TestAstroImageSecureView:
         assert response["Cache-Control"] == "private, no-store, max-age=0"
         assert response["X-Accel-Redirect"] == f"/protected_media/{original_format.file.name}"
 
-    def test_astro_image_secure_view_requires_original_source_even_when_variant_exists(
+    def test_astro_image_secure_view_serves_stored_variant_without_statting_storage(
         self, api_client: APIClient
     ) -> None:
         with patch("core.models.process_image_task.delay_on_commit"):
             astro_image = AstroImageFactory(original=jpeg_field("missing-source.jpg"))
-        original_name = astro_image.original.name
-        astro_image.original.storage.delete(original_name)
-        ImageVariantFactory(
+        astro_image.original.storage.delete(astro_image.original.name)
+        variant = ImageVariantFactory(
             image=astro_image,
             file__filename="restored-original-format.webp",
             role="original_format",
@@ -860,6 +1263,23 @@ class TestAstroImageSecureView:
         url: str = reverse("astroimages:secure-image-serve", args=[astro_image.slug])
         params: dict[str, Any] = generate_signed_url_params(astro_image.slug)
 
+        with patch("core.models.file_exists_in_storage") as mock_exists:
+            response: Response = api_client.get(url, params)
+
+        mock_exists.assert_not_called()
+        assert response.status_code == status.HTTP_200_OK
+        assert response["X-Accel-Redirect"] == f"/protected_media/{variant.file.name}"
+
+    def test_astro_image_secure_view_without_variant_requires_original_source(
+        self, api_client: APIClient
+    ) -> None:
+        with patch("core.models.process_image_task.delay_on_commit"):
+            astro_image = AstroImageFactory(original=jpeg_field("missing-source.jpg"))
+        astro_image.original.storage.delete(astro_image.original.name)
+
+        url: str = reverse("astroimages:secure-image-serve", args=[astro_image.slug])
+        params: dict[str, Any] = generate_signed_url_params(astro_image.slug)
+
         response: Response = api_client.get(url, params)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -951,3 +1371,202 @@ class TestAstroImageAdminSecureMediaView:
         )
         response = admin_client.get(url)
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestVariantUrlQueryCounts:
+    """Variant URLs are resolved from one prefetch, so queries do not grow with the page."""
+
+    @staticmethod
+    def create_images(count: int, **kwargs: Any) -> list[AstroImage]:
+        with patch("core.models.process_image_task.delay_on_commit"):
+            images: list[AstroImage] = AstroImageFactory.create_batch(count, **kwargs)
+        for image in images:
+            ImageVariantFactory(image=image, role="thumbnail", width=560)
+            ImageVariantFactory(image=image, role="thumbnail", width=320)
+        return images
+
+    @staticmethod
+    def count_queries(api_client: APIClient, url: str) -> int:
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response: Response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(context.captured_queries)
+
+    def test_gallery_list(self, api_client: APIClient) -> None:
+        url: str = reverse(ASTROIMAGE_LIST_URL_NAME)
+        self.create_images(1)
+        baseline: int = self.count_queries(api_client, url)
+
+        self.create_images(4)
+
+        assert self.count_queries(api_client, url) == baseline
+
+    def test_travel_highlights_list(self, api_client: APIClient) -> None:
+        url: str = reverse(TRAVEL_HIGHLIGHTS_LIST_URL_NAME)
+        place: Place = PlaceFactory(country="PL")
+        slider: MainPageLocation = MainPageLocationFactory(place=place)
+        slider.images.add(*self.create_images(1, place=place))
+        baseline: int = self.count_queries(api_client, url)
+
+        slider.images.add(*self.create_images(4, place=place))
+
+        assert self.count_queries(api_client, url) == baseline
+
+    def test_travel_highlight_detail(self, api_client: APIClient) -> None:
+        place: Place = PlaceFactory(country="PL")
+        slider: MainPageLocation = MainPageLocationFactory(
+            place=place, adventure_date=DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        )
+        slider.images.add(*self.create_images(1, place=place))
+        url: str = reverse(
+            TRAVEL_BY_COUNTRY_PLACE_DATE_URL_NAME,
+            kwargs={
+                "country_slug": slider.country_slug,
+                "place_slug": slider.place_slug,
+                "date_slug": slider.date_slug,
+            },
+        )
+        baseline: int = self.count_queries(api_client, url)
+
+        slider.images.add(*self.create_images(4, place=place))
+
+        assert self.count_queries(api_client, url) == baseline
+
+    def test_prefetched_variants_keep_the_preferred_width(self) -> None:
+        image: AstroImage = self.create_images(1)[0]
+
+        prefetched: AstroImage = AstroImage.objects.prefetch_related("variants").get(pk=image.pk)
+        with CaptureQueriesContext(connection) as context:
+            url: str | None = prefetched.get_available_variant_url("thumbnail", preferred_width=320)
+
+        assert context.captured_queries == []
+        assert url == image.variants.get(role="thumbnail", width=320).file.url
+
+
+@pytest.mark.django_db
+class TestGalleryCursorPagination:
+    """``?pagination=cursor`` pages by keyset and reports the cached gallery counters."""
+
+    def walk(self, api_client: APIClient, **params: Any) -> tuple[list[str], int]:
+        """Follow ``next`` links and return the slugs in page order and the reported count."""
+        page = api_client.get(
+            reverse(ASTROIMAGE_LIST_URL_NAME), {"pagination": "cursor", **params}
+        ).json()
+        slugs: list[str] = [item["slug"] for item in page["results"]]
+        count: int = page["count"]
+        while page["next"]:
+            page = api_client.get(page["next"]).json()
+            slugs.extend(item["slug"] for item in page["results"])
+            assert page["count"] == count
+        return slugs, count
+
+    def test_pages_follow_created_at_and_pk_order(self, api_client: APIClient) -> None:
+        images: list[AstroImage] = AstroImageFactory.create_batch(7)
+        # Equal timestamps must still page deterministically through the pk tie-breaker
+        AstroImage.objects.filter(pk__in=[image.pk for image in images[:4]]).update(
+            created_at=timezone.now()
+        )
+
+        slugs, count = self.walk(api_client, limit=2)
+
+        expected = list(
+            AstroImage.objects.order_by("-created_at", "-pk").values_list("slug", flat=True)
+        )
+        assert slugs == expected
+        assert count == 7
+
+    def test_tied_timestamps_across_page_boundary_neither_skip_nor_repeat(
+        self, api_client: APIClient
+    ) -> None:
+        AstroImageFactory.create_batch(5)
+        tied_at = timezone.now()
+        AstroImage.objects.update(created_at=tied_at)
+        ordered: list[str] = list(AstroImage.objects.order_by("-pk").values_list("slug", flat=True))
+
+        first = api_client.get(
+            reverse(ASTROIMAGE_LIST_URL_NAME), {"pagination": "cursor", "limit": 2}
+        ).json()
+        assert [item["slug"] for item in first["results"]] == ordered[:2]
+
+        # A newer row with the same timestamp sorts ahead of the cursor and must not shift it
+        newer: AstroImage = AstroImageFactory()
+        AstroImage.objects.filter(pk=newer.pk).update(created_at=tied_at)
+        # Removing a row already shown must not shift it either
+        AstroImage.objects.filter(slug=ordered[0]).delete()
+
+        second = api_client.get(first["next"]).json()
+        assert [item["slug"] for item in second["results"]] == ordered[2:4]
+
+        previous = api_client.get(second["previous"]).json()
+        assert [item["slug"] for item in previous["results"]] == [newer.slug, ordered[1]]
+        assert previous["previous"] is None
+
+    def test_pages_do_not_count_or_offset(self, api_client: APIClient) -> None:
+        AstroImageFactory.create_batch(5)
+        first = api_client.get(
+            reverse(ASTROIMAGE_LIST_URL_NAME), {"pagination": "cursor", "limit": 2}
+        ).json()
+        second = api_client.get(first["next"]).json()
+
+        # The third page is a cache miss; only the gallery counter is warm
+        with CaptureQueriesContext(connection) as context:
+            third = api_client.get(second["next"]).json()
+
+        sql = " ".join(query["sql"] for query in context.captured_queries).upper()
+        assert "COUNT(" not in sql
+        assert "OFFSET" not in sql
+        assert third["count"] == 5
+        assert len(third["results"]) == 1
+
+    def test_counters_follow_writes(self, api_client: APIClient) -> None:
+        images: list[AstroImage] = AstroImageFactory.create_batch(3, celestial_object="Deep Sky")
+        assert self.walk(api_client)[1] == 3
+        assert self.walk(api_client, filter="Deep Sky")[1] == 3
+        assert self.walk(api_client, filter="Landscape")[1] == 0
+
+        AstroImageFactory(celestial_object="Landscape")
+        images[0].celestial_object = "Landscape"
+        images[0].save()
+        images[1].delete()
+
+        with CaptureQueriesContext(connection) as context:
+            assert self.walk(api_client)[1] == 3
+            assert self.walk(api_client, filter="Deep Sky")[1] == 1
+            assert self.walk(api_client, filter="Landscape")[1] == 2
+        assert "COUNT(" not in " ".join(q["sql"] for q in context.captured_queries).upper()
+
+    @pytest.mark.parametrize("category", ["deep sky", "Deep-Sky", "deep-sky"])
+    def test_category_variants_are_not_counted_as_the_category(
+        self, api_client: APIClient, category: str
+    ) -> None:
+        AstroImageFactory.create_batch(2, celestial_object="Deep Sky")
+        assert self.walk(api_client, filter="Deep Sky")[1] == 2
+
+        slugs, count = self.walk(api_client, filter=category)
+
+        assert slugs == []
+        assert count == 0
+
+    def test_filtered_count_matches_page_mode(self, api_client: APIClient) -> None:
+        tag: Tag = TagFactory(name="comet")
+        tagged: list[AstroImage] = AstroImageFactory.create_batch(3)
+        AstroImageFactory.create_batch(2)
+        for image in tagged:
+            image.tags.add(tag)
+
+        slugs, count = self.walk(api_client, tag=tag.slug, limit=2)
+        page_mode = api_client.get(reverse(ASTROIMAGE_LIST_URL_NAME), {"tag": tag.slug}).json()
+
+        assert count == page_mode["count"] == 3
+        assert sorted(slugs) == sorted(image.slug for image in tagged)
+
+    def test_page_mode_is_unchanged(self, api_client: APIClient) -> None:
+        AstroImageFactory.create_batch(3)
+
+        data = api_client.get(reverse(ASTROIMAGE_LIST_URL_NAME), {"limit": 2}).json()
+
+        assert data["count"] == 3
+        assert "page=2" in data["next"]
+        assert "cursor=" not in data["next"]
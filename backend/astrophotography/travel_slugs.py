@@ -0,0 +1,67 @@
+"""Cached slug-triple to pk resolution for the slug-based travel highlight page.
+
+``TravelHighlightsBySlugView`` is addressed by ``/<country>/<place>/<date>/``.
+Matching a triple takes slug equality plus an ``adventure_date`` overlap with
+the month parsed from the date slug, so the resolved pk is kept in the cache:
+
+- after a ``MainPageLocation`` save commits, the highlight's canonical triple
+  is resolved and stored, so its public URL never takes the cold path;
+- any other triple (a month inside a longer trip, an unknown slug) is resolved
+  once with the GiST-indexed query and stored, misses included;
+- keys carry the ``travel`` cache generation, so every travel invalidation
+  (highlight or place changes) retires all entries at once.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.cache_versioning import get_generation
+from common.types import CacheNamespace
+
+if TYPE_CHECKING:
+    from .models import MainPageLocationQuerySet
+
+logger = logging.getLogger("core.cache")
+
+SLUG_KEY_PREFIX = "travel_slug"
+# Stored for triples without a highlight; BigAutoField pks start at 1
+NO_HIGHLIGHT = 0
+
+
+def get_slug_key(country_slug: str, place_slug: str, date_slug: str) -> str:
+    """Return the cache key of one slug triple in the current travel generation."""
+    generation = get_generation(CacheNamespace.TRAVEL)
+    return f"{SLUG_KEY_PREFIX}:{generation}:{country_slug}:{place_slug}:{date_slug}"
+
+
+def _query_highlight_pk(
+    queryset: MainPageLocationQuerySet, country_slug: str, place_slug: str, date_slug: str
+) -> int | None:
+    pks = list(
+        queryset.by_slugs(country_slug, place_slug, date_slug).values_list("pk", flat=True)[:2]
+    )
+    # Ambiguous triples resolve to nothing, like a missing one
+    return pks[0] if len(pks) == 1 else None
+
+
+def resolve_highlight_pk(
+    queryset: MainPageLocationQuerySet, country_slug: str, place_slug: str, date_slug: str
+) -> int | None:
+    """Return the pk of the highlight in ``queryset`` addressed by a slug triple, if any."""
+    try:
+        key = get_slug_key(country_slug, place_slug, date_slug)
+        pk = cache.get(key)
+        if pk is None:
+            pk = _query_highlight_pk(queryset, country_slug, place_slug, date_slug)
+            cache.set(key, NO_HIGHLIGHT if pk is None else pk, settings.INFINITE_CACHE_TIMEOUT)
+        return int(pk) or None
+    except Exception as exc:
+        logger.warning(
+            f"Travel slug cache failed for {country_slug}/{place_slug}/{date_slug}: {exc}"
+        )
+        return _query_highlight_pk(queryset, country_slug, place_slug, date_slug)
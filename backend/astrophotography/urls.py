@@ -9,6 +9,7 @@ from .views import (
     ImageURLViewSet,
     MainPageBackgroundImageView,
     MainPageLocationViewSet,
+    PlaceSearchView,
     TagsView,
     TravelHighlightsBySlugView,
 )
@@ -36,6 +37,7 @@ urlpatterns = [
         TravelHighlightsBySlugView.as_view(),
         name="travel-by-country-place-date",
     ),
+    path("places/search/", PlaceSearchView.as_view(), name="place-search"),
     path(
         "categories/",
         CelestialObjectCategoriesView.as_view(),
@@ -1,7 +1,57 @@
 # backend/astrophotography/utils.py
-from astrophotography.constants import CELESTIAL_OBJECT_CHOICES
+from functools import lru_cache
+
+from django_countries import countries
+
+from django.conf import settings
+from django.utils import translation
+
+from astrophotography.constants import (
+    CELESTIAL_OBJECT_CHOICES,
+    DEFAULT_SEARCH_CONFIG,
+    SEARCH_CONFIGS,
+)
 
 
 def get_celestial_categories() -> list[str]:
     """Provide the list of celestial object categories."""
     return [choice[0] for choice in CELESTIAL_OBJECT_CHOICES]
+
+
+def get_search_config(language: str) -> str:
+    """Return the Postgres text search configuration used for ``language``."""
+    return SEARCH_CONFIGS.get(language, DEFAULT_SEARCH_CONFIG)
+
+
+@lru_cache(maxsize=1)
+def get_country_names() -> dict[str, dict[str, str]]:
+    """
+    Return ``{language: {country_code: name}}`` for every language in ``settings.LANGUAGES``.
+
+    Resolving ``Country.name`` goes through gettext under ``translation.override``
+    each time; the table is built once per process instead, so serializers and
+    travel filters only do dictionary lookups.
+    """
+    names: dict[str, dict[str, str]] = {}
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            names[language] = {code: str(name) for code, name in countries}
+    return names
+
+
+def get_country_name(country: object, language: str | None = None) -> str:
+    """
+    Return the name of a country code (or ``Country``) in ``language``.
+
+    Defaults to the active language, like ``Country.name``. Languages outside
+    ``settings.LANGUAGES`` fall back to django-countries.
+    """
+    code = str(country or "")
+    if not code:
+        return ""
+    language = language or translation.get_language() or settings.DEFAULT_APP_LANGUAGE
+    table = get_country_names().get(language)
+    if table is not None and code in table:
+        return table[code]
+    with translation.override(language):
+        return str(countries.name(code))
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from typing import Any, cast
 
 from rest_framework import status
@@ -17,33 +18,87 @@ from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext_lazy as _
 
+from common.cache_params import (
+    LANGUAGE_ONLY,
+    choice_param,
+    flag_param,
+    language_param,
+    page_param,
+    page_size_param,
+    text_param,
+)
 from common.decorators.cache import cache_response
 from common.throttling import GalleryRateThrottle
-from common.utils.image import file_exists_in_storage
+from common.types import CacheNamespace
 from common.utils.signing import generate_signed_url_params
 from core.views import GenericAdminSecureMediaView, SecureMediaView
 
 from .constants import CELESTIAL_OBJECT_CHOICES
-from .models import AstroImage, MainPageBackgroundImage, MainPageLocation, Tag
-from .pagination import AstroImagePagination
+from .image_documents import DETAIL_SHAPE, LIST_SHAPE, get_image_payloads
+from .models import (
+    AstroImage,
+    AstroImageQuerySet,
+    MainPageBackgroundImage,
+    MainPageLocation,
+    Place,
+    Tag,
+)
+from .pagination import (
+    CURSOR_MODE,
+    PAGINATION_MODE_PARAM,
+    AstroImagePagination,
+    AstroImageSearchPagination,
+)
 from .serializers import (
     AstroImageSerializer,
     AstroImageSerializerList,
     MainPageBackgroundImageSerializer,
     MainPageLocationSerializer,
+    PlaceSerializer,
     TagSerializer,
     TravelHighlightDetailSerializer,
 )
+from .travel_slugs import resolve_highlight_pk
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-
-@method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT), name="dispatch")
+category_param = choice_param(choice for choice, _ in CELESTIAL_OBJECT_CHOICES)
+
+GALLERY_CACHE_PARAMS = {
+    "lang": language_param,
+    "filter": category_param,
+    "tag": text_param(),
+    "travel": text_param(),
+    "country": text_param(),
+    "place": text_param(),
+    "page": page_param,
+    "limit": page_size_param(AstroImagePagination.page_size, AstroImagePagination.max_page_size),
+    PAGINATION_MODE_PARAM: choice_param([CURSOR_MODE]),
+    "cursor": text_param(max_length=200),
+    "q": text_param(),
+}
+TAGS_CACHE_PARAMS = {"lang": language_param, "filter": category_param, "latest": flag_param}
+PLACE_SEARCH_CACHE_PARAMS = {"lang": language_param, "q": text_param()}
+
+
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.ASTRO,
+        query_params=GALLERY_CACHE_PARAMS,
+        version_etag=True,
+    ),
+    name="dispatch",
+)
 class AstroImageViewSet(ReadOnlyModelViewSet):
     """
     ViewSet for listing and retrieving astrophotography images.
     Supports filtering by celestial_object via 'filter' query parameter.
 
+    Pages are assembled from the precomputed ``AstroImageDocument`` payloads:
+    the filtered queryset only selects and orders images, and their rendered
+    list or detail payloads are read in one query per page.
+
     Note: Caching is safe because URLs are publicly served by Nginx.
     """
 
@@ -52,25 +107,70 @@ class AstroImageViewSet(ReadOnlyModelViewSet):
     pagination_class = AstroImagePagination
 
     def get_queryset(self) -> QuerySet[AstroImage]:
-        """Returns the filtered queryset of images."""
-        return cast(QuerySet[AstroImage], AstroImage.objects.for_gallery(self.request.query_params))
+        """Returns the filtered queryset of images, without their relations."""
+        return cast(
+            QuerySet[AstroImage], AstroImage.objects.filter_gallery(self.request.query_params)
+        )
 
     def get_serializer_class(self) -> type[AstroImageSerializerList] | type[AstroImageSerializer]:
         """Determines which serializer to use based on the action."""
-        if self.action in ["list", "latest"]:
+        if self.action in ["list", "latest", "search"]:
             return AstroImageSerializerList
         return AstroImageSerializer
 
-    @method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT))
+    def get_language(self) -> str:
+        """Returns the site language requested with ``?lang=``, or the default one."""
+        return (
+            language_param(self.request.query_params.get("lang", ""))
+            or settings.DEFAULT_APP_LANGUAGE
+        )
+
+    def render_images(self, images: Iterable[AstroImage], shape: str) -> list[dict[str, Any]]:
+        """Returns the stored ``shape`` payloads of ``images`` in the requested language."""
+        return get_image_payloads(
+            list(images), self.get_language(), shape, self.get_serializer_context()
+        )
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Returns one page of the filtered gallery."""
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        return self.get_paginated_response(self.render_images(page or [], LIST_SHAPE))
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Returns the detail payload of one image."""
+        return Response(self.render_images([self.get_object()], DETAIL_SHAPE)[0])
+
+    # Cached by the class-level dispatch decorator like every other action
     @action(detail=False, methods=["get"])
     def latest(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Returns the 9 most recent images for the main page preview."""
         queryset = self.get_queryset().latest()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(self.render_images(queryset, LIST_SHAPE))
 
-
-@method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT), name="dispatch")
+    @action(detail=False, methods=["get"])
+    def search(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Returns gallery images matching ``?q=`` in the ``?lang=`` search documents,
+        best match first. The gallery filters narrow the results as in ``list``.
+        """
+        query: str = request.query_params.get("q", "").strip()
+        gallery = cast(AstroImageQuerySet, self.get_queryset())
+        queryset: QuerySet = gallery.search(query, self.get_language()) if query else gallery.none()
+
+        paginator = AstroImageSearchPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        return paginator.get_paginated_response(self.render_images(page or [], LIST_SHAPE))
+
+
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.ASTRO,
+        query_params=LANGUAGE_ONLY,
+        version_etag=True,
+    ),
+    name="dispatch",
+)
 class MainPageBackgroundImageView(ViewSet):
     """View to retrieve the most recent background image for the main page."""
 
@@ -79,7 +179,9 @@ class MainPageBackgroundImageView(ViewSet):
 
     def list(self, request: Request) -> Response:
         """Returns the URL of the most recent background image."""
-        queryset = MainPageBackgroundImage.objects.order_by("-created_at")
+        queryset = MainPageBackgroundImage.objects.prefetch_related("variants").order_by(
+            "-created_at"
+        )
         for instance in queryset:
             if MainPageBackgroundImageSerializer(instance, context={"request": request}).data[
                 "url"
@@ -91,7 +193,14 @@ class MainPageBackgroundImageView(ViewSet):
         return Response({"url": None})
 
 
-@method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT), name="dispatch")
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.TRAVEL,
+        query_params=LANGUAGE_ONLY,
+    ),
+    name="dispatch",
+)
 class MainPageLocationViewSet(ReadOnlyModelViewSet):
     """
     ViewSet for listing active Main Page Location Sliders.
@@ -107,6 +216,14 @@ class MainPageLocationViewSet(ReadOnlyModelViewSet):
         return cast(QuerySet[MainPageLocation], MainPageLocation.objects.ready_for_main_page())
 
 
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.TRAVEL,
+        query_params=LANGUAGE_ONLY,
+    ),
+    name="dispatch",
+)
 class TravelHighlightsBySlugView(APIView):
     """
     Retrieve travel highlights by country, place, and date slugs.
@@ -115,6 +232,10 @@ class TravelHighlightsBySlugView(APIView):
 
     URL pattern:
       /travel/{country}/{place}/{date_slug}/
+
+    The cache key carries the path, so every slug triple and language is cached
+    separately until the next ``travel`` invalidation. Misses resolve the triple
+    to a pk through ``astrophotography.travel_slugs``.
     """
 
     permission_classes = [AllowAny]
@@ -130,13 +251,18 @@ class TravelHighlightsBySlugView(APIView):
         """
         Retrieves highlight details by delegating to the model layer.
         """
+        pk = resolve_highlight_pk(
+            MainPageLocation.objects.active(), country_slug, place_slug, date_slug
+        )
         try:
+            if pk is None:
+                raise MainPageLocation.DoesNotExist
             highlight = (
                 MainPageLocation.objects.active()
-                .by_slugs(country_slug, place_slug, date_slug)
-                .with_images()
-                .prefetch_related("translations")
-                .get()
+                .with_place()
+                .select_related("background_image")
+                .prefetch_related("translations", "place__translations")
+                .get(pk=pk)
             )
         except MainPageLocation.DoesNotExist:
             return Response(
@@ -150,7 +276,15 @@ class TravelHighlightsBySlugView(APIView):
         return Response(serializer.data)
 
 
-@method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT), name="dispatch")
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.ASTRO,
+        query_params=TAGS_CACHE_PARAMS,
+        version_etag=True,
+    ),
+    name="dispatch",
+)
 class TagsView(ViewSet):
     """
     ViewSet to return all tags currently associated with AstroImages.
@@ -174,6 +308,42 @@ class TagsView(ViewSet):
         return Response(serializer.data)
 
 
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.ASTRO,
+        query_params=PLACE_SEARCH_CACHE_PARAMS,
+        version_etag=True,
+    ),
+    name="dispatch",
+)
+class PlaceSearchView(APIView):
+    """
+    Autocomplete for the gallery travel filter: places with images whose name
+    (in any language) contains ``?q=``, most similar first.
+    """
+
+    # Shorter terms yield no trigram, so the index cannot narrow the scan
+    MIN_QUERY_LENGTH = 3
+    MAX_RESULTS = 10
+
+    permission_classes = [AllowAny]
+    throttle_classes = [GalleryRateThrottle, UserRateThrottle]
+    serializer_class = PlaceSerializer
+
+    def get(self, request: Request) -> Response:
+        """Returns up to ``MAX_RESULTS`` matching places."""
+        query: str = request.query_params.get("q", "").strip()
+        if len(query) < self.MIN_QUERY_LENGTH:
+            return Response([])
+
+        places: QuerySet[Place] = Place.objects.search(query)[: self.MAX_RESULTS]
+        serializer: PlaceSerializer = self.serializer_class(
+            places, many=True, context={"request": request}
+        )
+        return Response(serializer.data)
+
+
 class CelestialObjectCategoriesView(APIView):
     """
     View to return the list of available celestial object categories (choices).
@@ -182,7 +352,14 @@ class CelestialObjectCategoriesView(APIView):
     permission_classes = [AllowAny]
     throttle_classes = [GalleryRateThrottle, UserRateThrottle]
 
-    @method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT))
+    @method_decorator(
+        cache_response(
+            timeout=settings.INFINITE_CACHE_TIMEOUT,
+            namespace=CacheNamespace.ASTRO,
+            query_params=LANGUAGE_ONLY,
+            version_etag=True,
+        )
+    )
     def get(self, request: Request) -> Response:
         """Returns the list of available categories."""
         categories: list[str] = [choice[0] for choice in CELESTIAL_OBJECT_CHOICES]
@@ -199,27 +376,28 @@ class AstroImageSecureView(SecureMediaView):
     def get_variant_file_path(self, obj: AstroImage) -> str:
         """Return the best generated display variant for signed frontend viewing."""
         variants = (
-            obj.variants.filter(role__in=self.secure_variant_roles)
-            .exclude(file="")
+            obj.variants.available()
+            .filter(role__in=self.secure_variant_roles)
             .order_by("role", "-width")
         )
         for role in self.secure_variant_roles:
             for variant in variants:
-                if variant.role == role and file_exists_in_storage(variant.file):
+                if variant.role == role:
                     return str(variant.file.name)
         return ""
 
     def get_file_path(self, obj: Model) -> str:
+        """
+        Serve the stored display variant, trusting its persisted ``file_missing``
+        flag; storage is only checked for the original when no variant is usable.
+        """
         assert isinstance(obj, AstroImage)
-        serving_field = obj.get_original_image()
-        if not serving_field:
-            return ""
-
         variant_file_path = self.get_variant_file_path(obj)
         if variant_file_path:
             return variant_file_path
 
-        return str(serving_field.name)
+        serving_field = obj.get_original_image()
+        return str(serving_field.name) if serving_field else ""
 
     def get_signature_id(self) -> str:
         return str(self.kwargs.get("slug", ""))
@@ -0,0 +1,100 @@
+"""Approximate request counts for cached API responses.
+
+When cache warming is driven by traffic (``API_CACHE_WARM_SOURCE = "hits"``),
+``cache_response`` samples the GET requests it serves and counts them per
+request target. After an invalidation the warmer re-renders the most requested
+targets first. Counting is sampled and best-effort: lost increments only make
+the ranking slightly less precise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.types import CacheNamespace, CacheWarmSource
+
+logger = logging.getLogger("core.cache")
+
+HIT_COUNT_KEY_PREFIX = "api_cache_hits"
+
+
+def get_targets_key(namespace: CacheNamespace) -> str:
+    """Return the cache key holding the known request targets of a namespace."""
+    return f"{HIT_COUNT_KEY_PREFIX}:{namespace}:targets"
+
+
+def get_count_key(namespace: CacheNamespace, target_id: str) -> str:
+    """Return the cache key holding the sampled request count of one target."""
+    return f"{HIT_COUNT_KEY_PREFIX}:{namespace}:{target_id}"
+
+
+def get_target_id(target: dict[str, Any]) -> str:
+    """Return a stable identifier for a request target."""
+    return hashlib.md5(json.dumps(target, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def is_hit_tracking_enabled() -> bool:
+    """Return True when cache warming ranks targets by recorded traffic."""
+    return bool(
+        settings.API_CACHE_WARM_ENABLED and settings.API_CACHE_WARM_SOURCE == CacheWarmSource.HITS
+    )
+
+
+def record_hit(namespace: CacheNamespace, target: dict[str, Any]) -> None:
+    """
+    Count one sampled request for a target, registering the target on first sight.
+
+    Counting never fails the request it samples: cache errors are logged.
+    """
+    if random.random() >= settings.API_CACHE_HIT_SAMPLE_RATE:  # noqa: S311
+        return
+
+    try:
+        _count_hit(namespace, target)
+    except Exception as exc:
+        logger.warning(f"Failed to record cache hit [Namespace: {namespace}]: {exc}")
+
+
+def _count_hit(namespace: CacheNamespace, target: dict[str, Any]) -> None:
+    target_id = get_target_id(target)
+    count_key = get_count_key(namespace, target_id)
+    try:
+        cache.incr(count_key)
+        return
+    except ValueError:
+        pass
+
+    targets_key = get_targets_key(namespace)
+    targets: dict[str, dict[str, Any]] = cache.get(targets_key) or {}
+    if target_id not in targets:
+        # Bound the registry so arbitrary query strings cannot grow it forever
+        if len(targets) >= settings.API_CACHE_HIT_MAX_TARGETS:
+            return
+        targets[target_id] = target
+        cache.set(targets_key, targets, settings.INFINITE_CACHE_TIMEOUT)
+    cache.add(count_key, 1, settings.INFINITE_CACHE_TIMEOUT)
+
+
+def get_hot_targets(namespace: CacheNamespace, limit: int) -> list[dict[str, Any]]:
+    """Return up to ``limit`` recorded targets of a namespace, most requested first."""
+    targets: dict[str, dict[str, Any]] = cache.get(get_targets_key(namespace)) or {}
+    if not targets:
+        return []
+
+    counts = cache.get_many([get_count_key(namespace, target_id) for target_id in targets])
+    ranked = sorted(
+        (
+            (int(counts[get_count_key(namespace, target_id)]), target_id)
+            for target_id in targets
+            if get_count_key(namespace, target_id) in counts
+        ),
+        reverse=True,
+    )
+    return [targets[target_id] for _, target_id in ranked[:limit]]
@@ -0,0 +1,134 @@
+"""In-process metrics for the API response cache.
+
+``cache_response`` and ``CacheService`` record counters (hits, misses, 304s,
+stale serves, ...) and histograms (recompute time, payload bytes, invalidation
+duration) keyed by key prefix and route. Each process aggregates them in memory
+and, at most every ``API_CACHE_METRICS_INTERVAL`` seconds, flushes one record per
+key prefix and route to the ``core.cache.metrics`` logger. The JSON formatter in
+``common.utils.logging`` turns the ``extra`` fields into top-level JSON keys, so
+the log pipeline can sum them across workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger("core.cache.metrics")
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAM_BUCKETS = {
+    "recompute_seconds": SECONDS_BUCKETS,
+    "payload_bytes": BYTES_BUCKETS,
+    "invalidation_seconds": SECONDS_BUCKETS,
+}
+
+type MetricLabels = tuple[str, str]
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    buckets: tuple[float, ...]
+    bucket_counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+
+    def as_fields(self, name: str) -> dict[str, int | float]:
+        fields: dict[str, int | float] = {f"{name}_count": self.count, f"{name}_sum": self.total}
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts, strict=True):
+            cumulative += bucket_count
+            fields[f"{name}_le_{bound:g}"] = cumulative
+        return fields
+
+
+class CacheMetrics:
+    """Thread-safe per-process registry of cache counters and histograms."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: defaultdict[MetricLabels, defaultdict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._histograms: defaultdict[MetricLabels, dict[str, Histogram]] = defaultdict(dict)
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(settings.API_CACHE_METRICS_ENABLED)
+
+    def increment(self, event: str, key_prefix: str, route: str, amount: int = 1) -> None:
+        """Count one cache event (``hit``, ``miss``, ``not_modified``, ...)."""
+        if not self.is_enabled():
+            return
+        with self._lock:
+            self._counters[(key_prefix, route)][event] += amount
+        self.maybe_flush()
+
+    def observe(self, name: str, key_prefix: str, route: str, value: float) -> None:
+        """Record one sample of a histogram declared in ``HISTOGRAM_BUCKETS``."""
+        if not self.is_enabled():
+            return
+        with self._lock:
+            histograms = self._histograms[(key_prefix, route)]
+            if name not in histograms:
+                histograms[name] = Histogram(HISTOGRAM_BUCKETS[name])
+            histograms[name].observe(value)
+        self.maybe_flush()
+
+    def snapshot(self, reset: bool = False) -> dict[MetricLabels, dict[str, Any]]:
+        """Return the metrics gathered since the last reset, as flat field dicts."""
+        with self._lock:
+            counters, histograms = self._counters, self._histograms
+            if reset:
+                self._counters = defaultdict(lambda: defaultdict(int))
+                self._histograms = defaultdict(dict)
+                self._last_flush = time.monotonic()
+            else:
+                counters = defaultdict(lambda: defaultdict(int), counters)
+
+            snapshot: dict[MetricLabels, dict[str, Any]] = {}
+            for label in set(counters) | set(histograms):
+                fields: dict[str, Any] = dict(counters.get(label, {}))
+                for name, histogram in histograms.get(label, {}).items():
+                    fields.update(histogram.as_fields(name))
+                snapshot[label] = fields
+            return snapshot
+
+    def maybe_flush(self) -> None:
+        """Flush once the configured interval has elapsed since the last flush."""
+        if time.monotonic() - self._last_flush >= settings.API_CACHE_METRICS_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log and reset everything gathered since the last flush."""
+        for (key_prefix, route), fields in sorted(self.snapshot(reset=True).items()):
+            logger.info(
+                "Cache metrics",
+                extra={"cache_key_prefix": key_prefix, "cache_route": route, **fields},
+            )
+
+
+cache_metrics = CacheMetrics()
@@ -0,0 +1,137 @@
+"""Per-view query parameter allowlists for ``cache_response``.
+
+Every query parameter used to end up in the cache key, so tracking parameters
+(``utm_*``) or random cache-busters created a new 30-day entry per request. A
+cached view now declares the parameters that change its output, each with a
+normalizer that returns the canonical value, ``None`` to drop it (e.g. when it
+equals the default) or raises ``UncacheableRequest`` for values that must not
+be stored. ``canonicalize_query`` rebuilds the query from that allowlist, and
+the request is rewritten with it, so the view renders exactly what the key
+describes.
+
+Free-form values (search terms, slugs, cursors) are not checked against the
+database, so each distinct value would otherwise live for the full cache
+timeout. Responses to queries carrying one are stored for at most
+``API_CACHE_FREE_TEXT_TIMEOUT`` seconds instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from django.conf import settings
+from django.http import QueryDict
+
+type ParamNormalizer = Callable[[str], str | None]
+type QueryParamSpec = Mapping[str, ParamNormalizer]
+
+MAX_TEXT_PARAM_LENGTH = 100
+
+
+class UncacheableRequest(Exception):
+    """Raised when a query parameter value must not produce a cache entry."""
+
+
+def language_param(value: str) -> str | None:
+    """Lowercase a ``lang`` value and drop languages the site does not serve."""
+    language = value.strip().lower()
+    if language in {code for code, _ in settings.LANGUAGES}:
+        return language
+    return None
+
+
+def flag_param(value: str) -> str | None:
+    """Keep ``true`` flags only; any other value means the (false) default."""
+    return "true" if value.strip().lower() == "true" else None
+
+
+def choice_param(choices: Iterable[str]) -> ParamNormalizer:
+    """Accept only known values; anything else is rendered without being stored."""
+    allowed = frozenset(choices)
+
+    def normalize(value: str) -> str | None:
+        if not value:
+            return None
+        if value not in allowed:
+            raise UncacheableRequest(f"Unknown value {value!r}")
+        return value
+
+    return normalize
+
+
+class FreeTextParam:
+    """Normalizer of a free-form value; responses that use one are stored briefly."""
+
+    def __init__(self, max_length: int) -> None:
+        self.max_length = max_length
+
+    def __call__(self, value: str) -> str | None:
+        value = value.strip()
+        if len(value) > self.max_length:
+            raise UncacheableRequest(f"Value longer than {self.max_length} characters")
+        return value or None
+
+
+def text_param(max_length: int = MAX_TEXT_PARAM_LENGTH) -> ParamNormalizer:
+    """Accept free-form search values up to ``max_length`` characters."""
+    return FreeTextParam(max_length)
+
+
+def page_param(value: str) -> str | None:
+    """Drop the first page; invalid pages are 404s and are never stored."""
+    try:
+        page = int(value)
+    except ValueError as exc:
+        raise UncacheableRequest(f"Invalid page {value!r}") from exc
+    if page < 1:
+        raise UncacheableRequest(f"Invalid page {value!r}")
+    return None if page == 1 else str(page)
+
+
+def page_size_param(default: int, maximum: int) -> ParamNormalizer:
+    """Mirror DRF's page size parsing: invalid sizes fall back, large ones are capped."""
+
+    def normalize(value: str) -> str | None:
+        try:
+            size = min(int(value), maximum)
+        except ValueError:
+            return None
+        if size <= 0 or size == default:
+            return None
+        return str(size)
+
+    return normalize
+
+
+LANGUAGE_ONLY: QueryParamSpec = {"lang": language_param}
+
+
+def canonicalize_query(query: QueryDict, spec: QueryParamSpec) -> QueryDict:
+    """Return an immutable query holding only the allowed, normalized parameters."""
+    canonical = QueryDict(mutable=True)
+    for name, normalize in sorted(spec.items()):
+        value = query.get(name)
+        if value is None:
+            continue
+        normalized = normalize(value)
+        if normalized is not None:
+            canonical[name] = normalized
+    canonical._mutable = False
+    return canonical
+
+
+def apply_canonical_query(request: Any, spec: QueryParamSpec) -> None:
+    """Replace the query of a Django or DRF request with its canonical form."""
+    django_request = getattr(request, "_request", request)
+    canonical = canonicalize_query(django_request.GET, spec)
+    django_request.GET = canonical
+    django_request.META["QUERY_STRING"] = canonical.urlencode()
+
+
+def get_cache_timeout(request: Any, spec: QueryParamSpec, timeout: int) -> int:
+    """Cap ``timeout`` when the canonical query of a request carries a free-form value."""
+    django_request = getattr(request, "_request", request)
+    if any(isinstance(spec.get(name), FreeTextParam) for name in django_request.GET):
+        return min(timeout, int(settings.API_CACHE_FREE_TEXT_TIMEOUT))
+    return timeout
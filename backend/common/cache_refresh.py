@@ -0,0 +1,71 @@
+"""Re-render cached API responses outside of a client request.
+
+``cache_response`` stores, next to every payload, the request target it was
+rendered for (path, query string, language, host and scheme). The helpers here
+rebuild an equivalent GET request from that target and run it through the
+resolved view with the refresh flag set, so the decorator skips the cache read
+and stores a freshly rendered payload.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, cast
+
+from django.test import RequestFactory
+from django.urls import resolve
+from django.utils import translation
+
+logger = logging.getLogger("core.cache")
+
+# Request attribute telling cache_response to bypass the cached entry and re-store it
+CACHE_REFRESH_ATTR = "api_cache_refresh"
+# Token of the recomputation lock a background refresh took before it was queued
+CACHE_LOCK_TOKEN_ATTR = "api_cache_lock_token"
+
+
+def _without_throttles(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Rebuild a DRF view with throttling disabled. Every re-render comes from the
+    same worker address, so it would otherwise spend one shared anonymous quota.
+    """
+    view_class = getattr(view, "cls", None)
+    if view_class is None:
+        return view
+
+    initkwargs = {**getattr(view, "initkwargs", {}), "throttle_classes": []}
+    actions = getattr(view, "actions", None)
+    if actions is not None:
+        return cast(Callable[..., Any], view_class.as_view(actions, **initkwargs))
+    return cast(Callable[..., Any], view_class.as_view(**initkwargs))
+
+
+def render_cached_request(
+    path: str,
+    query_string: str,
+    language: str,
+    host: str,
+    secure: bool,
+    lock_token: str | None = None,
+) -> int:
+    """
+    Re-render one cached GET request and return the view's status code.
+
+    ``lock_token`` is the recomputation lock owned by this render, released by
+    ``cache_response`` afterwards; renders without one leave the lock alone.
+    """
+    full_path = f"{path}?{query_string}" if query_string else path
+    request = RequestFactory().get(full_path, secure=secure, headers={"host": host})
+    request.LANGUAGE_CODE = language
+    setattr(request, CACHE_REFRESH_ATTR, True)
+    setattr(request, CACHE_LOCK_TOKEN_ATTR, lock_token)
+
+    match = resolve(path)
+    view = _without_throttles(match.func)
+    with translation.override(language):
+        response = view(request, *match.args, **match.kwargs)
+
+    status_code = int(response.status_code)
+    logger.debug(f"Re-rendered cached request {full_path} [{language}]: {status_code}")
+    return status_code
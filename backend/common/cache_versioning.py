@@ -0,0 +1,105 @@
+"""Generation counters for namespaced API cache invalidation.
+
+Every cached API response belongs to one ``CacheNamespace``. The namespace's
+current generation is embedded in the cache key, so invalidating a whole group
+is a single ``INCR`` on the generation key instead of scanning the keyspace.
+Entries written under an older generation are never read again and simply
+expire with their own timeout.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.types import CacheNamespace
+
+logger = logging.getLogger("core.cache")
+
+GENERATION_KEY_PREFIX = "api_cache_generation"
+
+# Last generation this process read per namespace, as (generation, monotonic read time)
+_known_generations: dict[str, tuple[int, float]] = {}
+
+
+def get_generation_key(namespace: CacheNamespace) -> str:
+    """Return the cache key holding the generation counter of a namespace."""
+    return f"{GENERATION_KEY_PREFIX}:{namespace}"
+
+
+def _initial_generation() -> int:
+    # Seed from the clock so a lost counter (eviction, FLUSHDB) never restarts
+    # below a generation that may still be referenced by stored entries.
+    return int(time.time())
+
+
+def _read_generation(namespace: CacheNamespace) -> int:
+    key = get_generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = cache.get(key, _initial_generation())
+    return int(generation)
+
+
+def _remember_generation(namespace: CacheNamespace, generation: int) -> None:
+    _known_generations[namespace] = (generation, time.monotonic())
+
+
+def get_generation(namespace: CacheNamespace) -> int:
+    """
+    Return the current generation of a namespace, creating it when missing.
+
+    A generation read less than ``API_CACHE_LOCAL_GENERATION_TTL`` seconds ago is
+    reused without a cache round trip. When the shared cache is unreachable the
+    last known generation is returned, so local copies keep being served.
+    """
+    known = _known_generations.get(namespace)
+    ttl = settings.API_CACHE_LOCAL_GENERATION_TTL
+    if known is not None and ttl and time.monotonic() - known[1] < ttl:
+        return known[0]
+
+    try:
+        generation = _read_generation(namespace)
+    except Exception as exc:
+        if known is None:
+            raise
+        logger.warning(f"Cache generation read failed for {namespace}, using last known: {exc}")
+        return known[0]
+
+    _remember_generation(namespace, generation)
+    return generation
+
+
+def get_generations(namespaces: Iterable[CacheNamespace]) -> list[int]:
+    """Return the current generations of several namespaces in one round trip."""
+    namespace_list = list(namespaces)
+    stored = cache.get_many([get_generation_key(namespace) for namespace in namespace_list])
+    return [
+        int(stored.get(get_generation_key(namespace)) or get_generation(namespace))
+        for namespace in namespace_list
+    ]
+
+
+def bump_generation(namespace: CacheNamespace) -> int:
+    """Advance a namespace generation, orphaning every entry stored under it."""
+    key = get_generation_key(namespace)
+    try:
+        generation = int(cache.incr(key))
+    except ValueError:
+        # Counter does not exist yet: seeding it is already a fresh generation
+        cache.add(key, _initial_generation(), timeout=None)
+        generation = int(cache.incr(key))
+    _remember_generation(namespace, generation)
+    return generation
+
+
+def build_versioned_prefix(key_prefix: str, namespace: CacheNamespace | None) -> str:
+    """Return the key prefix with the namespace generation embedded in it."""
+    if namespace is None:
+        return key_prefix
+    return f"{key_prefix}:{namespace}:{get_generation(namespace)}"
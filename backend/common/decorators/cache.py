@@ -1,17 +1,47 @@
 import hashlib
 import json
 import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from functools import wraps
-from typing import Any
+from typing import Any, cast
 
 from django.conf import settings
-from django.core.cache import cache
-from django.http import HttpResponseNotModified, JsonResponse
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+
+from common.cache_hits import is_hit_tracking_enabled, record_hit
+from common.cache_metrics import cache_metrics
+from common.cache_params import (
+    QueryParamSpec,
+    UncacheableRequest,
+    apply_canonical_query,
+    get_cache_timeout,
+)
+from common.cache_refresh import CACHE_LOCK_TOKEN_ATTR, CACHE_REFRESH_ATTR
+from common.cache_versioning import build_versioned_prefix
+from common.local_cache import local_package_cache
+from common.renderers import ORJSONRenderer
+from common.tasks import refresh_cached_response_task
+from common.types import CacheNamespace
+from common.utils.compression import accepts_encoding, compress_body, decompress_body
 
 logger = logging.getLogger("core.cache")
 
+JSON_CONTENT_TYPE = "application/json"
+LOCK_POLL_INTERVAL = 0.05
+# Deletes KEYS[1] only while it still holds ARGV[1], in one Redis round trip
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 
 class BaseCacheStrategy(ABC):
     """
@@ -25,8 +55,8 @@ class BaseCacheStrategy(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_response_data(self, response: Any, cache_key: str) -> Any | None:
-        """Extract serializable data from the response."""
+    def get_response_body(self, response: Any, cache_key: str) -> tuple[bytes, str] | None:
+        """Return the final encoded response body and its content type."""
         raise NotImplementedError
 
 
@@ -36,6 +66,8 @@ class DefaultCacheStrategy(BaseCacheStrategy):
     Handles standard DRF and Django JsonResponses.
     """
 
+    renderer_class = ORJSONRenderer
+
     def get_cache_key(self, request: Any, key_prefix: str) -> str:
         path = getattr(request, "path", "unknown")
         params = getattr(request, "query_params", getattr(request, "GET", {}))
@@ -48,27 +80,404 @@ class DefaultCacheStrategy(BaseCacheStrategy):
 
         return f"{key_prefix}:{path}:{lang}:{params_hash}"
 
-    def get_response_data(self, response: Any, cache_key: str) -> Any | None:
-        # Detect if this is a standard Django response or DRF response
+    def get_response_body(self, response: Any, cache_key: str) -> tuple[bytes, str] | None:
+        # DRF responses finalized by APIView.dispatch render with the negotiated renderer
+        if getattr(response, "accepted_renderer", None) is not None:
+            response.render()
+            content_type = response.get("Content-Type", JSON_CONTENT_TYPE)
+            return bytes(response.content), content_type
+
+        # DRF responses returned from a decorated action are not finalized yet,
+        # so render them once with the project JSON renderer.
         if hasattr(response, "data"):
-            return response.data
+            renderer = self.renderer_class()
+            return renderer.render(response.data), renderer.media_type
 
-        # For rendered responses (like JsonResponse), extract content safely
+        # Already rendered responses (like JsonResponse) are cached as-is
+        if getattr(response, "streaming", False):
+            logger.debug(f"Streaming response is not cacheable [Key: {cache_key}]")
+            return None
         try:
-            return json.loads(response.content)
-        except (AttributeError, ValueError):
-            logger.debug(f"Response has no parsable content [Key: {cache_key}]")
+            return bytes(response.content), response.get("Content-Type", JSON_CONTENT_TYPE)
+        except AttributeError:
+            logger.debug(f"Response has no renderable content [Key: {cache_key}]")
             return None
 
 
+def build_etag(body: bytes) -> str:
+    """Return a strong ETag for an encoded response body."""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def build_version_etag(cache_key: str) -> str:
+    """
+    Return an ETag derived from a generation-versioned cache key.
+
+    The key embeds the namespace generation, which moves on every invalidation,
+    so the tag changes exactly when the cached payload may change and can be
+    checked without loading the payload.
+    """
+    return f'"v{hashlib.md5(cache_key.encode("utf-8")).hexdigest()}"'
+
+
+def build_request_target(request: Any) -> dict[str, Any]:
+    """Capture what is needed to re-render a cached request outside the request cycle."""
+    return {
+        "path": request.path,
+        "query_string": request.META.get("QUERY_STRING", ""),
+        "language": getattr(request, "LANGUAGE_CODE", "en"),
+        "host": request.get_host(),
+        "secure": request.is_secure(),
+    }
+
+
+def is_valid_package(package: Any) -> bool:
+    """Return True for packages stored in the current pre-rendered format."""
+    return isinstance(package, dict) and "body" in package
+
+
+def is_soft_expired(package: dict[str, Any]) -> bool:
+    """Return True once a package has outlived its soft (refresh-ahead) TTL."""
+    fresh_until = package.get("fresh_until")
+    return fresh_until is not None and time.time() >= fresh_until
+
+
+def acquire_lock(lock_key: str) -> str | None:
+    """Try to become the single recomputation owner of a cache key."""
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, settings.API_CACHE_LOCK_TIMEOUT):
+        return token
+    return None
+
+
+def release_lock(lock_key: str, token: str) -> None:
+    """
+    Release a recomputation lock, only when it is still ours.
+
+    On Redis the token check and the delete run as one script, so a lock that
+    expired and was taken by another worker in between is left alone. Other
+    backends (tests, local development) fall back to get-then-delete.
+    """
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, RedisCache):
+        key = backend.make_and_validate_key(lock_key)
+        redis_client = cast(Any, backend)._cache
+        client = redis_client.get_client(key, write=True)
+        client.eval(RELEASE_LOCK_SCRIPT, 1, key, redis_client._serializer.dumps(token))
+        return
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def wait_for_package(cache_key: str) -> dict[str, Any] | None:
+    """Poll for the lock holder's result for at most ``API_CACHE_LOCK_WAIT`` seconds."""
+    deadline = time.monotonic() + settings.API_CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        package = cache.get(cache_key)
+        if is_valid_package(package):
+            return cast(dict[str, Any], package)
+    return None
+
+
+def get_stale_package(latest_key: str | None) -> dict[str, Any] | None:
+    """Return the last package stored for this request, even from an older generation."""
+    if latest_key is None:
+        return None
+    previous_key = cache.get(latest_key)
+    if not previous_key:
+        return None
+    package = cache.get(previous_key)
+    return cast(dict[str, Any], package) if is_valid_package(package) else None
+
+
+def schedule_refresh(cache_key: str, package: dict[str, Any]) -> None:
+    """Re-render a soft-expired entry in the background, once per lock window."""
+    lock_key = f"{cache_key}:lock"
+    token = acquire_lock(lock_key)
+    if token is None:
+        return
+
+    try:
+        refresh_cached_response_task.delay(**package["request"], lock_token=token)
+        logger.debug(f"Cache REFRESH scheduled [Key: {cache_key}]")
+    except Exception as exc:
+        release_lock(lock_key, token)
+        logger.warning(f"Failed to schedule cache refresh [Key: {cache_key}]: {exc}")
+
+
+def get_metrics_route(request: Any) -> str:
+    """Return the URL pattern of a request, so metrics are not split per object id."""
+    resolver_match = getattr(request, "resolver_match", None)
+    return str(getattr(resolver_match, "route", None) or request.path)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against a stored ETag."""
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip() == "*" or candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified_response(if_none_match: str, etag: str) -> HttpResponse:
+    """Build a 304 for a version ETag, echoing the weak form when the client sent it."""
+    response = HttpResponseNotModified()
+    response["ETag"] = f"W/{etag}" if f"W/{etag}" in if_none_match else etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def package_response(request: Any, package: dict[str, Any]) -> HttpResponse:
+    """
+    Build the HTTP response for a stored package.
+
+    The stored body is served as is to clients that accept its encoding; responses
+    that carry a ``Content-Encoding`` header are left alone by ``GZipMiddleware``.
+    Other clients get the decompressed body.
+    """
+    etag = package["etag"]
+    encoding: str | None = package.get("encoding")
+    served_encoding = (
+        encoding
+        if encoding and accepts_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""), encoding)
+        else None
+    )
+    if served_encoding is not None:
+        # Same convention as GZipMiddleware: encoded variants carry a weak ETag
+        etag = f"W/{etag}"
+
+    # Fast path for ETag validation (304 Not Modified)
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match and etag_matches(if_none_match, etag):
+        response: HttpResponse = HttpResponseNotModified()
+    elif served_encoding is not None:
+        response = HttpResponse(package["body"], content_type=package["content_type"])
+        response["Content-Encoding"] = served_encoding
+    else:
+        body = decompress_body(package["body"], encoding)
+        response = HttpResponse(body, content_type=package["content_type"])
+
+    response["ETag"] = etag
+    if encoding is not None:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+class CachedRequest:
+    """
+    Cache state of one GET request handled by ``cache_response``.
+
+    ``lookup`` answers from the local tier, the shared cache, a stale payload or
+    the lock holder's result; when it returns ``None`` the caller renders the
+    view and hands the response to ``store``.
+
+    With a ``version_etag`` the package is tagged with it instead of a body hash,
+    and a matching ``If-None-Match`` is answered before any payload is read.
+    """
+
+    def __init__(
+        self,
+        request: Any,
+        cache_key: str,
+        latest_key: str | None,
+        namespace: CacheNamespace | None,
+        key_prefix: str = "api_cache",
+        version_etag: str | None = None,
+    ) -> None:
+        self.request = request
+        self.cache_key = cache_key
+        self.latest_key = latest_key
+        self.namespace = namespace
+        self.version_etag = version_etag
+        self.lock_key = f"{cache_key}:lock"
+        self.lock_token: str | None = None
+        self.use_local_cache = local_package_cache.is_enabled()
+        # Cleared when the shared cache is unreachable, so the render is not stored
+        self.storable = True
+        self.metric_labels = (key_prefix, get_metrics_route(request))
+
+    def count(self, event: str) -> None:
+        cache_metrics.increment(event, *self.metric_labels)
+
+    def observe(self, name: str, value: float) -> None:
+        cache_metrics.observe(name, *self.metric_labels, value)
+
+    def respond(self, package: dict[str, Any], event: str) -> HttpResponse:
+        """Build the response for a cached package and count how it was served."""
+        response = package_response(self.request, package)
+        self.count(event)
+        if response.status_code == 304:
+            self.count("not_modified")
+        return response
+
+    def lookup(self) -> HttpResponse | None:
+        """Return a cached response, or None when the view has to be rendered."""
+        if self.namespace is not None and is_hit_tracking_enabled():
+            record_hit(self.namespace, build_request_target(self.request))
+
+        if_none_match = self.request.META.get("HTTP_IF_NONE_MATCH")
+        if self.version_etag and if_none_match and etag_matches(if_none_match, self.version_etag):
+            logger.debug(f"Cache REVALIDATED [Key: {self.cache_key}]")
+            self.count("revalidated")
+            self.count("not_modified")
+            return not_modified_response(if_none_match, self.version_etag)
+
+        local_package = local_package_cache.get(self.cache_key) if self.use_local_cache else None
+        if local_package is not None and not is_soft_expired(local_package):
+            logger.debug(f"Cache HIT (local) [Key: {self.cache_key}]")
+            return self.respond(local_package, "hit_local")
+
+        try:
+            cached_package = cache.get(self.cache_key)
+        except Exception as exc:
+            logger.warning(f"Cache read failed [Key: {self.cache_key}]: {exc}")
+            self.storable = False
+            self.count("cache_error")
+            return self.respond(local_package, "hit_local") if local_package else None
+
+        if is_valid_package(cached_package):
+            logger.debug(f"Cache HIT [Key: {self.cache_key}]")
+            if is_soft_expired(cached_package):
+                self.count("soft_expired")
+                schedule_refresh(self.cache_key, cached_package)
+            elif self.use_local_cache:
+                local_package_cache.set(self.cache_key, cached_package)
+            return self.respond(cached_package, "hit")
+
+        if cached_package is not None:
+            # Handle legacy packages (decoded data dicts or non-dict values)
+            cache.delete(self.cache_key)
+
+        logger.debug(f"Cache MISS [Key: {self.cache_key}]")
+        self.count("miss")
+        return self._recompute_or_wait()
+
+    def _recompute_or_wait(self) -> HttpResponse | None:
+        self.lock_token = acquire_lock(self.lock_key)
+        if self.lock_token is not None:
+            return None
+
+        # Another request is already rendering this key
+        stale_package = get_stale_package(self.latest_key)
+        if stale_package is not None:
+            logger.debug(f"Cache STALE [Key: {self.cache_key}]")
+            return self.respond(stale_package, "stale")
+
+        waited_package = wait_for_package(self.cache_key)
+        if waited_package is not None:
+            logger.debug(f"Cache HIT after wait [Key: {self.cache_key}]")
+            return self.respond(waited_package, "wait_hit")
+        return None
+
+    def store(
+        self,
+        response: Any,
+        strategy: BaseCacheStrategy,
+        timeout: int,
+        soft_timeout: int | None,
+    ) -> None:
+        """Store a successful rendered response and tag it with its ETag."""
+        if not self.storable or getattr(response, "status_code", None) != 200:
+            return
+        rendered = strategy.get_response_body(response, self.cache_key)
+        if rendered is None:
+            return
+
+        body, content_type = rendered
+        etag = self.version_etag or build_etag(body)
+        stored_body, encoding = compress_body(body)
+        package = {
+            "body": stored_body,
+            "encoding": encoding,
+            "etag": etag,
+            "content_type": content_type,
+            "request": build_request_target(self.request),
+            "fresh_until": time.time() + soft_timeout if soft_timeout else None,
+        }
+
+        logger.debug(f"Caching Data [Key: {self.cache_key}]")
+        self.observe("payload_bytes", len(body))
+        cache.set(self.cache_key, package, timeout)
+        if self.latest_key is not None:
+            cache.set(self.latest_key, self.cache_key, timeout)
+        if self.use_local_cache:
+            local_package_cache.set(self.cache_key, package)
+        response["ETag"] = etag
+
+    def release(self) -> None:
+        """Release the recomputation lock owned by this request, if any."""
+        if self.lock_token is not None:
+            release_lock(self.lock_key, self.lock_token)
+
+
+def build_cached_request(
+    request: Any,
+    strategy: BaseCacheStrategy,
+    key_prefix: str,
+    namespace: CacheNamespace | None,
+    soft_timeout: int | None,
+    query_params: QueryParamSpec | None = None,
+    version_etag: bool = False,
+) -> CachedRequest:
+    """Resolve the versioned cache keys and the ETag scheme of a request."""
+    if query_params is not None:
+        apply_canonical_query(request, query_params)
+    cache_key = strategy.get_cache_key(request, build_versioned_prefix(key_prefix, namespace))
+    if namespace is None:
+        return CachedRequest(request, cache_key, None, namespace, key_prefix)
+
+    latest_key = strategy.get_cache_key(request, f"{key_prefix}:{namespace}:latest")
+    # Background refreshes may change a payload within one generation, so entries
+    # with a soft TTL keep content-hash ETags.
+    refreshes = soft_timeout or settings.API_CACHE_SOFT_TIMEOUT
+    etag = build_version_etag(cache_key) if version_etag and not refreshes else None
+    return CachedRequest(request, cache_key, latest_key, namespace, key_prefix, etag)
+
+
 def cache_response(
     timeout: int | None = None,
     key_prefix: str = "api_cache",
     strategy_class: type[BaseCacheStrategy] = DefaultCacheStrategy,
+    namespace: CacheNamespace | None = None,
+    soft_timeout: int | None = None,
+    query_params: QueryParamSpec | None = None,
+    version_etag: bool = False,
 ):
     """
-    Decorator for DRF view actions/methods to cache response data using a Strategy Pattern.
-    Supports ETags for 304 Not Modified responses.
+    Decorator for DRF view actions/methods to cache encoded response bodies
+    using a Strategy Pattern.
+
+    The final UTF-8 body is stored once (brotli-compressed when that pays off)
+    together with its ETag and content type, so cache hits are returned as raw
+    ``HttpResponse`` objects without re-rendering. Supports ETags for 304 Not Modified responses.
+
+    ``version_etag`` tags namespaced responses with a version token of the cache
+    key, so revalidations are answered without reading the payload. Only views
+    whose payload is a pure function of the database may opt in; payloads with
+    expiring signed URLs change without an invalidation and keep body-hash ETags.
+
+    When ``namespace`` is given, its generation counter is embedded in every key
+    so ``CacheService`` can invalidate the whole group with a single increment.
+
+    Misses are recomputed single-flight: one request takes a short lock and
+    renders, concurrent requests get the previous (stale) payload or wait for the
+    lock holder. Entries older than ``soft_timeout`` keep being served while a
+    background task re-renders them.
+
+    With ``API_CACHE_LOCAL_ENABLED`` packages are also kept in a per-process LRU
+    that answers hits without a payload round trip. When the shared cache is
+    unreachable, local copies keep being served and misses render uncached.
+
+    ``query_params`` declares the parameters that affect the response (see
+    ``common.cache_params``): the request query is rewritten to their canonical
+    form before the key is built and the view runs, and values the spec marks as
+    uncacheable are rendered without touching the cache. Responses to queries
+    with a free-form value are stored for ``API_CACHE_FREE_TEXT_TIMEOUT`` at most.
+
+    Hits, misses, 304s, stale serves, render time and payload size are recorded
+    in ``common.cache_metrics`` per key prefix and route.
     """
     strategy = strategy_class()
 
@@ -78,43 +487,49 @@ def cache_response(
             if request.method != "GET":
                 return view_func(request, *args, **kwargs)
 
-            actual_timeout = timeout or settings.INFINITE_CACHE_TIMEOUT
-            cache_key = strategy.get_cache_key(request, key_prefix)
-
-            # Check cache
-            cached_package = cache.get(cache_key)
-            if cached_package is not None and isinstance(cached_package, dict):
-                data = cached_package.get("data")
-                etag = cached_package.get("etag")
-                logger.debug(f"Cache HIT [Key: {cache_key}]")
-
-                # Fast path for ETag validation (304 Not Modified)
-                if etag and request.META.get("HTTP_IF_NONE_MATCH") == etag:
-                    return HttpResponseNotModified()
-
-                response = JsonResponse(data, safe=False)
-                if etag:
-                    response["ETag"] = etag
-                return response
-
-            if cached_package is not None:
-                # Handle legacy non-dict data
-                cache.delete(cache_key)
-
-            logger.debug(f"Cache MISS [Key: {cache_key}]")
-            response = view_func(request, *args, **kwargs)
-
-            # Cache successful GET responses
-            if getattr(response, "status_code", None) == 200:
-                data = strategy.get_response_data(response, cache_key)
-                if data is not None:
-                    # Generate ETag and save to cache
-                    content = json.dumps(data, sort_keys=True).encode("utf-8")
-                    etag = f'"{hashlib.md5(content).hexdigest()}"'
-
-                    logger.debug(f"Caching Data [Key: {cache_key}]")
-                    cache.set(cache_key, {"data": data, "etag": etag}, actual_timeout)
-                    response["ETag"] = etag
+            try:
+                cached_request = build_cached_request(
+                    request,
+                    strategy,
+                    key_prefix,
+                    namespace,
+                    soft_timeout,
+                    query_params,
+                    version_etag,
+                )
+            except UncacheableRequest as exc:
+                logger.debug(f"Uncacheable query, serving uncached [Path: {request.path}]: {exc}")
+                cache_metrics.increment("uncacheable", key_prefix, get_metrics_route(request))
+                return view_func(request, *args, **kwargs)
+            except Exception as exc:
+                # No generation known yet and the shared cache is unreachable
+                logger.warning(f"Cache unavailable, serving uncached [Path: {request.path}]: {exc}")
+                return view_func(request, *args, **kwargs)
+
+            if getattr(request, CACHE_REFRESH_ATTR, False):
+                # Background refreshes own the lock taken by schedule_refresh(); warm
+                # renders own none and must not release one held by a request render
+                cached_request.lock_token = getattr(request, CACHE_LOCK_TOKEN_ATTR, None)
+            else:
+                cached_response = cached_request.lookup()
+                if cached_response is not None:
+                    return cached_response
+
+            try:
+                started = time.monotonic()
+                response = view_func(request, *args, **kwargs)
+                cached_request.observe("recompute_seconds", time.monotonic() - started)
+                store_timeout = timeout or settings.INFINITE_CACHE_TIMEOUT
+                if query_params is not None:
+                    store_timeout = get_cache_timeout(request, query_params, store_timeout)
+                cached_request.store(
+                    response,
+                    strategy,
+                    store_timeout,
+                    soft_timeout or settings.API_CACHE_SOFT_TIMEOUT,
+                )
+            finally:
+                cached_request.release()
 
             return response
 
@@ -0,0 +1,75 @@
+"""Per-process LRU tier in front of the shared Django cache.
+
+``cache_response`` keys embed the namespace generation, so a local copy of a
+package can never outlive an invalidation: once the generation moves, lookups
+use a new key and the old copy is simply evicted by the LRU. The tier is bounded
+both by entry count and by the total size of the stored bodies.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+
+
+class LocalPackageCache:
+    """Thread-safe LRU of response packages with an entry and a byte budget."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(settings.API_CACHE_LOCAL_ENABLED)
+
+    @staticmethod
+    def _package_size(package: dict[str, Any]) -> int:
+        return len(package["body"])
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a stored package and mark it as most recently used."""
+        with self._lock:
+            package = self._entries.get(key)
+            if package is not None:
+                self._entries.move_to_end(key)
+            return package
+
+    def set(self, key: str, package: dict[str, Any]) -> None:
+        """Store a package, evicting least recently used entries over budget."""
+        size = self._package_size(package)
+        max_bytes = settings.API_CACHE_LOCAL_MAX_BYTES
+        if size > max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= self._package_size(previous)
+            self._entries[key] = package
+            self._size += size
+
+            max_entries = settings.API_CACHE_LOCAL_MAX_ENTRIES
+            while self._entries and (len(self._entries) > max_entries or self._size > max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= self._package_size(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored bodies."""
+        return self._size
+
+
+local_package_cache = LocalPackageCache()
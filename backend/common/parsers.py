@@ -0,0 +1,38 @@
+"""JSON parser counterpart of ``common.renderers.ORJSONRenderer``."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import IO, Any
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    Parse UTF-8 JSON bodies with ``orjson``.
+
+    Like the strict ``JSONParser`` it rejects ``NaN`` and ``Infinity``. Other
+    encodings fall back to ``JSONParser``.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        encoding = (parser_context or {}).get("encoding") or "utf-8"
+        if encoding.lower().replace("_", "-") not in {"utf-8", "utf8"}:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
@@ -0,0 +1,60 @@
+"""JSON renderer for the public API backed by ``orjson``.
+
+DRF's ``JSONRenderer`` runs ``json.dumps`` with a Python-level encoder class,
+which is the top frame when rendering large gallery pages. ``ORJSONRenderer``
+encodes with ``orjson`` instead: dicts, lists, strings, numbers and UUIDs are
+encoded natively, while the types DRF formats its own way (datetimes,
+``Decimal`` prices, lazy translation strings, querysets) are passed to DRF's
+encoder so they render as before. Output ``orjson`` cannot produce (indented
+responses, integers beyond 64 bits) falls back to ``JSONRenderer``.
+
+The output is not byte-identical to ``JSONRenderer`` for every float:
+
+- exponents are written without padding or a plus sign (``1e-7`` rather
+  than ``1e-07``), and small magnitudes may use plain notation
+  (``0.000025`` rather than ``2.5e-05``); both parse to the same value;
+- ``NaN`` and infinities render as ``null``, where DRF's strict
+  ``JSONRenderer`` raises ``ValueError`` and the request fails.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, cast
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_drf_encoder = JSONEncoder()
+
+# orjson must not format datetimes itself: DRF trims microseconds and uses "Z".
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _escape_js_separators(content: bytes) -> bytes:
+    """Escape U+2028/U+2029 like ``JSONRenderer``, so the output is a strict JS subset."""
+    if b"\xe2\x80" not in content:
+        return content
+    return content.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Drop-in ``JSONRenderer`` that encodes with ``orjson``."""
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            return cast(bytes, super().render(data, accepted_media_type, renderer_context))
+
+        try:
+            content = orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return cast(bytes, super().render(data, accepted_media_type, renderer_context))
+        return _escape_js_separators(content)
@@ -7,6 +7,7 @@ from celery import shared_task
 from django.conf import settings
 from django.core.mail import EmailMessage
 
+from common.cache_refresh import render_cached_request
 from common.celery import CommitAwareTask
 from common.ssr_cache import invalidate_frontend_ssr_cache
 
@@ -50,3 +51,19 @@ def send_email_task(self, html_content: str, subject: str) -> None:
 )
 def invalidate_frontend_ssr_cache_task(tags: Iterable[str]) -> bool:
     return invalidate_frontend_ssr_cache(tags)
+
+
+@shared_task(  # type: ignore[untyped-decorator]
+    name="common.refresh_cached_response",
+    ignore_result=True,
+)
+def refresh_cached_response_task(
+    path: str,
+    query_string: str,
+    language: str,
+    host: str,
+    secure: bool,
+    lock_token: str | None = None,
+) -> int:
+    """Re-render a soft-expired ``cache_response`` entry in the background."""
+    return render_cached_request(path, query_string, language, host, secure, lock_token)
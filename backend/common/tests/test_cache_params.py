@@ -0,0 +1,73 @@
+# backend/common/tests/test_cache_params.py
+
+import pytest
+
+from django.http import HttpRequest, QueryDict
+
+from common.cache_params import (
+    UncacheableRequest,
+    canonicalize_query,
+    choice_param,
+    flag_param,
+    get_cache_timeout,
+    language_param,
+    page_param,
+    page_size_param,
+    text_param,
+)
+
+SPEC = {
+    "lang": language_param,
+    "filter": choice_param(["Deep Sky", "Landscape"]),
+    "latest": flag_param,
+    "page": page_param,
+    "limit": page_size_param(default=24, maximum=48),
+    "tag": text_param(max_length=10),
+}
+
+
+class TestCanonicalizeQuery:
+    def test_unknown_params_are_dropped(self):
+        query = QueryDict("utm_source=newsletter&_=1718000000&filter=Landscape")
+
+        assert canonicalize_query(query, SPEC).urlencode() == "filter=Landscape"
+
+    def test_parameters_are_sorted(self):
+        query = QueryDict("tag=m31&filter=Deep+Sky&lang=pl")
+
+        assert canonicalize_query(query, SPEC).urlencode() == "filter=Deep+Sky&lang=pl&tag=m31"
+
+    @pytest.mark.parametrize(
+        ("raw", "canonical"),
+        [
+            ("lang=PL", "lang=pl"),
+            ("lang=xx", ""),
+            ("latest=TRUE", "latest=true"),
+            ("latest=no", ""),
+            ("page=1", ""),
+            ("page=3", "page=3"),
+            ("limit=24", ""),
+            ("limit=500", "limit=48"),
+            ("limit=abc", ""),
+            ("tag=+m31+", "tag=m31"),
+        ],
+    )
+    def test_values_are_normalized(self, raw, canonical):
+        assert canonicalize_query(QueryDict(raw), SPEC).urlencode() == canonical
+
+    @pytest.mark.parametrize("raw", ["filter=Junk", "page=abc", "page=0", "tag=" + "x" * 11])
+    def test_uncacheable_values_raise(self, raw):
+        with pytest.raises(UncacheableRequest):
+            canonicalize_query(QueryDict(raw), SPEC)
+
+
+class TestGetCacheTimeout:
+    @pytest.mark.parametrize(
+        ("raw", "expected"), [("", 3600), ("filter=Landscape&page=2", 3600), ("tag=m31", 300)]
+    )
+    def test_free_text_values_cap_the_timeout(self, settings, raw, expected):
+        settings.API_CACHE_FREE_TEXT_TIMEOUT = 300
+        request = HttpRequest()
+        request.GET = canonicalize_query(QueryDict(raw), SPEC)
+
+        assert get_cache_timeout(request, SPEC, 3600) == expected
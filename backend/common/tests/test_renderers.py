@@ -0,0 +1,109 @@
+# backend/common/tests/test_renderers.py
+
+import io
+import json
+import math
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from django.utils.translation import gettext_lazy
+
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer
+
+PAYLOAD = {
+    "pk": uuid.UUID("0d5c8b4e-8f43-4bc8-9a55-2f1b3a7c9e10"),
+    "name": "Mgławica Oriona \u2028 M42",
+    "created_at": datetime(2026, 1, 20, 21, 30, 5, 123456, tzinfo=UTC),
+    "capture_date": date(2026, 1, 20),
+    "price": Decimal("149.99"),
+    "label": gettext_lazy("English"),
+    "tags": [{"name": "nebula", "count": 3}],
+    "nested": ReturnDict({"a": 1}, serializer=None),
+    "ratio": 0.5,
+    "empty": None,
+    7: "int key",
+}
+
+
+class TestORJSONRenderer:
+    def test_output_matches_drf_json_renderer(self):
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_line_separators_are_escaped(self):
+        assert (
+            ORJSONRenderer().render({"name": "a\u2028b\u2029c"}) == b'{"name":"a\\u2028b\\u2029c"}'
+        )
+
+    def test_none_renders_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_indented_output_matches_drf_json_renderer(self):
+        context = {"indent": 2}
+
+        assert ORJSONRenderer().render(PAYLOAD, renderer_context=context) == (
+            JSONRenderer().render(PAYLOAD, renderer_context=context)
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0.1, b'{"v":0.1}'),
+            (1e16, b'{"v":1e+16}'),
+            (1e-7, b'{"v":1e-7}'),
+            (2.5e-5, b'{"v":0.000025}'),
+        ],
+    )
+    def test_floats_round_trip_with_orjson_notation(self, value, expected):
+        content = ORJSONRenderer().render({"v": value})
+
+        assert content == expected
+        assert json.loads(content) == json.loads(JSONRenderer().render({"v": value}))
+
+    @pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+    def test_non_finite_floats_render_as_null(self, value):
+        assert ORJSONRenderer().render({"v": value}) == b'{"v":null}'
+
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            JSONRenderer().render({"v": value})
+
+    def test_integers_beyond_64_bits_fall_back_to_drf(self):
+        assert ORJSONRenderer().render({"big": 2**70}) == b'{"big":1180591620717411303424}'
+
+
+class TestORJSONParser:
+    def test_parses_utf8_body(self):
+        body = '{"name":"Mgławica","count":3}'.encode()
+
+        assert ORJSONParser().parse(io.BytesIO(body)) == {"name": "Mgławica", "count": 3}
+
+    def test_other_encodings_fall_back_to_json_parser(self):
+        body = '{"name":"Mgławica"}'.encode("utf-16")
+
+        parsed = ORJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "utf-16"})
+
+        assert parsed == {"name": "Mgławica"}
+
+    @pytest.mark.parametrize("body", [b'{"name":', b'{"value": NaN}'])
+    def test_invalid_json_raises_parse_error(self, body):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(body))
+
+        with pytest.raises(ParseError):
+            JSONParser().parse(io.BytesIO(body))
+
+
+class TestApiResponses:
+    def test_api_404_is_rendered_with_project_renderer(self, client):
+        response = client.get("/v1/does-not-exist/")
+
+        assert response.status_code == 404
+        assert response.accepted_renderer.__class__ is ORJSONRenderer
+        assert response.json() == {"detail": "Endpoint '/v1/does-not-exist/' not found."}
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import StrEnum
 from typing import IO
 
 from django.db.models.fields.files import FieldFile, ImageFieldFile
 
 
+class CacheNamespace(StrEnum):
+    """Logical API cache groups that are invalidated together."""
+
+    ASTRO = "astro"
+    TRAVEL = "travel"
+    LANDING = "landing"
+    SHOP = "shop"
+    PROFILE = "profile"
+
+
+class CacheWarmSource(StrEnum):
+    """Where the post-invalidation cache warmer reads its request targets from."""
+
+    CONFIG = "config"
+    HITS = "hits"
+
+
 @dataclass(frozen=True)
 class ImageSpec:
     """Configuration for image optimization."""
@@ -0,0 +1,61 @@
+"""Pre-computed content encoding for cached response bodies.
+
+Cached payloads are compressed once when they are stored, so cache hits can be
+answered with ready-made bytes instead of running ``GZipMiddleware`` on every
+request. Only the brotli encoding is kept: every browser sends ``br``, and
+storing the identity and gzip forms as well tripled the size of each entry.
+The rare client without brotli support gets the body decompressed on the hit
+(and gzipped by ``GZipMiddleware`` when it asks for gzip).
+"""
+
+from __future__ import annotations
+
+import re
+
+import brotli
+
+# Same threshold as GZipMiddleware: smaller bodies do not benefit from compression
+MIN_COMPRESS_LENGTH = 200
+BROTLI_QUALITY = 9
+
+BROTLI = "br"
+
+_ACCEPT_ENCODING_RE = re.compile(r"\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?")
+
+
+def compress_body(body: bytes) -> tuple[bytes, str | None]:
+    """Return the stored form of ``body`` and its content coding (``None`` for identity)."""
+    if len(body) < MIN_COMPRESS_LENGTH:
+        return body, None
+    compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    if len(compressed) < len(body):
+        return compressed, BROTLI
+    return body, None
+
+
+def decompress_body(data: bytes, encoding: str | None) -> bytes:
+    """Return the identity body of data stored by ``compress_body``."""
+    return brotli.decompress(data) if encoding == BROTLI else data
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the codings a client accepts (``q`` > 0) from an Accept-Encoding header."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        match = _ACCEPT_ENCODING_RE.match(part)
+        if not match:
+            continue
+        coding, quality = match.groups()
+        try:
+            if quality is not None and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding)
+    return accepted
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Return True when an Accept-Encoding header allows ``coding``."""
+    accepted = accepted_encodings(accept_encoding)
+    return coding in accepted or "*" in accepted
@@ -0,0 +1,14 @@
+from collections.abc import Callable
+
+from django.db import transaction
+
+
+def is_pending_on_commit(func: Callable[[], None], using: str | None = None) -> bool:
+    """
+    Return True while ``func`` is registered to run when the current transaction commits.
+
+    Django drops the callbacks of a rolled-back transaction or savepoint without
+    notice, so collectors check this before adding to the batch they registered.
+    """
+    connection = transaction.get_connection(using)
+    return any(hook == func for _savepoint_ids, hook, _robust in connection.run_on_commit)
@@ -5,6 +5,8 @@ from unittest.mock import patch
 
 import pytest
 
+from django.utils import translation
+
 from core.fixtures import (
     api_client,
     api_request_factory,
@@ -35,6 +37,16 @@ def execute_on_commit() -> Generator[None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_active_language() -> Generator[None]:
+    """
+    Requests with ?lang= activate their language on the test thread; reset it so
+    objects created by the next test are not saved in that language.
+    """
+    yield
+    translation.deactivate()
+
+
 @pytest.fixture(autouse=True)
 def global_translation_mock():
     """
@@ -1,81 +1,138 @@
 import logging
-import warnings
+import threading
+import time
+from collections.abc import Iterable
 
-from django.core.cache import cache
+from django.conf import settings
+from django.db import transaction
+
+from common.cache_metrics import cache_metrics
+from common.cache_versioning import bump_generation
+from common.tasks import invalidate_frontend_ssr_cache_task
+from common.types import CacheNamespace
+from common.utils.transactions import is_pending_on_commit
+from core.tasks import warm_api_cache_task
 
 logger = logging.getLogger(__name__)
 
 
+class InvalidationBatch:
+    """Namespaces and SSR tags queued by one transaction."""
+
+    def __init__(self) -> None:
+        self.namespaces: set[CacheNamespace] = set()
+        self.ssr_tags: set[str] = set()
+
+    def flush(self) -> None:
+        """Invalidates everything queued in the batch and empties it."""
+        namespaces, ssr_tags = sorted(self.namespaces), sorted(self.ssr_tags)
+        self.namespaces.clear()
+        self.ssr_tags.clear()
+
+        if namespaces:
+            CacheService.invalidate_namespaces(*namespaces)
+        if ssr_tags:
+            invalidate_frontend_ssr_cache_task.delay(ssr_tags)
+        if namespaces or ssr_tags:
+            logger.info(f"Flushed cache invalidation [Namespaces: {namespaces}, Tags: {ssr_tags}]")
+
+
+class InvalidationCollector:
+    """
+    Gathers cache namespaces and SSR tags touched inside a transaction and flushes
+    them once, deduplicated, when the transaction commits.
+
+    The first ``add`` of a transaction starts a batch and registers its flush as
+    the commit hook; later calls join the batch while that hook is still pending.
+    A rollback discards the hook together with the batch, so nothing queued by a
+    rolled-back transaction reaches the next commit. Outside an atomic block
+    ``on_commit`` runs immediately, so callers see the same behavior as a direct
+    invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def add(self, namespaces: Iterable[CacheNamespace] = (), ssr_tags: Iterable[str] = ()) -> None:
+        """Queues namespaces and SSR tags for invalidation after the current commit."""
+        batch: InvalidationBatch | None = getattr(self._local, "batch", None)
+        joined = batch is not None and is_pending_on_commit(batch.flush)
+        if batch is None or not joined:
+            batch = self._local.batch = InvalidationBatch()
+        batch.namespaces.update(namespaces)
+        batch.ssr_tags.update(ssr_tags)
+        if not joined:
+            transaction.on_commit(batch.flush)
+
+
+invalidation_collector = InvalidationCollector()
+
+
 class CacheService:
     """
     Centralized service for cache key management and invalidation.
     """
 
     @staticmethod
-    def clear_prefix(prefix: str) -> None:
+    def invalidate_namespaces(*namespaces: CacheNamespace) -> None:
         """
-        Clears all keys starting with the given prefix.
-        Note: On Redis, this uses SCAN to avoid blocking.
+        Invalidates every cached response stored under the given namespaces.
+        Bumps each namespace generation, so the cost does not depend on cache size;
+        entries from older generations are never read again and expire on their own.
+        The hot keys of the new generations are then re-rendered in the background.
         """
-        pattern = f"*{prefix}*"
-
-        if hasattr(cache, "delete_pattern"):
-            # django-redis specific helper
-            cache.delete_pattern(pattern)
-        elif hasattr(cache, "_cache") and hasattr(cache._cache, "get_client"):
-            # Django's native RedisCache (Django 4.0+)
-            try:
-                client = cache._cache.get_client()
-                cursor = 0
-                while True:
-                    cursor, keys = client.scan(cursor=cursor, match=pattern, count=100)
-                    if keys:
-                        client.delete(*keys)
-                    if cursor == 0:
-                        break
-            except Exception as e:
-                logger.warning(f"Failed to scan and delete cache keys with pattern {pattern}: {e}")
-                cache.clear()
-        else:
-            # Fallback for other backends (less efficient)
-            warnings.warn(
-                "Cache backend does not support delete_pattern. Global clear might be slow.",
-                UserWarning,
-                stacklevel=2,
+        for namespace in namespaces:
+            started = time.monotonic()
+            generation = bump_generation(namespace)
+            cache_metrics.increment("invalidation", "namespace", str(namespace))
+            cache_metrics.observe(
+                "invalidation_seconds", "namespace", str(namespace), time.monotonic() - started
             )
-            cache.clear()
+            logger.debug(f"Cache namespace {namespace} advanced to generation {generation}")
+
+        if settings.API_CACHE_WARM_ENABLED:
+            warm_api_cache_task.delay([str(namespace) for namespace in namespaces])
+
+    @staticmethod
+    def invalidate_namespace(namespace: CacheNamespace) -> None:
+        """Invalidates every cached response stored under the given namespace."""
+        CacheService.invalidate_namespaces(namespace)
+
+    @staticmethod
+    def invalidate_on_commit(*namespaces: CacheNamespace, ssr_tags: Iterable[str] = ()) -> None:
+        """
+        Invalidates the given namespaces and frontend SSR tags once the current
+        transaction commits. Repeated calls within one transaction are coalesced,
+        so bulk edits bump each generation and enqueue the SSR task only once.
+        """
+        invalidation_collector.add(namespaces, ssr_tags)
 
     @staticmethod
     def invalidate_user_cache() -> None:
         """Invalidates user-related API cache."""
-        CacheService.clear_prefix("api_cache:/v1/profile")
+        CacheService.invalidate_namespace(CacheNamespace.PROFILE)
         logger.info("Invalidated user cache")
 
     @staticmethod
     def invalidate_astrophotography_cache() -> None:
         """Invalidates astrophotography-related API cache."""
-        CacheService.clear_prefix("api_cache:/v1/astroimages")
-        CacheService.clear_prefix("api_cache:/v1/image")
-        CacheService.clear_prefix("api_cache:/v1/tags")
-        CacheService.clear_prefix("api_cache:/v1/categories")
-        CacheService.clear_prefix("api_cache:/v1/background")
+        CacheService.invalidate_namespace(CacheNamespace.ASTRO)
         logger.info("Invalidated astrophotography cache")
 
     @staticmethod
     def invalidate_travel_cache() -> None:
         """Invalidates travel-related API cache."""
-        CacheService.clear_prefix("api_cache:/v1/travel-highlights")
-        CacheService.clear_prefix("api_cache:/v1/travel/")
+        CacheService.invalidate_namespace(CacheNamespace.TRAVEL)
         logger.info("Invalidated travel cache")
 
     @staticmethod
     def invalidate_landing_page_cache() -> None:
         """Invalidates landing-page related API cache."""
-        CacheService.clear_prefix("api_cache:/v1/settings")
+        CacheService.invalidate_namespace(CacheNamespace.LANDING)
         logger.info("Invalidated landing page cache")
 
     @staticmethod
     def invalidate_shop_cache() -> None:
         """Invalidates shop API cache."""
-        CacheService.clear_prefix("api_cache_shop:/v1/shop")
+        CacheService.invalidate_namespace(CacheNamespace.SHOP)
         logger.info("Invalidated shop cache")
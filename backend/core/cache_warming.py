@@ -0,0 +1,94 @@
+"""Post-invalidation warming of hot public API responses.
+
+Bumping a namespace generation leaves every key of that namespace cold, so the
+first visitor after a publish pays the full render for each language and filter
+combination. ``warm_api_cache`` re-renders the hot targets right after the
+invalidation, through the same internal re-render used by soft-TTL refreshes,
+so the new generation is populated before real traffic reaches it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from django.conf import settings
+
+from common.cache_hits import get_hot_targets
+from common.cache_refresh import render_cached_request
+from common.types import CacheNamespace, CacheWarmSource
+from translation.services import TranslationService
+
+logger = logging.getLogger("core.cache")
+
+
+def get_configured_paths(namespace: CacheNamespace) -> list[str]:
+    """Return the configured paths of a namespace, plus the first gallery page per category."""
+    paths = list(settings.API_CACHE_WARM_PATHS.get(namespace, []))
+    if namespace == CacheNamespace.ASTRO:
+        from astrophotography.models import AstroImage
+
+        categories = (
+            AstroImage.objects.order_by("celestial_object")
+            .values_list("celestial_object", flat=True)
+            .distinct()
+        )
+        paths.extend(
+            f"/v1/astroimages/?{urlencode({'filter': category})}" for category in categories
+        )
+    return paths
+
+
+def build_configured_targets(namespace: CacheNamespace) -> list[dict[str, Any]]:
+    """
+    Expand the configured paths into request targets for every available language.
+
+    Each path is warmed twice per language: SSR requests select the language via
+    ``Accept-Language`` while browser requests add ``?lang=``, and the query string
+    is part of the cache key.
+    """
+    targets: list[dict[str, Any]] = []
+    for path_with_query in get_configured_paths(namespace):
+        url = urlsplit(path_with_query)
+        params = parse_qsl(url.query)
+        for language in TranslationService.get_available_languages():
+            for query_params in (params, [*params, ("lang", language)]):
+                targets.append(
+                    {
+                        "path": url.path,
+                        "query_string": urlencode(query_params),
+                        "language": language,
+                        "host": settings.API_CACHE_WARM_HOST,
+                        "secure": settings.API_CACHE_WARM_SECURE,
+                    }
+                )
+    return targets
+
+
+def build_warm_targets(namespace: CacheNamespace) -> list[dict[str, Any]]:
+    """Return the request targets to warm for a namespace."""
+    if settings.API_CACHE_WARM_SOURCE == CacheWarmSource.HITS:
+        hot_targets = get_hot_targets(namespace, settings.API_CACHE_WARM_HIT_LIMIT)
+        if hot_targets:
+            return hot_targets
+    return build_configured_targets(namespace)
+
+
+def warm_api_cache(namespaces: Iterable[str]) -> int:
+    """Re-render the hot targets of the given namespaces and return how many were stored."""
+    namespace_list = [CacheNamespace(namespace) for namespace in namespaces]
+    warmed = 0
+    for namespace in namespace_list:
+        for target in build_warm_targets(namespace):
+            try:
+                status_code = render_cached_request(**target)
+            except Exception:
+                logger.exception(f"Cache warm-up failed [Target: {target}]")
+                continue
+            if status_code == 200:
+                warmed += 1
+
+    logger.info(f"Warmed {warmed} cached API response(s) for {namespace_list}")
+    return warmed
@@ -6,6 +6,8 @@ from rest_framework.test import APIClient, APIRequestFactory
 from django.core.cache import cache as django_cache
 from django.test import Client, RequestFactory
 
+from common.local_cache import local_package_cache
+
 
 @pytest.fixture
 def api_client() -> APIClient:
@@ -25,8 +27,10 @@ def clear_django_cache() -> Generator[None]:
     Automatically clear cache for all tests to ensure isolation.
     """
     django_cache.clear()
+    local_package_cache.clear()
     yield
     django_cache.clear()
+    local_package_cache.clear()
 
 
 @pytest.fixture
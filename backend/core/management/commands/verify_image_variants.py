@@ -0,0 +1,33 @@
+"""Check ImageVariant files in storage and persist which ones are missing.
+
+The public read path trusts ``ImageVariant.file_missing`` instead of statting
+storage on every request; this command runs the same sweep as the periodic
+``core.verify_image_variant_files`` task, e.g. after restoring media.
+"""
+
+from django.core.management.base import BaseCommand
+
+from core.models import ImageVariant
+
+
+class Command(BaseCommand):
+    """Refresh the persisted file-existence state of every image variant."""
+
+    help = "Verify that ImageVariant files exist in storage and flag the missing ones."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows checked and updated per batch.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        missing_count = ImageVariant.objects.verify_files(batch_size=options["batch_size"])
+        checked_count = ImageVariant.objects.exclude(file="").count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked_count} image variant(s), {missing_count} missing file(s)."
+            )
+        )
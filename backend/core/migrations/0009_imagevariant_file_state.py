@@ -0,0 +1,34 @@
+# Generated by Django 6.0.5 on 2026-10-17 09:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_remove_landingpagesettings_serve_webp_images_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imagevariant",
+            name="file_checked_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="When storage last confirmed whether the variant file exists.",
+                null=True,
+                verbose_name="File Checked At",
+            ),
+        ),
+        migrations.AddField(
+            model_name="imagevariant",
+            name="file_missing",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Set when storage no longer has the file; public URLs skip such variants.",
+                verbose_name="File Missing",
+            ),
+        ),
+    ]
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from django.core.files.base import ContentFile
 from django.db import models
-from django.db.models import QuerySet
 from django.db.models.base import ModelBase
 from django.db.models.fields.files import ImageFieldFile
 
@@ -17,6 +16,9 @@ from common.utils.image import (
     file_exists_in_storage,
 )
 
+if TYPE_CHECKING:
+    from core.models import ImageVariantQuerySet
+
 type ImageVariantTarget = tuple[str, int, int]
 
 
@@ -144,6 +146,7 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
                     self._get_expected_image_variant_targets(source),
                 ).count()
             )
+            variant_queryset.mark_verified()
             return int(deleted_count) + generated_count
 
         variants_to_generate, variants_to_delete = self._get_image_variant_sync_plan(source)
@@ -154,6 +157,8 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
                 variants_to_generate,
             ).count()
         )
+        # Rows left after the plan were just found in storage or were just written
+        variant_queryset.mark_verified()
         return deleted_count + generated_count
 
     @staticmethod
@@ -163,9 +168,9 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
             return f"{source_name}__{role}"
         return role
 
-    def _get_variant_queryset_for_source(self, source: ImageVariantSource) -> models.QuerySet[Any]:
+    def _get_variant_queryset_for_source(self, source: ImageVariantSource) -> ImageVariantQuerySet:
         """Return the variant rows owned by exactly one source family."""
-        variants: QuerySet = self.variants.all()  # type: ignore[attr-defined]
+        variants: ImageVariantQuerySet = self.variants.all()  # type: ignore[attr-defined]
         if source.role_namespace:
             return variants.filter(role__startswith=f"{source.role_namespace}__")
         return variants
@@ -312,6 +317,41 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
                 ) from exc
         return None
 
+    def _get_prefetched_variants(self) -> list[Any] | None:
+        """Return the variant rows loaded by ``prefetch_related("variants")``, if any."""
+        prefetched_objects = getattr(self, "_prefetched_objects_cache", {})
+        if "variants" not in prefetched_objects:
+            return None
+        return list(prefetched_objects["variants"])
+
+    def _get_role_variants(self, stored_role: str, width: int | None = None) -> list[Any]:
+        """Return the non-empty variants of one stored role, widest first.
+
+        Querysets that prefetch ``variants`` resolve a whole page of objects with a
+        single query; the rows are then picked here in memory. Without a prefetch
+        the lookup falls back to a per-object query. Storage is never touched: rows
+        flagged ``file_missing`` by syncing or the integrity sweep are skipped.
+        """
+        prefetched = self._get_prefetched_variants()
+        if prefetched is None:
+            variants = cast(Any, self).variants.available().filter(role=stored_role)
+            if width is not None:
+                variants = variants.filter(width=width)
+            return list(variants.order_by("-width"))
+
+        return sorted(
+            (
+                variant
+                for variant in prefetched
+                if variant.role == stored_role
+                and variant.file.name
+                and not variant.file_missing
+                and (width is None or variant.width == width)
+            ),
+            key=lambda variant: variant.width,
+            reverse=True,
+        )
+
     def get_variant_file(
         self,
         role: str,
@@ -321,14 +361,8 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
     ) -> ImageFieldFile | None:
         """Return one stored variant file by role, width, and optional source family."""
         stored_role = self._build_variant_role(role, source_name)
-        variants = self.variants.filter(  # type: ignore[attr-defined]
-            role=stored_role,
-            width=width,
-        ).exclude(file="")
-        for variant in variants:
-            if file_exists_in_storage(variant.file):
-                return cast(ImageFieldFile, variant.file)
-        return None
+        variants = self._get_role_variants(stored_role, width)
+        return cast(ImageFieldFile, variants[0].file) if variants else None
 
     def get_variant_image_url(self, role: str, width: int) -> str | None:
         """Return the public URL for one generated variant role when it exists."""
@@ -359,20 +393,10 @@ class ImageVariantModelMixin(metaclass=DjangoModelABCMeta):
         source_name: str | None = None,
     ) -> str | None:
         """Return an existing variant URL for a role, preferring an exact width."""
+        stored_role = self._build_variant_role(role, source_name)
+        variants = self._get_role_variants(stored_role)
         if preferred_width is not None:
-            variant_url = self.get_variant_url(
-                role,
-                preferred_width,
-                source_name=source_name,
-            )
-            if variant_url:
-                return variant_url
+            # Stable sort: the preferred width first, then the remaining rows widest first
+            variants.sort(key=lambda variant: variant.width != preferred_width)
 
-        stored_role = self._build_variant_role(role, source_name)
-        variants = (
-            cast(Any, self).variants.filter(role=stored_role).exclude(file="").order_by("-width")
-        )
-        for variant in variants:
-            if file_exists_in_storage(variant.file):
-                return str(variant.file.url)
-        return None
+        return str(variants[0].file.url) if variants else None
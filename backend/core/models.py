@@ -1,6 +1,6 @@
 import logging
 import uuid
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Self
 
 from parler.models import TranslatableModel
 
@@ -9,6 +9,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models.fields.files import ImageFieldFile
+from django.dispatch import Signal
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from common.types import ImageVariantSource, ImageVariantSpec
@@ -23,6 +25,11 @@ from core.tasks import process_image_task
 
 logger = logging.getLogger(__name__)
 
+# Sent with ``variants`` after a bulk update flipped their ``file_missing`` flag.
+# ``update``/``bulk_update`` skip the model signals, so apps whose cached payloads
+# embed variant URLs listen here instead.
+variant_files_changed = Signal()
+
 
 class ImageVariantQuerySet(models.QuerySet):
     """QuerySet that keeps file cleanup consistent with instance deletion."""
@@ -32,6 +39,46 @@ class ImageVariantQuerySet(models.QuerySet):
             variant.delete_file()
         return super().delete()
 
+    def available(self) -> Self:
+        """Return variants with a stored file that was not found missing."""
+        return self.exclude(file="").filter(file_missing=False)
+
+    def mark_verified(self) -> int:
+        """Record that the files of these variants were just confirmed in storage."""
+        restored = list(self.filter(file_missing=True))
+        updated = self.update(file_missing=False, file_checked_at=timezone.now())
+        if restored:
+            variant_files_changed.send(sender=self.model, variants=restored)
+        return updated
+
+    def verify_files(self, batch_size: int = 500) -> int:
+        """Check every variant file in storage, persist the result and return the missing count.
+
+        This is the only place besides variant syncing that stats storage for
+        variants; the public read path trusts the stored ``file_missing`` flag.
+        Variants whose flag flipped are announced through ``variant_files_changed``.
+        """
+        checked_at = timezone.now()
+        missing_count = 0
+        flipped: list[ImageVariant] = []
+        batch: list[ImageVariant] = []
+        for variant in self.exclude(file="").iterator(chunk_size=batch_size):
+            file_missing = not file_exists_in_storage(variant.file)
+            if file_missing != variant.file_missing:
+                flipped.append(variant)
+            variant.file_missing = file_missing
+            variant.file_checked_at = checked_at
+            missing_count += int(file_missing)
+            batch.append(variant)
+            if len(batch) >= batch_size:
+                self.bulk_update(batch, ["file_missing", "file_checked_at"])
+                batch = []
+        if batch:
+            self.bulk_update(batch, ["file_missing", "file_checked_at"])
+        if flipped:
+            variant_files_changed.send(sender=self.model, variants=flipped)
+        return missing_count
+
 
 class ImageVariant(models.Model):
     """A generated responsive image file owned by an image model instance."""
@@ -81,6 +128,19 @@ class ImageVariant(models.Model):
         verbose_name=_("MIME Type"),
         help_text=_("MIME type of the generated variant file."),
     )
+    file_missing = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("File Missing"),
+        help_text=_("Set when storage no longer has the file; public URLs skip such variants."),
+    )
+    file_checked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("File Checked At"),
+        help_text=_("When storage last confirmed whether the variant file exists."),
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name=_("Created At"),
@@ -1,8 +1,6 @@
 from rest_framework import serializers
 
-from django.db.models import Sum
-
-from astrophotography.models import AstroImage
+from astrophotography.models import ExposureHoursTotal
 from astrophotography.serializers import MeteorsMainPageConfigSerializer
 from core.models import LandingPageSettings
 
@@ -16,16 +14,34 @@ class LandingPageSettingsSerializer(serializers.ModelSerializer):
     lastimages = serializers.BooleanField(source="lastimages_enabled", read_only=True)
     shop = serializers.BooleanField(source="shop_enabled", read_only=True)
     total_time_spent = serializers.SerializerMethodField()
+    total_time_spent_by_category = serializers.SerializerMethodField()
     meteors = MeteorsMainPageConfigSerializer(read_only=True)
 
+    @staticmethod
+    def _round_hours(hours: float) -> int:
+        fractional_hours = hours - int(hours)
+        if fractional_hours < 0.5:
+            return int(hours)
+        return int(hours) + 1
+
+    def _get_exposure_breakdown(self) -> dict[str, float]:
+        """Stored hours per celestial object, read once per serialization."""
+        if not hasattr(self, "_exposure_breakdown"):
+            self._exposure_breakdown = ExposureHoursTotal.objects.breakdown()
+        return self._exposure_breakdown
+
     def get_total_time_spent(self, obj: LandingPageSettings) -> int:
         del obj
-        aggregate = AstroImage.objects.aggregate(total=Sum("calculated_exposure_hours"))
-        total_hours = float(aggregate["total"] or 0) + self.TOTAL_TIME_SPENT_SAFETY_BUFFER_HOURS
-        fractional_hours = total_hours - int(total_hours)
-        if fractional_hours < 0.5:
-            return int(total_hours)
-        return int(total_hours) + 1
+        total_hours = sum(self._get_exposure_breakdown().values())
+        return self._round_hours(total_hours + self.TOTAL_TIME_SPENT_SAFETY_BUFFER_HOURS)
+
+    def get_total_time_spent_by_category(self, obj: LandingPageSettings) -> dict[str, int]:
+        del obj
+        return {
+            category: self._round_hours(hours)
+            for category, hours in sorted(self._get_exposure_breakdown().items())
+            if hours > 0
+        }
 
     class Meta:
         model = LandingPageSettings
@@ -36,5 +52,6 @@ class LandingPageSettingsSerializer(serializers.ModelSerializer):
             "lastimages",
             "shop",
             "total_time_spent",
+            "total_time_spent_by_category",
             "meteors",
         ]
@@ -1,10 +1,10 @@
 from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from common.tasks import invalidate_frontend_ssr_cache_task
+from common.types import CacheNamespace
 from core.cache_service import CacheService
 
-from .models import LandingPageSettings
+from .models import ImageVariant, LandingPageSettings, variant_files_changed
 
 
 @receiver([post_save, post_delete], sender=LandingPageSettings)
@@ -12,13 +12,14 @@ def invalidate_settings_cache(sender, instance, **kwargs):
     """
     Triggers both Backend API cache invalidation and Frontend SSR cache invalidation.
     """
-    # 1. Clear Backend API Cache
-    CacheService.invalidate_landing_page_cache()
-    CacheService.invalidate_astrophotography_cache()
-    CacheService.invalidate_shop_cache()
-
-    # 2. Clear Frontend SSR Cache (Async)
-    invalidate_frontend_ssr_cache_task.delay_on_commit(["settings", "latest-astro-images", "shop"])
+    # Backend namespaces and frontend SSR tags are flushed together on commit, so the
+    # post_save and m2m_changed signals of one admin save invalidate only once.
+    CacheService.invalidate_on_commit(
+        CacheNamespace.LANDING,
+        CacheNamespace.ASTRO,
+        CacheNamespace.SHOP,
+        ssr_tags=["settings", "latest-astro-images", "shop"],
+    )
 
 
 @receiver(m2m_changed, sender=LandingPageSettings.latest_filters.through)
@@ -28,3 +29,18 @@ def invalidate_settings_m2m_cache(sender, instance, action, **kwargs):
     """
     if action in ["post_add", "post_remove", "post_clear"]:
         invalidate_settings_cache(sender=LandingPageSettings, instance=instance)
+
+
+@receiver(variant_files_changed, sender=ImageVariant)
+def invalidate_variant_owner_caches(sender, variants, **kwargs):
+    """
+    Clears every API namespace and SSR shell that renders variant URLs after
+    stored variant files appeared or disappeared.
+    """
+    CacheService.invalidate_on_commit(
+        CacheNamespace.ASTRO,
+        CacheNamespace.TRAVEL,
+        CacheNamespace.SHOP,
+        CacheNamespace.PROFILE,
+        ssr_tags=["latest-astro-images", "travel-highlights", "background", "shop", "profile"],
+    )
@@ -8,13 +8,29 @@ so the final <loc> URLs will correctly point to SITE_DOMAIN.
 """
 
 from math import ceil
+from typing import Any
 
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps.views import sitemap
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_page
 
 from astrophotography.models import AstroImage, MainPageLocation
 from astrophotography.pagination import AstroImagePagination
+from common.cache_versioning import get_generations
+from common.types import CacheNamespace
 from core.models import LandingPageSettings
 
+# Cache for 12 hours to keep generation cheap while refreshing
+# reasonably often as content changes.
+SITEMAP_CACHE_TIMEOUT = 43200
+SITEMAP_CACHE_NAMESPACES = (
+    CacheNamespace.LANDING,
+    CacheNamespace.ASTRO,
+    CacheNamespace.TRAVEL,
+    CacheNamespace.SHOP,
+)
+
 
 class StaticViewSitemap(Sitemap):
     """Hardcoded frontend pages that have no corresponding Django model."""
@@ -116,3 +132,13 @@ class ShopSitemap(Sitemap):
 
     def location(self, item: str) -> str:
         return item
+
+
+def cached_sitemap_view(request: Any, *args: Any, **kwargs: Any) -> HttpResponse:
+    """
+    Serve the sitemap through ``cache_page`` keyed by the generations of the
+    content it lists, so API cache invalidation also refreshes the sitemap.
+    """
+    generations = ".".join(str(value) for value in get_generations(SITEMAP_CACHE_NAMESPACES))
+    view = cache_page(SITEMAP_CACHE_TIMEOUT, key_prefix=f"sitemap:{generations}")(sitemap)
+    return view(request, *args, **kwargs)
@@ -7,6 +7,7 @@ from django.apps import apps
 from django.conf import settings
 
 from common.celery import CommitAwareTask
+from core.cache_warming import warm_api_cache
 
 logger = logging.getLogger(__name__)
 
@@ -66,3 +67,32 @@ def process_image_task(
         if settings.ENABLE_SENTRY:
             sentry_sdk.capture_exception(exc)
         raise
+
+
+@shared_task(  # type: ignore[untyped-decorator]
+    name="core.warm_api_cache",
+    ignore_result=True,
+)
+def warm_api_cache_task(namespaces: list[str]) -> int:
+    """Re-render hot public API responses after their namespaces were invalidated."""
+    return warm_api_cache(namespaces)
+
+
+def verify_image_variant_files() -> int:
+    """Record which ImageVariant files still exist in storage and return the missing count."""
+    ImageVariant = apps.get_model("core", "ImageVariant")
+    missing_count = int(ImageVariant.objects.verify_files())
+    if missing_count:
+        logger.warning("Image variant integrity sweep found %s missing file(s)", missing_count)
+    else:
+        logger.info("Image variant integrity sweep found no missing files")
+    return missing_count
+
+
+@shared_task(  # type: ignore[untyped-decorator]
+    name="core.verify_image_variant_files",
+    ignore_result=True,
+)
+def verify_image_variant_files_task() -> int:
+    """Periodic integrity sweep over the stored ImageVariant files."""
+    return verify_image_variant_files()
@@ -0,0 +1,111 @@
+# backend/core/tests/test_cache_metrics.py
+
+from unittest.mock import patch
+
+import pytest
+
+from django.urls import reverse
+
+from common.cache_metrics import CacheMetrics, Histogram, cache_metrics
+from common.types import CacheNamespace
+from core.cache_service import CacheService
+from core.tests.factories import LandingPageSettingsFactory
+
+SETTINGS_LABELS = ("api_cache", "v1/settings/")
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_metrics():
+    cache_metrics.snapshot(reset=True)
+    yield
+    cache_metrics.snapshot(reset=True)
+
+
+class TestCacheMetricsRegistry:
+    def test_histogram_fields_are_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.as_fields("recompute_seconds") == {
+            "recompute_seconds_count": 4,
+            "recompute_seconds_sum": 4.05,
+            "recompute_seconds_le_0.1": 1,
+            "recompute_seconds_le_1": 3,
+        }
+
+    def test_flush_logs_one_record_per_label_and_resets(self):
+        metrics = CacheMetrics()
+        metrics.increment("hit", "api_cache", "v1/tags/", amount=3)
+        metrics.increment("miss", "api_cache", "v1/tags/")
+        metrics.observe("payload_bytes", "api_cache", "v1/tags/", 2000)
+
+        with patch("common.cache_metrics.logger.info") as mock_info:
+            metrics.flush()
+
+        mock_info.assert_called_once()
+        extra = mock_info.call_args.kwargs["extra"]
+        assert extra["cache_key_prefix"] == "api_cache"
+        assert extra["cache_route"] == "v1/tags/"
+        assert (extra["hit"], extra["miss"]) == (3, 1)
+        assert extra["payload_bytes_count"] == 1
+        assert extra["payload_bytes_le_4096"] == 1
+        assert metrics.snapshot() == {}
+
+    def test_flushes_once_the_interval_has_elapsed(self, settings):
+        settings.API_CACHE_METRICS_INTERVAL = 0
+        metrics = CacheMetrics()
+
+        with patch("common.cache_metrics.logger.info") as mock_info:
+            metrics.increment("hit", "api_cache", "v1/tags/")
+
+        mock_info.assert_called_once()
+
+    def test_disabled_metrics_are_not_recorded(self, settings):
+        settings.API_CACHE_METRICS_ENABLED = False
+        metrics = CacheMetrics()
+
+        metrics.increment("hit", "api_cache", "v1/tags/")
+        metrics.observe("payload_bytes", "api_cache", "v1/tags/", 10)
+
+        assert metrics.snapshot() == {}
+
+
+@pytest.mark.django_db
+class TestCacheResponseMetrics:
+    def test_counts_miss_hit_and_not_modified_per_route(self, api_client):
+        LandingPageSettingsFactory()
+        url = reverse("settings")
+
+        first = api_client.get(url)
+        api_client.get(url)
+        api_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        fields = cache_metrics.snapshot()[SETTINGS_LABELS]
+        assert fields["miss"] == 1
+        assert fields["hit"] == 1
+        assert fields["revalidated"] == 1
+        assert fields["not_modified"] == 1
+        assert fields["recompute_seconds_count"] == 1
+        assert fields["payload_bytes_count"] == 1
+        assert fields["payload_bytes_sum"] == len(first.content)
+
+    def test_counts_unreachable_cache(self, api_client):
+        LandingPageSettingsFactory()
+        url = reverse("settings")
+        api_client.get(url)
+
+        with patch("common.decorators.cache.cache") as mock_cache:
+            mock_cache.get.side_effect = ConnectionError("redis down")
+            api_client.get(url)
+
+        assert cache_metrics.snapshot()[SETTINGS_LABELS]["cache_error"] == 1
+
+    def test_invalidation_duration_is_recorded_per_namespace(self):
+        CacheService.invalidate_namespaces(CacheNamespace.ASTRO, CacheNamespace.LANDING)
+
+        snapshot = cache_metrics.snapshot()
+        for namespace in ("astro", "landing"):
+            fields = snapshot[("namespace", namespace)]
+            assert fields["invalidation"] == 1
+            assert fields["invalidation_seconds_count"] == 1
@@ -0,0 +1,205 @@
+# backend/core/tests/test_cache_service.py
+
+from unittest.mock import call, patch
+
+import pytest
+from rest_framework import status
+
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+
+from common.cache_versioning import bump_generation, get_generation, get_generation_key
+from common.types import CacheNamespace
+from core.cache_service import CacheService
+from users.tests.factories import UserFactory
+
+
+class TestCacheGenerations:
+    def test_generation_is_created_on_first_read(self):
+        assert cache.get(get_generation_key(CacheNamespace.ASTRO)) is None
+
+        generation = get_generation(CacheNamespace.ASTRO)
+
+        assert generation > 0
+        assert get_generation(CacheNamespace.ASTRO) == generation
+
+    def test_bump_advances_only_the_given_namespace(self):
+        astro = get_generation(CacheNamespace.ASTRO)
+        shop = get_generation(CacheNamespace.SHOP)
+
+        assert bump_generation(CacheNamespace.ASTRO) == astro + 1
+        assert get_generation(CacheNamespace.ASTRO) == astro + 1
+        assert get_generation(CacheNamespace.SHOP) == shop
+
+    def test_bump_creates_missing_generation(self):
+        assert bump_generation(CacheNamespace.TRAVEL) == get_generation(CacheNamespace.TRAVEL)
+
+    def test_recent_generation_is_reused_within_local_ttl(self, settings):
+        settings.API_CACHE_LOCAL_GENERATION_TTL = 60
+        generation = bump_generation(CacheNamespace.SHOP)
+
+        with patch("common.cache_versioning.cache") as mock_cache:
+            assert get_generation(CacheNamespace.SHOP) == generation
+
+        mock_cache.get.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("method_name", "namespace"),
+        [
+            ("invalidate_user_cache", CacheNamespace.PROFILE),
+            ("invalidate_astrophotography_cache", CacheNamespace.ASTRO),
+            ("invalidate_travel_cache", CacheNamespace.TRAVEL),
+            ("invalidate_landing_page_cache", CacheNamespace.LANDING),
+            ("invalidate_shop_cache", CacheNamespace.SHOP),
+        ],
+    )
+    def test_invalidation_is_a_single_increment(self, method_name, namespace):
+        before = get_generation(namespace)
+
+        with patch.object(cache, "clear") as mock_clear:
+            getattr(CacheService, method_name)()
+
+        mock_clear.assert_not_called()
+        assert get_generation(namespace) == before + 1
+
+
+@pytest.mark.django_db
+class TestVersionedCacheKeys:
+    def test_cache_key_embeds_namespace_generation(self, api_client):
+        UserFactory()
+        generation = get_generation(CacheNamespace.PROFILE)
+
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            response = api_client.get(reverse("users:profile-profile"))
+
+        assert response.status_code == status.HTTP_200_OK
+        cache_key = next(
+            call.args[0] for call in mock_set.call_args_list if isinstance(call.args[1], dict)
+        )
+        assert cache_key.startswith(f"api_cache:profile:{generation}:/v1/profile")
+
+    def test_old_generation_entries_are_not_read(self, api_client):
+        UserFactory()
+        url = reverse("users:profile-profile")
+        api_client.get(url)
+
+        CacheService.invalidate_user_cache()
+
+        with patch("common.decorators.cache.logger.debug") as mock_logger:
+            api_client.get(url)
+
+        args = [call.args[0] for call in mock_logger.call_args_list]
+        assert any("Cache MISS" in arg for arg in args)
+
+
+def invalidate_and_roll_back(namespace):
+    """Queue an invalidation inside an atomic block that then raises."""
+    with transaction.atomic():
+        CacheService.invalidate_on_commit(namespace)
+        raise RuntimeError("rolled back")
+
+
+@pytest.mark.django_db
+class TestInvalidationCollector:
+    @pytest.fixture
+    def commit(self):
+        """
+        Register on_commit callbacks on the real connection, as outside tests, and
+        return a function that runs and clears them like a commit of the test
+        transaction would.
+        """
+
+        def register(func, using=None, robust=False):
+            transaction.get_connection(using).on_commit(func, robust)
+
+        def run_commit_hooks():
+            connection = transaction.get_connection()
+            hooks, connection.run_on_commit = connection.run_on_commit, []
+            for _savepoint_ids, hook, _robust in hooks:
+                hook()
+
+        with patch("django.db.transaction.on_commit", side_effect=register):
+            yield run_commit_hooks
+
+    def test_repeated_invalidations_flush_once_on_commit(self, commit):
+        astro = get_generation(CacheNamespace.ASTRO)
+        landing = get_generation(CacheNamespace.LANDING)
+
+        with patch("core.cache_service.invalidate_frontend_ssr_cache_task.delay") as mock_ssr:
+            CacheService.invalidate_on_commit(CacheNamespace.ASTRO, ssr_tags=["background"])
+            CacheService.invalidate_on_commit(
+                CacheNamespace.ASTRO, CacheNamespace.LANDING, ssr_tags=["settings", "background"]
+            )
+
+            assert get_generation(CacheNamespace.ASTRO) == astro
+            mock_ssr.assert_not_called()
+
+            commit()
+
+        assert get_generation(CacheNamespace.ASTRO) == astro + 1
+        assert get_generation(CacheNamespace.LANDING) == landing + 1
+        mock_ssr.assert_called_once_with(["background", "settings"])
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.usefixtures("commit")
+    def test_rolled_back_invalidations_do_not_reach_the_next_commit(self):
+        astro = get_generation(CacheNamespace.ASTRO)
+        landing = get_generation(CacheNamespace.LANDING)
+
+        with pytest.raises(RuntimeError):
+            invalidate_and_roll_back(CacheNamespace.ASTRO)
+
+        with transaction.atomic():
+            CacheService.invalidate_on_commit(CacheNamespace.LANDING)
+
+        assert get_generation(CacheNamespace.ASTRO) == astro
+        assert get_generation(CacheNamespace.LANDING) == landing + 1
+
+    def test_rolled_back_savepoint_starts_a_new_batch(self, commit):
+        astro = get_generation(CacheNamespace.ASTRO)
+        landing = get_generation(CacheNamespace.LANDING)
+
+        with pytest.raises(RuntimeError):
+            invalidate_and_roll_back(CacheNamespace.ASTRO)
+        CacheService.invalidate_on_commit(CacheNamespace.LANDING)
+        commit()
+
+        assert get_generation(CacheNamespace.ASTRO) == astro
+        assert get_generation(CacheNamespace.LANDING) == landing + 1
+
+    def test_image_and_translation_saves_coalesce_into_one_flush(self, commit):
+        from astrophotography.tests.factories import AstroImageFactory
+
+        with (
+            patch("core.models.process_image_task.delay_on_commit"),
+            patch(
+                "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
+            ),
+            patch("core.cache_service.invalidate_frontend_ssr_cache_task.delay") as mock_ssr,
+            patch.object(CacheService, "invalidate_namespaces") as mock_invalidate,
+        ):
+            image = AstroImageFactory()
+            image.set_current_language("en")
+            image.name = "Renamed"
+            image.save()
+            image.delete()
+
+            commit()
+
+        # One flush for the commit, plus the document rebuild's own gallery bump
+        assert mock_invalidate.call_count == 2
+        assert (
+            mock_invalidate.call_args_list.count(
+                call(CacheNamespace.ASTRO, CacheNamespace.LANDING, CacheNamespace.TRAVEL)
+            )
+            == 1
+        )
+        assert mock_invalidate.call_args_list.count(call(CacheNamespace.ASTRO)) == 1
+        assert mock_ssr.call_count == 2
+        assert (
+            mock_ssr.call_args_list.count(
+                call(["latest-astro-images", "settings", "travel-highlights"])
+            )
+            == 1
+        )
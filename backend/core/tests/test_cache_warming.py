@@ -0,0 +1,123 @@
+# backend/core/tests/test_cache_warming.py
+
+from unittest.mock import patch
+
+import pytest
+
+from django.test import override_settings
+from django.urls import reverse
+
+from astrophotography.tests.factories import AstroImageFactory
+from common.cache_hits import get_hot_targets
+from common.types import CacheNamespace
+from core.cache_service import CacheService
+from core.cache_warming import build_configured_targets, build_warm_targets, warm_api_cache
+from core.tests.factories import LandingPageSettingsFactory
+
+WARM_PATHS = {"landing": ["/v1/settings/"], "astro": ["/v1/tags/?latest=true"]}
+
+
+@pytest.mark.django_db
+class TestCacheWarming:
+    @pytest.fixture(autouse=True)
+    def warm_settings(self, settings):
+        settings.API_CACHE_WARM_PATHS = WARM_PATHS
+        settings.API_CACHE_WARM_HOST = "testserver"
+
+    def test_configured_targets_cover_every_language_with_and_without_lang_param(
+        self, mock_get_available_languages
+    ):
+        targets = build_configured_targets(CacheNamespace.LANDING)
+
+        assert [(target["language"], target["query_string"]) for target in targets] == [
+            ("en", ""),
+            ("en", "lang=en"),
+            ("pl", ""),
+            ("pl", "lang=pl"),
+        ]
+        assert {target["path"] for target in targets} == {"/v1/settings/"}
+
+    def test_astro_targets_include_first_gallery_page_per_category(
+        self, mock_get_available_languages
+    ):
+        with patch("core.models.process_image_task.delay_on_commit"):
+            AstroImageFactory(celestial_object="Deep Sky")
+            AstroImageFactory(celestial_object="Landscape")
+
+        targets = build_configured_targets(CacheNamespace.ASTRO)
+
+        queries = {(target["path"], target["query_string"]) for target in targets}
+        assert ("/v1/tags/", "latest=true") in queries
+        assert ("/v1/astroimages/", "filter=Deep+Sky&lang=pl") in queries
+        assert ("/v1/astroimages/", "filter=Landscape") in queries
+
+    def test_warmed_response_is_served_from_cache(self, api_client, mock_get_available_languages):
+        LandingPageSettingsFactory()
+
+        assert warm_api_cache([CacheNamespace.LANDING]) == 4
+
+        with patch("common.decorators.cache.logger.debug") as mock_logger:
+            api_client.get(reverse("settings"), HTTP_ACCEPT_LANGUAGE="pl")
+
+        assert any("Cache HIT" in call.args[0] for call in mock_logger.call_args_list)
+
+    def test_warming_is_not_throttled(self, mock_get_available_languages):
+        LandingPageSettingsFactory()
+
+        with patch(
+            "rest_framework.throttling.SimpleRateThrottle.allow_request", return_value=False
+        ):
+            assert warm_api_cache([CacheNamespace.LANDING]) == 4
+
+    @override_settings(API_CACHE_WARM_ENABLED=True)
+    def test_invalidation_schedules_warm_up_once(self):
+        with patch("core.cache_service.warm_api_cache_task.delay") as mock_delay:
+            CacheService.invalidate_namespaces(CacheNamespace.ASTRO, CacheNamespace.TRAVEL)
+
+        mock_delay.assert_called_once_with(["astro", "travel"])
+
+    def test_invalidation_skips_warm_up_when_disabled(self):
+        with patch("core.cache_service.warm_api_cache_task.delay") as mock_delay:
+            CacheService.invalidate_landing_page_cache()
+
+        mock_delay.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestHitDrivenWarming:
+    @pytest.fixture(autouse=True)
+    def warm_settings(self, settings):
+        settings.API_CACHE_WARM_ENABLED = True
+        settings.API_CACHE_WARM_SOURCE = "hits"
+        settings.API_CACHE_HIT_SAMPLE_RATE = 1.0
+        settings.API_CACHE_WARM_PATHS = WARM_PATHS
+
+    def test_hot_targets_are_ranked_by_recorded_requests(self, api_client):
+        with patch("core.cache_service.warm_api_cache_task.delay"):
+            LandingPageSettingsFactory()
+        url = reverse("settings")
+        for _ in range(3):
+            api_client.get(url, {"lang": "pl"})
+        api_client.get(url, {"lang": "en"})
+
+        targets = get_hot_targets(CacheNamespace.LANDING, limit=1)
+
+        assert [(target["path"], target["query_string"]) for target in targets] == [
+            ("/v1/settings/", "lang=pl")
+        ]
+
+    def test_hit_counting_failure_does_not_fail_the_request(self, api_client):
+        with patch("core.cache_service.warm_api_cache_task.delay"):
+            LandingPageSettingsFactory()
+
+        with patch("common.cache_hits._count_hit", side_effect=ConnectionError("redis down")):
+            response = api_client.get(reverse("settings"))
+
+        assert response.status_code == 200
+
+    def test_falls_back_to_configured_paths_without_recorded_hits(
+        self, mock_get_available_languages
+    ):
+        targets = build_warm_targets(CacheNamespace.LANDING)
+
+        assert len(targets) == 4
@@ -1,17 +1,42 @@
 # backend/core/tests/test_caching.py
 
-from unittest.mock import patch
+import gzip
+import pickle
+import time
+from unittest.mock import MagicMock, patch
 
+import brotli
 import pytest
 from rest_framework import status
 
 from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from django.test import override_settings
 from django.urls import reverse
 
-from astrophotography.tests.factories import AstroImageFactory
+from astrophotography.tests.factories import AstroImageFactory, MainPageLocationFactory
+from common.cache_refresh import render_cached_request
+from common.decorators.cache import RELEASE_LOCK_SCRIPT, build_etag, release_lock
+from common.local_cache import LocalPackageCache
+from common.utils.compression import accepts_encoding, compress_body, decompress_body
+from core.cache_service import CacheService
 from users.tests.factories import UserFactory
 
 
+def stored_package_call(mock_set):
+    """Return (key, package) of the response package written through a wrapped cache.set."""
+    return next(
+        (call.args[0], call.args[1])
+        for call in mock_set.call_args_list
+        if isinstance(call.args[1], dict) and "body" in call.args[1]
+    )
+
+
+def stored_body(package):
+    """Return the identity body of a stored response package."""
+    return decompress_body(package["body"], package["encoding"])
+
+
 @pytest.mark.django_db
 class TestApiCaching:
     @pytest.fixture(autouse=True)
@@ -189,3 +214,435 @@ class TestApiCaching:
             response = api_client.get(self.profile_url, HTTP_ACCEPT_LANGUAGE="en")
             assert response.data["short_description"] == "Updated"
             assert any("Cache MISS" in call.args[0] for call in mock_logger.call_args_list)
+
+    def test_cache_hit_serves_stored_bytes(self, api_client):
+        """Test that a cache HIT returns the stored JSON body without re-encoding."""
+        UserFactory()
+
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            response1 = api_client.get(self.profile_url)
+        cache_key, package = stored_package_call(mock_set)
+
+        assert isinstance(package["body"], bytes)
+        assert package["content_type"] == "application/json"
+        assert package["etag"] == response1["ETag"]
+
+        with patch("common.decorators.cache.ORJSONRenderer.render") as mock_render:
+            response2 = api_client.get(self.profile_url)
+
+        mock_render.assert_not_called()
+        assert response2.status_code == status.HTTP_200_OK
+        assert response2.content == stored_body(package)
+        assert response2["ETag"] == response1["ETag"]
+        assert response2.json() == response1.data
+
+    def test_legacy_data_package_is_replaced(self, api_client):
+        """Test that packages cached in the old decoded-data format are re-rendered."""
+        UserFactory()
+
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            api_client.get(self.profile_url)
+        cache_key, _ = stored_package_call(mock_set)
+        cache.set(cache_key, {"data": {"stale": True}, "etag": '"legacy"'})
+
+        response = api_client.get(self.profile_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "stale" not in response.json()
+        assert "body" in cache.get(cache_key)
+
+
+@pytest.mark.django_db
+class TestCacheStampedeProtection:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.profile_url = reverse("users:profile-profile")
+        UserFactory(first_name="Original")
+
+    def _warm(self, api_client):
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            response = api_client.get(self.profile_url)
+        return response, stored_package_call(mock_set)[0]
+
+    def test_concurrent_miss_serves_stale_payload(self, api_client):
+        """Test that a miss while another request holds the lock returns the previous payload."""
+        response1, old_key = self._warm(api_client)
+        CacheService.invalidate_user_cache()
+
+        with patch("common.decorators.cache.acquire_lock", return_value=None):
+            with patch("users.views.User.get_user") as mock_get_user:
+                response2 = api_client.get(self.profile_url)
+
+        mock_get_user.assert_not_called()
+        assert response2.status_code == status.HTTP_200_OK
+        assert response2["ETag"] == response1["ETag"]
+        assert response2.content == stored_body(cache.get(old_key))
+
+    @override_settings(API_CACHE_LOCK_WAIT=0.2)
+    def test_concurrent_miss_waits_for_lock_holder(self, api_client):
+        """Test that without a stale payload a miss waits for the lock holder's result."""
+        _, cache_key = self._warm(api_client)
+        package = cache.get(cache_key)
+        cache.delete(cache_key)
+
+        def finish_render(seconds):
+            cache.set(cache_key, package)
+
+        with (
+            patch("common.decorators.cache.acquire_lock", return_value=None),
+            patch("common.decorators.cache.get_stale_package", return_value=None),
+            patch("common.decorators.cache.time.sleep", side_effect=finish_render),
+            patch("users.views.User.get_user") as mock_get_user,
+        ):
+            response = api_client.get(self.profile_url)
+
+        mock_get_user.assert_not_called()
+        assert response.content == stored_body(package)
+
+    @override_settings(API_CACHE_LOCK_WAIT=0)
+    def test_concurrent_miss_renders_when_nothing_to_wait_for(self, api_client):
+        """Test that a miss falls back to rendering itself when no payload shows up."""
+        with patch("common.decorators.cache.acquire_lock", return_value=None):
+            response = api_client.get(self.profile_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["first_name"] == "Original"
+
+    def test_lock_is_released_after_render(self, api_client):
+        _, cache_key = self._warm(api_client)
+
+        assert cache.get(f"{cache_key}:lock") is None
+
+    def test_warm_render_keeps_lock_of_concurrent_render(self, api_client):
+        _, cache_key = self._warm(api_client)
+        cache.set(f"{cache_key}:lock", "request-render-token")
+
+        render_cached_request(**cache.get(cache_key)["request"])
+
+        assert cache.get(f"{cache_key}:lock") == "request-render-token"
+
+    @override_settings(API_CACHE_SOFT_TIMEOUT=60)
+    def test_soft_expired_entry_is_refreshed_in_background(self, api_client):
+        """Test that a soft-expired hit is served as-is and re-rendered by the refresh task."""
+        response1, cache_key = self._warm(api_client)
+        User = UserFactory._meta.model
+        User.objects.update(first_name="Updated")
+
+        with patch("common.decorators.cache.time.time", return_value=time.time() + 120):
+            response2 = api_client.get(self.profile_url)
+
+        # The stale payload is served while the (eager) refresh task re-renders it
+        assert response2.content == response1.content
+        assert b"Updated" in stored_body(cache.get(cache_key))
+        assert cache.get(f"{cache_key}:lock") is None
+
+
+@pytest.mark.django_db
+class TestLockRelease:
+    def test_lock_held_by_another_token_is_kept(self):
+        cache.set("release:lock", "theirs")
+
+        release_lock("release:lock", "ours")
+        assert cache.get("release:lock") == "theirs"
+
+        release_lock("release:lock", "theirs")
+        assert cache.get("release:lock") is None
+
+    def test_redis_release_is_one_compare_and_delete_script(self):
+        backend = RedisCache("redis://localhost:6379/1", {})
+        client = MagicMock()
+
+        with (
+            patch("common.decorators.cache.caches", {"default": backend}),
+            patch.object(backend._cache, "get_client", return_value=client),
+        ):
+            release_lock("release:lock", "ours")
+
+        key = backend.make_and_validate_key("release:lock")
+        client.eval.assert_called_once_with(
+            RELEASE_LOCK_SCRIPT, 1, key, pickle.dumps("ours", pickle.HIGHEST_PROTOCOL)
+        )
+        client.get.assert_not_called()
+        client.delete.assert_not_called()
+
+
+class TestLocalCacheTier:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.API_CACHE_LOCAL_ENABLED = True
+        self.profile_url = reverse("users:profile-profile")
+        UserFactory(first_name="Original")
+
+    def test_hit_is_served_from_process_memory(self, api_client):
+        response1 = api_client.get(self.profile_url)
+
+        with (
+            patch("common.decorators.cache.cache") as mock_cache,
+            patch("common.decorators.cache.logger.debug") as mock_logger,
+        ):
+            response2 = api_client.get(self.profile_url)
+
+        mock_cache.get.assert_not_called()
+        assert response2.content == response1.content
+        assert any("Cache HIT (local)" in call.args[0] for call in mock_logger.call_args_list)
+
+    def test_generation_bump_bypasses_local_copy(self, api_client):
+        api_client.get(self.profile_url)
+        UserFactory._meta.model.objects.update(first_name="Updated")
+
+        CacheService.invalidate_user_cache()
+        response = api_client.get(self.profile_url)
+
+        assert response.data["first_name"] == "Updated"
+
+    def test_local_copy_is_served_while_shared_cache_is_down(self, api_client):
+        response1 = api_client.get(self.profile_url)
+
+        with (
+            patch("common.cache_versioning.cache") as mock_versioning_cache,
+            patch("common.decorators.cache.cache") as mock_cache,
+        ):
+            mock_versioning_cache.get.side_effect = ConnectionError
+            mock_cache.get.side_effect = ConnectionError
+            response2 = api_client.get(self.profile_url)
+
+        assert response2.status_code == status.HTTP_200_OK
+        assert response2.content == response1.content
+
+    def test_miss_renders_uncached_while_shared_cache_is_down(self, api_client):
+        with (
+            patch("common.cache_versioning._known_generations", {}),
+            patch("common.cache_versioning.cache") as mock_versioning_cache,
+            patch("common.decorators.cache.cache") as mock_cache,
+        ):
+            mock_versioning_cache.get.side_effect = ConnectionError
+            response = api_client.get(self.profile_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["first_name"] == "Original"
+        mock_cache.set.assert_not_called()
+
+
+class TestLocalPackageCache:
+    @staticmethod
+    def package(size):
+        return {"body": b"x" * size}
+
+    def test_evicts_least_recently_used_over_entry_budget(self, settings):
+        settings.API_CACHE_LOCAL_MAX_ENTRIES = 2
+        local_cache = LocalPackageCache()
+        local_cache.set("a", self.package(1))
+        local_cache.set("b", self.package(1))
+        local_cache.get("a")
+
+        local_cache.set("c", self.package(1))
+
+        assert local_cache.get("b") is None
+        assert local_cache.get("a") is not None
+        assert local_cache.get("c") is not None
+
+    def test_evicts_over_byte_budget_and_skips_oversized_bodies(self, settings):
+        settings.API_CACHE_LOCAL_MAX_BYTES = 10
+        local_cache = LocalPackageCache()
+        local_cache.set("a", self.package(6))
+        local_cache.set("b", self.package(6))
+        local_cache.set("huge", self.package(11))
+
+        assert local_cache.get("a") is None
+        assert local_cache.get("huge") is None
+        assert local_cache.size == 6
+
+
+@pytest.mark.django_db
+class TestPrecompressedPayloads:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.images_url = reverse("astroimages:astroimage-list")
+        with patch("core.models.process_image_task.delay_on_commit"):
+            AstroImageFactory.create_batch(3)
+
+    def test_only_the_brotli_body_is_stored(self, api_client):
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            identity = api_client.get(self.images_url)
+        _, package = stored_package_call(mock_set)
+
+        assert package["encoding"] == "br"
+        assert "encodings" not in package
+        assert brotli.decompress(package["body"]) == identity.content
+
+    def test_gzip_hit_is_decompressed_for_gzip_middleware(self, api_client):
+        identity = api_client.get(self.images_url)
+
+        response = api_client.get(self.images_url, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert response["ETag"] == f"W/{identity['ETag']}"
+        assert gzip.decompress(response.content) == identity.content
+
+    def test_hit_serves_stored_brotli_body(self, api_client):
+        identity = api_client.get(self.images_url)
+
+        response = api_client.get(self.images_url, HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+
+        assert response["Content-Encoding"] == "br"
+        assert brotli.decompress(response.content) == identity.content
+
+    def test_brotli_hit_skips_gzip_middleware(self, api_client):
+        api_client.get(self.images_url)
+
+        with patch("django.middleware.gzip.compress_string") as mock_compress:
+            api_client.get(self.images_url, HTTP_ACCEPT_ENCODING="gzip, br")
+
+        mock_compress.assert_not_called()
+
+    def test_refused_encoding_falls_back_to_identity(self, api_client):
+        identity = api_client.get(self.images_url)
+
+        response = api_client.get(self.images_url, HTTP_ACCEPT_ENCODING="br;q=0, identity")
+
+        assert not response.has_header("Content-Encoding")
+        assert response.content == identity.content
+
+    def test_weak_etag_revalidates_encoded_variant(self, api_client):
+        api_client.get(self.images_url)
+        encoded = api_client.get(self.images_url, HTTP_ACCEPT_ENCODING="gzip")
+
+        response = api_client.get(
+            self.images_url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=encoded["ETag"]
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+class TestVersionEtags:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.profile_url = reverse("users:profile-profile")
+        UserFactory()
+
+    def test_revalidation_skips_payload_read(self, api_client):
+        etag = api_client.get(self.profile_url)["ETag"]
+
+        with patch("common.decorators.cache.cache.get", wraps=cache.get) as mock_get:
+            response = api_client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        # Only the generation counter (and the throttle history) is read
+        read_keys = [call.args[0] for call in mock_get.call_args_list]
+        assert not any(key.startswith("api_cache:profile:") for key in read_keys)
+
+    def test_weak_tag_of_encoded_variant_revalidates(self, api_client):
+        etag = api_client.get(self.profile_url)["ETag"]
+
+        response = api_client.get(
+            self.profile_url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=f"W/{etag}"
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == f"W/{etag}"
+
+    def test_invalidation_changes_the_etag(self, api_client):
+        etag = api_client.get(self.profile_url)["ETag"]
+        CacheService.invalidate_user_cache()
+
+        response = api_client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    @override_settings(API_CACHE_SOFT_TIMEOUT=60)
+    def test_soft_ttl_entries_keep_content_etags(self, api_client):
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            response = api_client.get(self.profile_url)
+        _, package = stored_package_call(mock_set)
+
+        assert response["ETag"] == build_etag(stored_body(package))
+
+    def test_signed_url_payloads_keep_content_etags(self, api_client):
+        MainPageLocationFactory()
+        travel_url = reverse("astroimages:travel-highlights-list")
+
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            response = api_client.get(travel_url)
+        _, package = stored_package_call(mock_set)
+
+        assert response["ETag"] == build_etag(stored_body(package))
+
+
+@pytest.mark.django_db
+class TestCanonicalCacheKeys:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.images_url = reverse("astroimages:astroimage-list")
+        with patch("core.models.process_image_task.delay_on_commit"):
+            AstroImageFactory.create_batch(2, celestial_object="Landscape")
+
+    def test_unknown_params_share_the_canonical_entry(self, api_client):
+        api_client.get(self.images_url, {"filter": "Landscape"})
+
+        with patch("common.decorators.cache.logger.debug") as mock_logger:
+            response = api_client.get(
+                self.images_url, {"filter": "Landscape", "utm_source": "x", "page": 1}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert any("Cache HIT" in call.args[0] for call in mock_logger.call_args_list)
+
+    def test_view_renders_the_canonical_query(self, api_client):
+        response = api_client.get(self.images_url, {"limit": 1, "utm_source": "x"})
+
+        assert "utm_source" not in response.json()["next"]
+
+    def test_uncacheable_values_bypass_storage(self, api_client):
+        with patch("common.decorators.cache.cache.set") as mock_set:
+            response = api_client.get(self.images_url, {"filter": "Not a category"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["results"] == []
+        stored_keys = [call.args[0] for call in mock_set.call_args_list]
+        assert not any(key.startswith("api_cache") for key in stored_keys)
+
+    @pytest.mark.parametrize(
+        ("params", "free_text"), [({"filter": "Landscape"}, False), ({"q": "orion"}, True)]
+    )
+    def test_free_text_queries_are_stored_briefly(self, api_client, settings, params, free_text):
+        with patch("common.decorators.cache.cache.set", wraps=cache.set) as mock_set:
+            api_client.get(self.images_url, params)
+
+        timeouts = {
+            call.args[2] for call in mock_set.call_args_list if "api_cache:" in call.args[0]
+        }
+        expected = (
+            settings.API_CACHE_FREE_TEXT_TIMEOUT if free_text else settings.INFINITE_CACHE_TIMEOUT
+        )
+        assert timeouts == {expected}
+
+
+class TestCompressionHelpers:
+    def test_small_bodies_are_not_compressed(self):
+        assert compress_body(b"{}") == (b"{}", None)
+
+    def test_large_bodies_are_stored_as_brotli(self):
+        body = b'{"name": "Andromeda"}' * 50
+
+        data, encoding = compress_body(body)
+
+        assert encoding == "br"
+        assert brotli.decompress(data) == body
+        assert decompress_body(data, encoding) == body
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate, br", True),
+            ("gzip", False),
+            ("br;q=0, gzip;q=0.5", False),
+            ("*", True),
+            ("identity", False),
+        ],
+    )
+    def test_accepts_encoding(self, header, expected):
+        assert accepts_encoding(header, "br") is expected
@@ -17,6 +17,7 @@ from astrophotography.models import MeteorsMainPageConfig
 from astrophotography.tests.factories import AstroImageFactory, MainPageBackgroundImageFactory
 from common.tests.image_helpers import jpeg_field
 from core.models import LandingPageSettings
+from core.tests.factories import ImageVariantFactory
 from programming.models import ProjectImage
 from programming.tests.factories import ProjectImageFactory
 from shop.models import ShopSettings
@@ -127,6 +128,21 @@ class TestClearCacheCommand:
         mock_clear.assert_called_once()
 
 
+@pytest.mark.django_db
+class TestVerifyImageVariantsCommand:
+    def test_verify_image_variants_flags_missing_files(self) -> None:
+        variant = ImageVariantFactory()
+        variant.file.storage.delete(variant.file.name)
+        output = StringIO()
+
+        call_command("verify_image_variants", stdout=output)
+
+        variant.refresh_from_db()
+        assert variant.file_missing
+        assert variant.file_checked_at is not None
+        assert "1 missing file(s)" in output.getvalue()
+
+
 @pytest.mark.django_db
 class TestRegenerateThumbnailsCommand:
     def test_regenerate_thumbnails_creates_missing_thumbnails(self, mocker: MockerFixture) -> None:
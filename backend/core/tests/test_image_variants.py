@@ -6,10 +6,11 @@ from PIL import Image
 
 from django.core.files.base import ContentFile
 
+from astrophotography.image_documents import rebuild_image_documents
 from astrophotography.serializers import AstroImageSerializerList
 from astrophotography.tests.factories import AstroImageFactory, MainPageBackgroundImageFactory
 from common.tests.image_helpers import NamedBytesIO, jpeg_field
-from common.types import ImageVariantSource, ImageVariantSpec, ViewportWidths
+from common.types import CacheNamespace, ImageVariantSource, ImageVariantSpec, ViewportWidths
 from core.mixins import ImageVariantModelMixin
 from core.models import BaseImage, ImageVariant
 from core.tasks import process_image_task
@@ -613,3 +614,86 @@ class TestBaseImageVariants:
             pytest.raises(ValueError, match="Unable to read source image dimensions"),
         ):
             image._get_source_width(source)
+
+
+@pytest.mark.django_db
+class TestImageVariantFileState:
+    @pytest.fixture
+    def processed_image(self):
+        with patch("core.models.process_image_task.delay_on_commit"):
+            image = AstroImageFactory(original=jpeg_field("state.jpg", size=(1200, 800)))
+        process_image_task("astrophotography", "AstroImage", image.pk)
+        image.refresh_from_db()
+        return image
+
+    def test_sync_records_verified_files(self, processed_image) -> None:
+        variants = processed_image.variants.all()
+
+        assert variants.exists()
+        assert all(variant.file_checked_at is not None for variant in variants)
+        assert not any(variant.file_missing for variant in variants)
+
+    def test_read_path_does_not_stat_storage(self, processed_image) -> None:
+        thumbnail = processed_image.variants.get(role="thumbnail")
+
+        with patch(
+            "django.core.files.storage.FileSystemStorage.exists",
+            side_effect=AssertionError("storage stat on the read path"),
+        ):
+            url = processed_image.get_available_variant_url("thumbnail", preferred_width=560)
+
+        assert url == thumbnail.file.url
+
+    def test_sweep_flags_missing_files_and_clears_restored_ones(self, processed_image) -> None:
+        thumbnail = processed_image.variants.get(role="thumbnail")
+        content = thumbnail.file.read()
+        thumbnail.file.close()
+        thumbnail.file.storage.delete(thumbnail.file.name)
+
+        assert ImageVariant.objects.verify_files() == 1
+        thumbnail.refresh_from_db()
+        assert thumbnail.file_missing
+        assert processed_image.get_available_variant_url("thumbnail") is None
+
+        thumbnail.file.storage.save(thumbnail.file.name, ContentFile(content))
+
+        assert ImageVariant.objects.verify_files() == 0
+        thumbnail.refresh_from_db()
+        assert not thumbnail.file_missing
+
+    def test_sweep_refreshes_owners_of_flipped_variants(self, processed_image) -> None:
+        thumbnail = processed_image.variants.get(role="thumbnail")
+        thumbnail.file.storage.delete(thumbnail.file.name)
+        document = processed_image.documents.get(language_code="en")
+        assert document.list_payload["thumbnail_url"] == thumbnail.file.url
+
+        with patch("core.signals.CacheService.invalidate_on_commit") as mock_invalidate:
+            ImageVariant.objects.verify_files()
+
+        document.refresh_from_db()
+        assert document.list_payload["thumbnail_url"] != thumbnail.file.url
+        assert CacheNamespace.ASTRO in mock_invalidate.call_args.args
+
+        with patch("core.signals.CacheService.invalidate_on_commit") as mock_invalidate:
+            ImageVariant.objects.verify_files()
+
+        mock_invalidate.assert_not_called()
+
+    def test_mark_verified_refreshes_owners_of_restored_variants(self, processed_image) -> None:
+        thumbnail = processed_image.variants.get(role="thumbnail")
+        ImageVariant.objects.filter(pk=thumbnail.pk).update(file_missing=True)
+        rebuild_image_documents([processed_image.pk])
+        document = processed_image.documents.get(language_code="en")
+        assert document.list_payload["thumbnail_url"] != thumbnail.file.url
+
+        with patch("core.signals.CacheService.invalidate_on_commit") as mock_invalidate:
+            processed_image.variants.all().mark_verified()
+
+        document.refresh_from_db()
+        assert document.list_payload["thumbnail_url"] == thumbnail.file.url
+        assert CacheNamespace.ASTRO in mock_invalidate.call_args.args
+
+        with patch("core.signals.CacheService.invalidate_on_commit") as mock_invalidate:
+            processed_image.variants.all().mark_verified()
+
+        mock_invalidate.assert_not_called()
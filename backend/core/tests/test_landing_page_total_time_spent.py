@@ -3,9 +3,13 @@ from io import StringIO
 import pytest
 
 from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Sum
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from astrophotography.agent import AstroImageExposureTimeAgent
+from astrophotography.models import AstroImage, ExposureHoursTotal
 from astrophotography.services import (
     AstroImageExposureTimeAgentService,
     AstroImageExposureTimeService,
@@ -15,6 +19,7 @@ from astrophotography.tasks import (
 )
 from astrophotography.tests.factories import AstroImageFactory
 from common.llm.providers import MockLLMProvider
+from common.types import CacheNamespace
 from core.tests.factories import LandingPageSettingsFactory
 
 
@@ -266,20 +271,15 @@ class TestLandingPageTotalTimeSpentSignals:
         mocker.patch(
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_landing_page_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
         image = AstroImageFactory(calculated_exposure_hours=1.5)
-        mock_invalidate_cache.reset_mock()
-        mock_invalidate_ssr.reset_mock()
+        mock_invalidate.reset_mock()
 
         image.delete()
 
-        mock_invalidate_cache.assert_called_once_with()
-        assert mocker.call(["settings"]) in mock_invalidate_ssr.call_args_list
+        assert mocker.call(CacheNamespace.LANDING, ssr_tags=["settings"]) in (
+            mock_invalidate.call_args_list
+        )
 
     def test_astroimage_save_invalidates_settings_when_calculated_exposure_hours_changes(
         self, mocker
@@ -287,21 +287,16 @@ class TestLandingPageTotalTimeSpentSignals:
         mocker.patch(
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_landing_page_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
         image = AstroImageFactory(calculated_exposure_hours=0.0)
-        mock_invalidate_cache.reset_mock()
-        mock_invalidate_ssr.reset_mock()
+        mock_invalidate.reset_mock()
 
         image.calculated_exposure_hours = 1.5
         image.save(update_fields=["calculated_exposure_hours"])
 
-        mock_invalidate_cache.assert_called_once_with()
-        assert mocker.call(["settings"]) in mock_invalidate_ssr.call_args_list
+        assert mocker.call(CacheNamespace.LANDING, ssr_tags=["settings"]) in (
+            mock_invalidate.call_args_list
+        )
 
     def test_astroimage_save_skips_settings_invalidation_when_calculated_exposure_hours_unchanged(
         self, mocker
@@ -309,38 +304,32 @@ class TestLandingPageTotalTimeSpentSignals:
         mocker.patch(
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_landing_page_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
         image = AstroImageFactory(calculated_exposure_hours=1.5)
-        mock_invalidate_cache.reset_mock()
-        mock_invalidate_ssr.reset_mock()
+        mock_invalidate.reset_mock()
 
         image.slug = "updated-slug"
         image.save(update_fields=["slug"])
 
-        mock_invalidate_cache.assert_not_called()
-        assert mocker.call(["settings"]) not in mock_invalidate_ssr.call_args_list
+        assert mocker.call(CacheNamespace.LANDING, ssr_tags=["settings"]) not in (
+            mock_invalidate.call_args_list
+        )
 
     def test_astroimage_create_invalidates_gallery_and_ssr_cache(self, mocker) -> None:
         mocker.patch(
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_astrophotography_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
 
         AstroImageFactory(exposure_details=self.RAW_EXPOSURE_DETAILS)
 
-        mock_invalidate_cache.assert_called()
-        assert mocker.call(["latest-astro-images", "travel-highlights"]) in (
-            mock_invalidate_ssr.call_args_list
+        assert (
+            mocker.call(
+                CacheNamespace.ASTRO,
+                CacheNamespace.TRAVEL,
+                ssr_tags=["latest-astro-images", "travel-highlights"],
+            )
+            in mock_invalidate.call_args_list
         )
 
     def test_astroimage_update_exposure_details_invalidates_gallery_and_ssr_cache(
@@ -350,20 +339,19 @@ class TestLandingPageTotalTimeSpentSignals:
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
         image = AstroImageFactory(exposure_details=self.RAW_EXPOSURE_DETAILS)
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_astrophotography_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
 
         image.set_current_language("en")
         image.exposure_details = "<p>10x120s + 20x300s</p>"
         image.save()
 
-        mock_invalidate_cache.assert_called()
-        assert mocker.call(["latest-astro-images", "travel-highlights"]) in (
-            mock_invalidate_ssr.call_args_list
+        assert (
+            mocker.call(
+                CacheNamespace.ASTRO,
+                CacheNamespace.TRAVEL,
+                ssr_tags=["latest-astro-images", "travel-highlights"],
+            )
+            in mock_invalidate.call_args_list
         )
 
     def test_astroimage_delete_invalidates_gallery_and_ssr_cache(self, mocker) -> None:
@@ -371,18 +359,17 @@ class TestLandingPageTotalTimeSpentSignals:
             "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
         )
         image = AstroImageFactory(exposure_details=self.RAW_EXPOSURE_DETAILS)
-        mock_invalidate_cache = mocker.patch(
-            "astrophotography.signals.CacheService.invalidate_astrophotography_cache"
-        )
-        mock_invalidate_ssr = mocker.patch(
-            "astrophotography.signals.invalidate_frontend_ssr_cache_task.delay_on_commit"
-        )
+        mock_invalidate = mocker.patch("astrophotography.signals.CacheService.invalidate_on_commit")
 
         image.delete()
 
-        mock_invalidate_cache.assert_called()
-        assert mocker.call(["latest-astro-images", "travel-highlights"]) in (
-            mock_invalidate_ssr.call_args_list
+        assert (
+            mocker.call(
+                CacheNamespace.ASTRO,
+                CacheNamespace.TRAVEL,
+                ssr_tags=["latest-astro-images", "travel-highlights"],
+            )
+            in mock_invalidate.call_args_list
         )
 
 
@@ -478,6 +465,134 @@ class TestLandingPageTotalTimeSpentCommand:
         assert "Rebuilt total time spent" in output.getvalue()
 
 
+@pytest.fixture
+def no_exposure_task(mocker):
+    return mocker.patch(
+        "astrophotography.models.calculate_astroimage_exposure_hours_task.delay_on_commit"
+    )
+
+
+def expected_breakdown() -> dict[str, float]:
+    """Per-category hours aggregated from the image table, the reference for the totals."""
+    return {
+        category: hours
+        for category, hours in AstroImage.objects.values_list("celestial_object")
+        .annotate(hours=Sum("calculated_exposure_hours"))
+        .order_by()
+        if hours
+    }
+
+
+def stored_breakdown() -> dict[str, float]:
+    return {
+        category: hours
+        for category, hours in ExposureHoursTotal.objects.breakdown().items()
+        if hours
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("no_exposure_task")
+class TestExposureHoursTotals:
+    def test_totals_follow_image_writes(self) -> None:
+        nebula = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.5)
+        AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=1.25)
+        landscape = AstroImageFactory(celestial_object="Landscape", calculated_exposure_hours=2.0)
+        assert stored_breakdown() == {"Deep Sky": 4.75, "Landscape": 2.0}
+
+        nebula.calculated_exposure_hours = 4.5
+        nebula.save()
+        assert stored_breakdown() == {"Deep Sky": 5.75, "Landscape": 2.0}
+
+        landscape.celestial_object = "Milky Way"
+        landscape.save()
+        assert stored_breakdown() == {"Deep Sky": 5.75, "Milky Way": 2.0}
+
+        nebula.delete()
+        assert stored_breakdown() == expected_breakdown() == {"Deep Sky": 1.25, "Milky Way": 2.0}
+
+    def test_fields_outside_update_fields_keep_their_totals(self) -> None:
+        image = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+
+        image.celestial_object = "Landscape"
+        image.calculated_exposure_hours = 9.0
+        image.save(update_fields=["slug"])
+
+        assert stored_breakdown() == expected_breakdown() == {"Deep Sky": 3.0}
+
+    def test_rolled_back_write_leaves_totals_unchanged(self) -> None:
+        image = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+
+        def save_and_fail() -> None:
+            with transaction.atomic():
+                image.calculated_exposure_hours = 8.0
+                image.save()
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            save_and_fail()
+
+        assert stored_breakdown() == {"Deep Sky": 3.0}
+
+    def test_task_moves_totals_by_delta(self, mocker) -> None:
+        image = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+        service_mock = mocker.Mock()
+        service_mock.parse_total_hours.return_value = 4.5
+        mocker.patch(
+            "astrophotography.tasks.AstroImageExposureTimeService.create_default",
+            return_value=service_mock,
+        )
+
+        calculate_astroimage_exposure_hours_task(str(image.pk))
+
+        assert stored_breakdown() == expected_breakdown() == {"Deep Sky": 4.5}
+
+    def test_reconcile_command_corrects_drift(self, mocker) -> None:
+        mock_invalidate_ssr = mocker.patch(
+            "astrophotography.management.commands.reconcile_exposure_hours."
+            "invalidate_frontend_ssr_cache_task.delay"
+        )
+        image = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+        AstroImageFactory(celestial_object="Landscape", calculated_exposure_hours=1.0)
+        AstroImage.objects.filter(pk=image.pk).update(calculated_exposure_hours=5.0)
+        mock_invalidate_ssr.reset_mock()
+        output = StringIO()
+
+        call_command("reconcile_exposure_hours", stdout=output)
+
+        assert stored_breakdown() == expected_breakdown() == {"Deep Sky": 5.0, "Landscape": 1.0}
+        assert "Deep Sky: stored 3.0h, actual 5.0h" in output.getvalue()
+        assert "6.0h total, 1 category corrected" in output.getvalue()
+        mock_invalidate_ssr.assert_called_once_with(["settings"])
+
+    def test_rebuild_overwrites_rows_in_place(self) -> None:
+        image = AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+        AstroImageFactory(celestial_object="Landscape", calculated_exposure_hours=1.0)
+        row_ids = dict(ExposureHoursTotal.objects.values_list("celestial_object", "pk"))
+        AstroImage.objects.filter(pk=image.pk).update(celestial_object="Milky Way")
+
+        ExposureHoursTotal.objects.rebuild()
+
+        rebuilt_ids = dict(ExposureHoursTotal.objects.values_list("celestial_object", "pk"))
+        assert rebuilt_ids.items() >= row_ids.items()
+        assert ExposureHoursTotal.objects.breakdown()["Deep Sky"] == 0
+        assert stored_breakdown() == expected_breakdown() == {"Milky Way": 3.0, "Landscape": 1.0}
+
+    def test_reconcile_command_without_drift_keeps_caches(self, mocker) -> None:
+        mock_invalidate_ssr = mocker.patch(
+            "astrophotography.management.commands.reconcile_exposure_hours."
+            "invalidate_frontend_ssr_cache_task.delay"
+        )
+        AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=3.0)
+        mock_invalidate_ssr.reset_mock()
+        output = StringIO()
+
+        call_command("reconcile_exposure_hours", stdout=output)
+
+        assert "0 categories corrected" in output.getvalue()
+        mock_invalidate_ssr.assert_not_called()
+
+
 @pytest.mark.django_db
 class TestLandingPageTotalTimeSpentApi:
     def test_settings_serializer_rounds_total_time_spent(self, api_client, mocker) -> None:
@@ -492,3 +607,18 @@ class TestLandingPageTotalTimeSpentApi:
 
         assert response.status_code == 200
         assert response.data["total_time_spent"] == 4
+
+    @pytest.mark.usefixtures("no_exposure_task")
+    def test_settings_read_stored_totals_without_scanning_images(self, api_client) -> None:
+        LandingPageSettingsFactory()
+        AstroImageFactory(celestial_object="Deep Sky", calculated_exposure_hours=10.5)
+        AstroImageFactory(celestial_object="Landscape", calculated_exposure_hours=1.2)
+        AstroImageFactory(celestial_object="Milky Way", calculated_exposure_hours=0.0)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get("/v1/settings/")
+
+        assert response.status_code == 200
+        assert response.data["total_time_spent"] == 14
+        assert response.data["total_time_spent_by_category"] == {"Deep Sky": 11, "Landscape": 1}
+        assert not any('"astrophotography_astroimage"' in query["sql"] for query in queries)
@@ -0,0 +1,146 @@
+# backend/core/tests/test_query_counts.py
+"""Query-count regression tests for the public read endpoints.
+
+Each list endpoint is rendered with one and with several rows; the number of
+queries must not grow with the page. Translations, tags, places and image
+variants are all expected to come from prefetches.
+"""
+
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from astrophotography.tests.factories import (
+    AstroImageFactory,
+    MainPageBackgroundImageFactory,
+    MainPageLocationFactory,
+    PlaceFactory,
+    TagFactory,
+)
+from core.tests.factories import ImageVariantFactory, LandingPageSettingsFactory
+from shop.tests.factories import ShopProductFactory
+from users.tests.factories import UserFactory
+
+
+def create_gallery_images(count: int) -> list:
+    with patch("core.models.process_image_task.delay_on_commit"):
+        place = PlaceFactory(country="PL")
+        images = [
+            AstroImageFactory(place=place, tags=[TagFactory(), TagFactory()]) for _ in range(count)
+        ]
+    for image in images:
+        ImageVariantFactory(image=image, role="thumbnail", width=560)
+    return images
+
+
+def create_travel_highlights(count: int) -> None:
+    for _ in range(count):
+        place = PlaceFactory(country="PL")
+        MainPageLocationFactory(place=place, images=create_gallery_images(2))
+
+
+def create_shop_products(count: int) -> None:
+    with patch("core.models.process_image_task.delay_on_commit"):
+        ShopProductFactory.create_batch(count)
+
+
+def count_queries(api_client, url: str) -> int:
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url, {"lang": "pl"})
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("url_name", "create_rows"),
+    [
+        ("astroimages:astroimage-list", create_gallery_images),
+        ("astroimages:astroimage-latest", create_gallery_images),
+        ("astroimages:tags-list", create_gallery_images),
+        ("astroimages:travel-highlights-list", create_travel_highlights),
+        ("shop:shop-product-list", create_shop_products),
+    ],
+)
+def test_list_queries_do_not_grow_with_rows(
+    api_client, url_name: str, create_rows: Callable[[int], object]
+) -> None:
+    LandingPageSettingsFactory(shop_enabled=True)
+    url = reverse(url_name)
+    create_rows(1)
+    baseline = count_queries(api_client, url)
+
+    create_rows(4)
+
+    assert count_queries(api_client, url) == baseline
+
+
+@pytest.mark.django_db
+def test_travel_highlight_detail_queries_do_not_grow_with_images(api_client) -> None:
+    place = PlaceFactory(country="PL")
+    highlight = MainPageLocationFactory(place=place, images=create_gallery_images(1))
+    url = reverse(
+        "astroimages:travel-by-country-place-date",
+        kwargs={
+            "country_slug": highlight.country_slug,
+            "place_slug": highlight.place_slug,
+            "date_slug": highlight.date_slug,
+        },
+    )
+    baseline = count_queries(api_client, url)
+
+    highlight.images.add(*create_gallery_images(4))
+
+    assert count_queries(api_client, url) == baseline
+
+
+@pytest.mark.django_db
+class TestSingleObjectQueryCounts:
+    """Pinned query budgets, so a lost prefetch or a per-field lookup shows up here."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        LandingPageSettingsFactory(shop_enabled=True)
+        UserFactory()
+        self.image = create_gallery_images(1)[0]
+        with patch("core.models.process_image_task.delay_on_commit"):
+            MainPageBackgroundImageFactory()
+            self.product = ShopProductFactory()
+
+    @pytest.mark.parametrize(
+        ("url_name", "expected_queries"),
+        [
+            ("settings", 3),
+            ("users:profile-profile", 9),
+            ("astroimages:backgroundImage-list", 2),
+            ("astroimages:celestial-object-categories", 0),
+        ],
+    )
+    def test_singleton_endpoints(self, api_client, url_name: str, expected_queries: int) -> None:
+        assert count_queries(api_client, reverse(url_name)) == expected_queries
+
+    def test_gallery_detail(self, api_client) -> None:
+        url = reverse("astroimages:astroimage-detail", args=[self.image.slug])
+
+        # The image plus its stored detail document
+        assert count_queries(api_client, url) == 2
+
+    def test_gallery_detail_without_document(self, api_client) -> None:
+        url = reverse("astroimages:astroimage-detail", args=[self.image.slug])
+        self.image.documents.all().delete()
+
+        # The image, the document lookup, then its place and one prefetch per
+        # relation used by AstroImageSerializer, loaded onto the same instance
+        assert count_queries(api_client, url) == 13
+
+    def test_shop_product_detail(self, api_client) -> None:
+        url = reverse("shop:shop-product-detail", args=[self.product.pk])
+
+        assert count_queries(api_client, url) == 5
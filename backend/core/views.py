@@ -19,7 +19,9 @@ from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.decorators import method_decorator
 
+from common.cache_params import LANGUAGE_ONLY
 from common.decorators.cache import cache_response
+from common.types import CacheNamespace
 from common.utils.logging import sanitize_for_logging
 from common.utils.signing import validate_signed_url
 from core.errors import render_403_error, render_404_error
@@ -29,7 +31,15 @@ from core.serializers import LandingPageSettingsSerializer
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT), name="dispatch")
+@method_decorator(
+    cache_response(
+        timeout=settings.INFINITE_CACHE_TIMEOUT,
+        namespace=CacheNamespace.LANDING,
+        query_params=LANGUAGE_ONLY,
+        version_etag=True,
+    ),
+    name="dispatch",
+)
 class SettingsView(generics.RetrieveAPIView):
     """
     Endpoint to fetch global application settings.
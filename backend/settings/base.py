@@ -350,6 +350,56 @@ CACHES = {
 # 30 days is effectively infinite for this portfolio
 INFINITE_CACHE_TIMEOUT = 3600 * 24 * 30
 
+# cache_response single-flight recomputation: how long a render lock lives and how long
+# concurrent misses wait for the lock holder before rendering on their own (seconds)
+API_CACHE_LOCK_TIMEOUT = env.int("API_CACHE_LOCK_TIMEOUT", default=10)
+API_CACHE_LOCK_WAIT = env.float("API_CACHE_LOCK_WAIT", default=2.0)
+# Upper bound on the cache lifetime of responses to queries with a free-form value
+# (search terms, unvalidated slugs, cursors), so arbitrary values cannot pile up for 30 days
+API_CACHE_FREE_TEXT_TIMEOUT = env.int("API_CACHE_FREE_TEXT_TIMEOUT", default=300)
+# Soft TTL after which cached entries are re-rendered in the background (0 disables)
+API_CACHE_SOFT_TIMEOUT = env.int("API_CACHE_SOFT_TIMEOUT", default=0)
+# Optional per-process LRU in front of Redis for cache_response packages, bounded by entry
+# count and total body bytes. Generations may be trusted locally for a few seconds (0 = read
+# Redis on every request); invalidations from other processes show up after at most that long.
+API_CACHE_LOCAL_ENABLED = env.bool("API_CACHE_LOCAL_ENABLED", default=False)
+API_CACHE_LOCAL_MAX_ENTRIES = env.int("API_CACHE_LOCAL_MAX_ENTRIES", default=256)
+API_CACHE_LOCAL_MAX_BYTES = env.int("API_CACHE_LOCAL_MAX_BYTES", default=32 * 1024 * 1024)
+API_CACHE_LOCAL_GENERATION_TTL = env.float("API_CACHE_LOCAL_GENERATION_TTL", default=0)
+# Cache hit/miss/latency metrics (see common.cache_metrics), aggregated per process and
+# logged to "core.cache.metrics" at most once per interval (seconds)
+API_CACHE_METRICS_ENABLED = env.bool("API_CACHE_METRICS_ENABLED", default=True)
+API_CACHE_METRICS_INTERVAL = env.int("API_CACHE_METRICS_INTERVAL", default=60)
+
+# Lifetime of the cached gallery counters behind cursor pagination (see
+# astrophotography.gallery_counts); bounds drift from writes that bypass signals (seconds)
+GALLERY_COUNT_TIMEOUT = env.int("GALLERY_COUNT_TIMEOUT", default=3600 * 24)
+
+# Post-invalidation warming of hot public API keys (see core.cache_warming).
+# "config" warms API_CACHE_WARM_PATHS for every language; "hits" warms the most requested
+# targets sampled by cache_response and falls back to the configured paths.
+# Off by default; docker-compose.prod.yml turns it on for production.
+API_CACHE_WARM_ENABLED = env.bool("API_CACHE_WARM_ENABLED", default=False)
+API_CACHE_WARM_SOURCE = env.str("API_CACHE_WARM_SOURCE", default="config")
+API_CACHE_WARM_HOST = env.str("API_CACHE_WARM_HOST", default=SITE_DOMAIN)
+API_CACHE_WARM_SECURE = env.bool("API_CACHE_WARM_SECURE", default=True)
+API_CACHE_WARM_HIT_LIMIT = env.int("API_CACHE_WARM_HIT_LIMIT", default=100)
+API_CACHE_HIT_SAMPLE_RATE = env.float("API_CACHE_HIT_SAMPLE_RATE", default=0.1)
+API_CACHE_HIT_MAX_TARGETS = env.int("API_CACHE_HIT_MAX_TARGETS", default=1000)
+# Paths (with optional query string) warmed per namespace; gallery category pages are added
+API_CACHE_WARM_PATHS: dict[str, list[str]] = {
+    "astro": [
+        "/v1/astroimages/",
+        "/v1/astroimages/latest/",
+        "/v1/tags/",
+        "/v1/tags/?latest=true",
+        "/v1/categories/",
+        "/v1/background/",
+    ],
+    "travel": ["/v1/travel-highlights/"],
+    "landing": ["/v1/settings/"],
+}
+
 # Django Select2 Configuration
 SELECT2_CACHE_BACKEND = "select2"
 # Disable i18n file loading for English (default locale) to prevent TypeError
@@ -516,8 +566,14 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    # orjson-backed JSON with DRF's output format
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "common.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
@@ -720,7 +776,14 @@ ADMIN_SITE_ORDERING = (
 # ===========================
 
 
-CELERY_BEAT_SCHEDULE: dict[str, Any] = {}
+CELERY_BEAT_SCHEDULE: dict[str, Any] = {
+    # Public image URLs trust ImageVariant.file_missing instead of statting storage,
+    # so the flag is refreshed by this sweep (seconds between runs)
+    "verify-image-variant-files": {
+        "task": "core.verify_image_variant_files",
+        "schedule": env.int("IMAGE_VARIANT_VERIFY_INTERVAL", default=3600 * 24),
+    },
+}
 
 # ===========================
 # Celery Configuration
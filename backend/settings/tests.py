@@ -75,6 +75,9 @@ CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_URL = "memory://"
 CELERY_RESULT_BACKEND = "cache+memory://"
 
+# Post-invalidation cache warming re-renders views eagerly; tests enable it explicitly
+API_CACHE_WARM_ENABLED = False
+
 # Disable logging during tests
 LOGGING_CONFIG = None
 ENABLE_SENTRY = False
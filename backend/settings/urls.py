@@ -12,10 +12,8 @@ This file defines the main routing table for the project, including:
 
 from django.conf import settings
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.http import Http404
 from django.urls import include, path
-from django.views.decorators.cache import cache_page
 from django.views.static import serve
 
 from astrophotography.views import AstroImageSecureView, ImageURLViewSet
@@ -25,6 +23,7 @@ from core.sitemaps import (
     ShopSitemap,
     StaticViewSitemap,
     TravelHighlightsSitemap,
+    cached_sitemap_view,
 )
 from core.views import health_check_view, root_view
 from shop.views import ShopAstroImageLookupView
@@ -75,11 +74,10 @@ urlpatterns = [
     path("", include("translation.urls")),
     path("admin/", admin.site.urls),
     # Sitemap at root so Google finds it at /sitemap.xml.
-    # Cache for 12 hours to keep generation cheap while refreshing
-    # reasonably often as content changes.
+    # Cached per content generation, see cached_sitemap_view().
     path(
         "sitemap.xml",
-        cache_page(43200)(sitemap),
+        cached_sitemap_view,
         {"sitemaps": _sitemaps},
         name="sitemap",
     ),
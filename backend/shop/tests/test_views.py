@@ -179,12 +179,12 @@ class TestShopProductListView:
         assert large_response.status_code == status.HTTP_200_OK
         small_item = next(
             payload
-            for payload in small_response.data["products"]
+            for payload in small_response.json()["products"]
             if str(payload["id"]) == str(product.pk)
         )
         large_item = next(
             payload
-            for payload in large_response.data["products"]
+            for payload in large_response.json()["products"]
             if str(payload["id"]) == str(product.pk)
         )
         assert large_variant.file.url in large_item["thumbnail_url"]
@@ -405,9 +405,9 @@ class TestShopProductDetailView:
 
         assert small_response.status_code == status.HTTP_200_OK
         assert large_response.status_code == status.HTTP_200_OK
-        assert large_variant.file.url in small_response.data["thumbnail_url"]
-        assert large_variant.file.url in large_response.data["thumbnail_url"]
-        assert small_response.data["thumbnail_url"] == large_response.data["thumbnail_url"]
+        assert large_variant.file.url in small_response.json()["thumbnail_url"]
+        assert large_variant.file.url in large_response.json()["thumbnail_url"]
+        assert small_response.json()["thumbnail_url"] == large_response.json()["thumbnail_url"]
 
     def test_detail_falls_back_to_image_cropped_when_variant_missing(
         self, api_client: APIClient
@@ -12,7 +12,9 @@ from django.urls import reverse
 from django.utils.decorators import method_decorator
 
 from astrophotography.models import AstroImage
+from common.cache_params import LANGUAGE_ONLY
 from common.decorators.cache import cache_response
+from common.types import CacheNamespace
 from common.utils.signing import generate_signed_url_params
 from core.models import LandingPageSettings
 
@@ -29,10 +31,11 @@ class ShopProductViewSet(viewsets.ReadOnlyModelViewSet):
 
     authentication_classes: list[type] = []
     permission_classes = [AllowAny]
+    # django-stubs cannot follow the nullable ``image`` FK into the generic ``variants``
     queryset = (
-        ShopProduct.objects.filter(is_active=True)
+        ShopProduct.objects.filter(is_active=True)  # type: ignore[misc]
         .select_related("image")
-        .prefetch_related("translations")
+        .prefetch_related("translations", "variants", "image__variants")
         .order_by("-created_at")
     )
     serializer_class = ShopProductSerializer
@@ -50,6 +53,9 @@ class ShopProductViewSet(viewsets.ReadOnlyModelViewSet):
         cache_response(
             timeout=settings.INFINITE_CACHE_TIMEOUT,
             key_prefix="api_cache_shop",
+            namespace=CacheNamespace.SHOP,
+            query_params=LANGUAGE_ONLY,
+            version_etag=True,
         )
     )
     def list(self, request: Request, *args, **kwargs) -> Response:
@@ -78,6 +84,9 @@ class ShopProductViewSet(viewsets.ReadOnlyModelViewSet):
         cache_response(
             timeout=settings.INFINITE_CACHE_TIMEOUT,
             key_prefix="api_cache_shop",
+            namespace=CacheNamespace.SHOP,
+            query_params=LANGUAGE_ONLY,
+            version_etag=True,
         )
     )
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
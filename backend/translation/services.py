@@ -173,13 +173,27 @@ class TranslationService:
 
     TRANSLATION_FAILED_PREFIX: str = "[TRANSLATION FAILED]"
 
+    @staticmethod
+    def _translation_exists(instance: TranslatableModel, lang: str) -> bool:
+        """
+        Return whether a translation row exists for ``lang``.
+
+        Uses the rows loaded by ``prefetch_related("translations")`` when the
+        queryset set them up, so list serializers do not query per field; only
+        instances loaded without the prefetch fall back to a query.
+        """
+        prefetched = getattr(instance, "_prefetched_objects_cache", {}).get("translations")
+        if prefetched is not None:
+            return any(translation.language_code == lang for translation in prefetched)
+        return bool(instance.translations.filter(language_code=lang).exists())
+
     @classmethod
     def _read_translation(cls, instance: TranslatableModel, field_name: str, lang: str) -> str:
         """Helper to read and sanitize a translation for a specific language."""
         if not getattr(instance, "translations", None):
             return ""
 
-        if not instance.translations.filter(language_code=lang).exists():
+        if not cls._translation_exists(instance, lang):
             return ""
 
         value = str(
@@ -241,7 +255,7 @@ class TranslationService:
             logger.info(f"Force translation enabled for '{field_name}' in '{language_code}'.")
             return False, None
 
-        has_record = instance.translations.filter(language_code=language_code).exists()
+        has_record = cls._translation_exists(instance, language_code)
         current_val = instance.safe_translation_getter(
             field_name, language_code=language_code, any_language=False
         )
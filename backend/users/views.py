@@ -12,8 +12,10 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.utils.decorators import method_decorator
 
+from common.cache_params import LANGUAGE_ONLY
 from common.decorators.cache import cache_response
 from common.throttling import APIRateThrottle
+from common.types import CacheNamespace
 
 from .serializers import UserSerializer
 
@@ -29,7 +31,14 @@ class UserViewSet(viewsets.ViewSet):
     throttle_classes = [APIRateThrottle, UserRateThrottle]
     http_method_names = ["get", "head", "options"]
 
-    @method_decorator(cache_response(timeout=settings.INFINITE_CACHE_TIMEOUT))
+    @method_decorator(
+        cache_response(
+            timeout=settings.INFINITE_CACHE_TIMEOUT,
+            namespace=CacheNamespace.PROFILE,
+            query_params=LANGUAGE_ONLY,
+            version_etag=True,
+        )
+    )
     @action(detail=False, methods=["get"])
     def profile(self, request: Request) -> Response:
         """Get the user profile (singleton pattern: only one user exists)"""
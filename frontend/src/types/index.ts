@@ -221,6 +221,7 @@ export interface EnabledFeatures {
   travelHighlights?: boolean;
   meteors?: MeteorConfig | null;
   total_time_spent?: number;
+  total_time_spent_by_category?: Record<string, number>;
 }
 
 export interface ApiRoutes {